@@ -42,11 +42,14 @@ from .src import async_loop, autothumb, download, upload
 from .src.application.application import Application
 from .src.authentication.authentication import Authentication
 from .src.edit_asset import operators as edit_ops
+from .src.evaluated import object_cache
 from .src.logs import logger, send_logs
 from .src.panels import panel_builder
 from .src.search import operator as search_op
 from .src.ui import render as ui_render
 from .src.ui.operators import render_image
+from .src.validators import validation_cache
+from .src.worker_pool import worker_pool
 
 bl_info = {
     'name': 'Hana3D',
@@ -236,6 +239,32 @@ class Hana3DAddonPreferences(AddonPreferences):
         default=False,
     )
 
+    thumbnail_preview: BoolProperty(
+        name="Fast Thumbnail Preview",
+        description="Show a quick low-sample render while the full-quality thumbnail renders",
+        default=True,
+    )
+
+    background_validation: BoolProperty(
+        name="Validate in Background",
+        description=(
+            "Run upload validators in a background Blender instance, "
+            "so large scenes do not freeze the interface"
+        ),
+        default=False,
+    )
+
+    blender_workers: IntProperty(
+        name="Background Blender Workers",
+        description=(
+            "Number of background Blender instances kept open to create upload files "
+            "and thumbnails. 0 starts a new instance for each job"
+        ),
+        default=1,
+        min=0,
+        max=8,
+    )
+
     max_assetbar_rows: IntProperty(
         name="Max Assetbar Rows",
         description="max rows of assetbar in the 3D view",
@@ -309,6 +338,9 @@ class Hana3DAddonPreferences(AddonPreferences):
         # layout.prop(self, "temp_dir")
         layout.prop(self, "directory_behaviour")
         layout.prop(self, "thumbnail_use_gpu")
+        layout.prop(self, "thumbnail_preview")
+        layout.prop(self, "background_validation")
+        layout.prop(self, "blender_workers")
         layout.prop(self, "thumb_size")
         layout.prop(self, "max_assetbar_rows")
         layout.prop(self, "search_in_header")
@@ -339,6 +371,9 @@ modules = (
     panel_builder,
     upload,
     edit_ops,
+    object_cache,
+    validation_cache,
+    worker_pool,
 )
 
 
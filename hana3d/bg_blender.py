@@ -208,8 +208,11 @@ class KillBgProcess(bpy.types.Operator):
         props = upload.get_upload_props()
         if self.process_type == 'UPLOAD':
             props.uploading = False
+            upload.cancel_upload_task(props)
         if self.process_type == 'THUMBNAILER':
             props.is_generating_thumbnail = False
+            from .src import autothumb  # noqa: WPS433
+            autothumb.cancel_thumbnail(props)
         global hana3d_bg_process
         # then go kill the process. this wasn't working for unsetting props
         # and that was the reason for changing to the method above.
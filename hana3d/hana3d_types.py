@@ -432,7 +432,7 @@ thumbnail_preview = bpy.utils.previews.new()
 
 class Hana3DCommonUploadProps:
     def get_active_image(self, context):
-        preview_collection = render.render_previews['active_images']
+        preview_collection = render.active_image_previews
         if not hasattr(preview_collection, 'previews'):
             preview_collection.previews = []
 
@@ -691,6 +691,12 @@ class Hana3DCommonUploadProps:
         description='Whether conversions should be skipped',
     )
 
+    external_textures: BoolProperty(
+        name='External textures',
+        default=False,
+        description='Upload textures as shared files instead of packing them in the asset',
+    )
+
 
 class Hana3DMaterialSearchProps(PropertyGroup, Hana3DCommonSearchProps):
     automap: BoolProperty(
@@ -115,6 +115,18 @@ def get_temp_dir(subdir=None):
     return tempdir
 
 
+def get_texture_cache_dir():
+    '''get directory of the textures shared between downloaded assets'''
+    user_preferences = bpy.context.preferences.addons[HANA3D_NAME].preferences
+    ddir = user_preferences.global_dir
+    if ddir.startswith('//'):
+        ddir = bpy.path.abspath(ddir)
+    texture_dir = os.path.join(ddir, 'textures')
+    if not os.path.exists(texture_dir):
+        os.makedirs(texture_dir)
+    return texture_dir
+
+
 def get_download_dirs(asset_type):
     ''' get directories where assets will be downloaded'''
     subdmapping = {'model': 'models', 'scene': 'scenes', 'material': 'materials'}
@@ -22,10 +22,10 @@ import tempfile
 import threading
 import time
 import uuid
-from collections import defaultdict
+from collections import OrderedDict
 from copy import copy
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import bpy
 import bpy.utils.previews
@@ -34,11 +34,16 @@ from bpy.props import BoolProperty, CollectionProperty, StringProperty
 from bpy.types import Operator
 from bpy_extras.image_utils import load_image
 
-from . import autothumb, paths, render_tools, rerequests, thread_tools
+from . import autothumb, paths, render_tools, rerequests, thread_tools, utils
 from .config import HANA3D_DESCRIPTION, HANA3D_NAME, HANA3D_RENDER
 from .report_tools import execute_wrapper
-# from .src.async_loop import run_async_function    # noqa: E800
-# from .src.preferences.profile import Profile  # noqa: E800
+from .src.autothumb import (
+    get_material_thumbnail_data,
+    get_model_thumbnail_data,
+    get_thumbnail_fingerprint,
+)
+from .src.autothumb.cache import cache_thumbnail, get_cached_thumbnail
+from .src.render_poller.render_poller import RenderJob, RenderJobPoller
 from .src.ui import colors
 from .src.ui.main import UI
 from .src.upload import upload
@@ -46,6 +51,8 @@ from .src.upload import upload
 render_threads = []
 upload_threads = []
 
+STATE_CLEAR_DELAY = 5
+
 
 def threads_cleanup():
     """Cleanup finished threads.
@@ -57,7 +64,7 @@ def threads_cleanup():
         return 10
 
     for thread in copy(render_threads):
-        if thread.is_alive():
+        if thread.is_alive() or thread.job_running:
             continue
         if not thread.finished:
             # Implement retry logic here
@@ -206,6 +213,14 @@ class RenderThread(UploadFileMixin, threading.Thread):
 
         self.tempdir = tempfile.mkdtemp()
         self.filepath = os.path.join(self.tempdir, 'export_render.blend')
+        self.job_id = ''
+
+        self.fingerprint = None
+        self.cached_thumbnail = None
+        if is_thumbnail:
+            self.fingerprint = self._get_thumbnail_fingerprint(props)
+            if self.fingerprint is not None:
+                self.cached_thumbnail = get_cached_thumbnail(self.fingerprint)
 
         self.job_progress = 0.0
         self.job_running = False
@@ -216,40 +231,109 @@ class RenderThread(UploadFileMixin, threading.Thread):
         try:
             if self.is_thumbnail:
                 self._wait_for_upload_complete()
+            if self.cached_thumbnail is not None:
+                self._upload_cached_thumbnail()
+                self._finish()
+                return
             self._save_render_scene()
             render_scene_id, upload_url = self._create_render_view()
 
             if self.cancelled:
+                self._finish()
                 return
             self.upload_file(upload_url)
             self._confirm_file_upload(render_scene_id)
 
             if self.cancelled:
+                self._finish()
                 return
-            job_id = self._create_job(render_scene_id)
-            nrf_output = self._pool_job(job_id)
-            if not nrf_output:
-                raise Exception('notrenderfarm returned no output')
-            if self.is_thumbnail:
-                thumbnail_url = nrf_output[0]
-                self._import_thumbnail(thumbnail_url)
-            else:
-                self._import_renders(job_id)
+            self.job_id = self._create_job(render_scene_id)
         except Exception as e:
-            self.log(f'Error in render job {self.render_job_name}:{e!r}')
+            self._finish(e)
             raise e
+
+        # Job status is polled from the asyncio loop, the thread ends here
+        self.job_running = True
+        thread_tools.call_in_foreground(self._track_job)
+
+    def _track_job(self):
+        RenderJobPoller().track(RenderJob(
+            job_id=self.job_id,
+            name=self.render_job_name,
+            on_progress=self._update_job_progress,
+            on_output=self._import_output,
+            on_done=self._finish,
+            is_cancelled=lambda: self.cancelled,
+        ))
+
+    def _update_job_progress(self, progress: float):
+        self.job_progress = progress
+        msg = f'Rendering {self.render_job_name}: {progress:.1%}'
+        self.update_state('render_state', msg)
+
+    def _import_output(self, job: dict) -> bool:
+        self.log(f'Finishing render job {self.render_job_name}')
+        if not self.is_thumbnail:
+            return self._import_renders(self.job_id)
+        thumbnail_path = self._import_thumbnail(job['output'][0])
+        if self.fingerprint is not None:
+            cache_thumbnail(self.fingerprint, thumbnail_path)
+        return True
+
+    def _finish(self, error: Optional[Exception] = None):
+        self.job_running = False
+        if error is not None:
+            self.log(f'Error in render job {self.render_job_name}:{error!r}')
         else:
             self.finished = True
             if not self.cancelled:
                 thread_tools.update_renders_in_foreground(self.asset_type, self.view_id)
                 self.log('Job finished successfully')
-        finally:
-            self._set_running_flag(False)
-            time.sleep(5)
-            self.update_state(self.log_state_name, '')
-            # TODO: use asyncio (can't run asyncio inside thread)
-            # profile = Profile()   # noqa: E800
-            # run_async_function(profile.update_async)  # noqa: E800
+        self._set_running_flag(False)
+        thread_tools.call_in_foreground(self._schedule_clear_state)
+
+    def _schedule_clear_state(self):
+        bpy.app.timers.register(self._clear_state, first_interval=STATE_CLEAR_DELAY)
+
+    def _clear_state(self):
+        self.update_state(self.log_state_name, '')
+
+    def _get_thumbnail_fingerprint(self, props) -> Optional[str]:
+        asset_type = self.asset_type.lower()
+        if asset_type == 'model':
+            obnames = [ob.name for ob in utils.get_hierarchy(props.id_data)]
+            thumbnail_data = get_model_thumbnail_data(props, obnames)
+        elif asset_type == 'material':
+            thumbnail_data = get_material_thumbnail_data(props, props.id_data.name)
+        else:
+            return None
+        return get_thumbnail_fingerprint(asset_type, props.id_data, thumbnail_data)
+
+    def _upload_cached_thumbnail(self):
+        self.log(f'Thumbnail of {self.asset_name} loaded from cache')
+        filename = os.path.basename(self.cached_thumbnail)
+        download_dir = paths.get_download_dirs(self.asset_type)[0]
+        file_path = os.path.join(download_dir, filename)
+        shutil.copyfile(self.cached_thumbnail, file_path)
+        self.update_state('thumbnail', file_path)
+
+        url = paths.get_api_url('uploads')
+        data = {
+            'assetId': self.asset_id,
+            'libraries': [],
+            'fileType': 'thumbnail',
+            'fileIndex': 0,
+            'originalFilename': filename,
+            'comment': None,
+        }
+        response = rerequests.post(url, json=data, headers=self.headers)
+        assert response.ok, f'Error when creating thumbnail upload on url={url}'
+        dict_response = response.json()
+
+        self.filepath = file_path
+        self.file_size = os.path.getsize(file_path)
+        self.upload_file(dict_response['s3UploadUrl'], log_arg='cached thumbnail')
+        self._confirm_file_upload(dict_response['id'])
 
     def _set_running_flag(self, flag: bool):
         if self.is_thumbnail:
@@ -342,34 +426,6 @@ class RenderThread(UploadFileMixin, threading.Thread):
         job = response.json()
         return job['id']
 
-    def _pool_job(self, job_id: str, pool_time: int = 5) -> List[str]:
-        self.job_running = True
-        while self.job_running:
-            url = paths.get_api_url('render_jobs', job_id)
-            response = rerequests.get(url, headers=self.headers)
-            job = response.json()
-
-            if job['status'] == 'FINISHED':
-                self.log(f'Finishing render job {self.render_job_name}')
-                self.job_running = False
-            elif job['status'] == 'CANCELLED' or self.cancelled:
-                # TODO: trigger notrenderfarm job cancellation
-                self.log(f'Render job {self.render_job_name} cancelled')
-                self.job_running = False
-            elif job['status'] == 'ERRORED':
-                self.log(f'Error in render job {self.render_job_name}')
-                self.job_running = False
-                raise Exception(f'Error in render job: {job}')
-            elif job['status'] == 'IN_PROGRESS':
-                self.job_progress = job['progress']
-                msg = f'Rendering {self.render_job_name}: {job["progress"]:.1%}'
-                self.update_state('render_state', msg)
-
-                time.sleep(pool_time)
-            else:
-                raise Exception(f'Undexpected notrenderfarm job status: {job["status"]}')
-        return job.get('output', [])
-
     def _post_completed_job(self, render_scene_id: str, nrf_output: List[str]) -> List[dict]:
         url = paths.get_api_url('uploads')
         jobs_data = []
@@ -410,15 +466,14 @@ class RenderThread(UploadFileMixin, threading.Thread):
             jobs_data.append(job)
         return jobs_data
 
-    def _import_renders(self, job_id: str):
-        while True:
-            jobs_data = render_tools.get_render_jobs(self.asset_type, self.view_id, job_id)
-            if len(jobs_data) > 0:
-                break
-            # Retry needed on cases when backend has not yet ingested results from render farm
-            time.sleep(5)
+    def _import_renders(self, job_id: str) -> bool:
+        jobs_data = render_tools.get_render_jobs(self.asset_type, self.view_id, job_id)
+        if len(jobs_data) == 0:
+            # Backend has not yet ingested results from render farm, the poller retries
+            return False
         operation = '=' if self.no_previous_jobs else '+='
         self.update_state("render_data['jobs']", jobs_data, operation)
+        return True
 
     def _put_new_thumbnail(self, render_scene_id: str, thumbnail_url: str) -> str:
         url = paths.get_api_url('assets', self.asset_id)
@@ -429,7 +484,7 @@ class RenderThread(UploadFileMixin, threading.Thread):
         response = rerequests.put(url, json=data, headers=self.headers)
         assert response.ok, response.text
 
-    def _import_thumbnail(self, thumbnail_url: str):
+    def _import_thumbnail(self, thumbnail_url: str) -> str:
         filename = paths.extract_filename_from_url(thumbnail_url)
         download_dir = paths.get_download_dirs(self.asset_type)[0]
         file_path = os.path.join(download_dir, filename)
@@ -439,6 +494,7 @@ class RenderThread(UploadFileMixin, threading.Thread):
             f.write(response.content)
 
         self.update_state('thumbnail', file_path)
+        return file_path
 
 
 class RenderScene(Operator):
@@ -745,18 +801,60 @@ classes = (
     UploadImage,
 )
 
-# Dictionary to store asset previews. Keys are the view_id's
-render_previews = defaultdict(bpy.utils.previews.new)
+MAX_PREVIEW_COLLECTIONS = 8
+
+
+class PreviewCollections:
+    """Preview collections by view_id, keeping only the most recently used ones.
+
+    Collections of assets that are not shown anymore are removed, freeing the
+    preview images they loaded.
+    """
+
+    def __init__(self, max_collections: int = MAX_PREVIEW_COLLECTIONS):
+        self.max_collections = max_collections
+        self._collections = OrderedDict()
+
+    def __getitem__(self, view_id: str):
+        if view_id in self._collections:
+            self._collections.move_to_end(view_id)
+            return self._collections[view_id]
+        self._collections[view_id] = bpy.utils.previews.new()
+        while len(self._collections) > self.max_collections:
+            _, evicted = self._collections.popitem(last=False)
+            bpy.utils.previews.remove(evicted)
+        return self._collections[view_id]
+
+    def __contains__(self, view_id: str) -> bool:
+        return view_id in self._collections
+
+    def values(self):
+        return self._collections.values()
+
+    def clear(self):
+        self._collections.clear()
+
+
+# Asset previews. Keys are the view_id's
+render_previews = PreviewCollections()
+
+# Previews of the images in the active image enum, kept out of render_previews
+# because the enum items keep using their icons
+active_image_previews = None
 
 
 def register():
+    global active_image_previews
     for cls in classes:
         bpy.utils.register_class(cls)
 
+    active_image_previews = bpy.utils.previews.new()
+
     bpy.app.timers.register(threads_cleanup)
 
 
 def unregister():
+    global active_image_previews
     bpy.app.timers.unregister(threads_cleanup)
 
     for cls in reversed(classes):
@@ -765,3 +863,5 @@ def unregister():
     for pcoll in render_previews.values():
         bpy.utils.previews.remove(pcoll)
     render_previews.clear()
+    bpy.utils.previews.remove(active_image_previews)
+    active_image_previews = None
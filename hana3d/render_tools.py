@@ -15,24 +15,149 @@
 #  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
 #
 # ##### END GPL LICENSE BLOCK #####
+import json
 import logging
 import os
 import threading
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional
 
+import bpy
 import requests
 
-from . import paths, render, rerequests
+from . import paths, render, rerequests, thread_tools
+
+MAX_DOWNLOAD_WORKERS = 4
+DOWNLOAD_CHUNK_SIZE = 2 ** 20
+CACHE_INDEX_FILENAME = 'render_cache.json'
+
+_download_executor = ThreadPoolExecutor(
+    max_workers=MAX_DOWNLOAD_WORKERS,
+    thread_name_prefix='render_download',
+)
+_downloads: Dict[str, Future] = {}
+_downloads_lock = threading.Lock()
+_cache_index = None
+
+
+class RenderCacheIndex:
+    """Downloaded render outputs by job id, so complete files are never fetched twice."""
+
+    def __init__(self, index_path: str = None):
+        """Create a RenderCacheIndex object.
+
+        Parameters:
+            index_path: JSON file where the index is kept, defaults to the renders temp dir
+        """
+        if index_path is None:
+            index_path = os.path.join(paths.get_temp_dir('renders'), CACHE_INDEX_FILENAME)
+        self.index_path = index_path
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def get(self, job: dict) -> Optional[str]:
+        """Get the local file of a render output.
+
+        Parameters:
+            job: render job with id and file_url
+
+        Returns:
+            Optional[str]: path of the complete file, None if it was not downloaded
+        """
+        with self._lock:
+            entry = self._entries.get(job['id'])
+        if entry is None or entry['file_url'] != job['file_url']:
+            return None
+        file_path = entry['file_path']
+        if not os.path.isfile(file_path) or os.path.getsize(file_path) != entry['size']:
+            return None
+        return file_path
+
+    def set(self, job: dict, file_path: str):  # noqa: WPS125
+        """Record a downloaded render output.
+
+        Parameters:
+            job: render job with id and file_url
+            file_path: path of the complete file
+        """
+        with self._lock:
+            self._entries[job['id']] = {
+                'file_url': job['file_url'],
+                'file_path': file_path,
+                'size': os.path.getsize(file_path),
+            }
+            tmp_path = f'{self.index_path}.tmp'
+            with open(tmp_path, 'w') as index_file:
+                json.dump(self._entries, index_file)
+            os.replace(tmp_path, self.index_path)
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r') as index_file:
+                return json.load(index_file)
+        except (OSError, ValueError) as e:
+            logging.warning(f'Ignoring corrupted render cache index {self.index_path}: {e}')
+            return {}
+
+
+def get_cache_index() -> RenderCacheIndex:
+    global _cache_index
+    # Called from download callbacks and render threads as well as the main thread
+    with _downloads_lock:
+        if _cache_index is None:
+            _cache_index = RenderCacheIndex()
+        return _cache_index
 
 
 def download_file(file_path: str, url: str) -> str:
     response = requests.get(url, stream=True)
+    response.raise_for_status()
 
     # Write to temp file and then rename to avoid reading errors as file is being downloaded
     tmp_file = file_path + '_tmp'
     with open(tmp_file, 'wb') as f:
-        f.write(response.content)
-    os.rename(tmp_file, file_path)
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+    os.replace(tmp_file, file_path)
+    return file_path
+
+
+def download_render(job: dict):
+    """Download a render output in the bounded download pool.
+
+    The render list is redrawn when the file lands, which loads its preview.
+
+    Parameters:
+        job: render job with id, file_url and file_path
+    """
+    file_path = job['file_path']
+    with _downloads_lock:
+        if file_path in _downloads:
+            return
+        future = _download_executor.submit(download_file, file_path, job['file_url'])
+        _downloads[file_path] = future
+
+    def on_download_done(done_future: Future):
+        with _downloads_lock:
+            _downloads.pop(file_path, None)
+        error = done_future.exception()
+        if error is not None:
+            logging.error(f'Failed to download render {job["file_url"]} ({error!r})')
+            return
+        get_cache_index().set(job, file_path)
+        thread_tools.call_in_foreground(_redraw_render_list)
+
+    future.add_done_callback(on_download_done)
+
+
+def _redraw_render_list():
+    # Previews are loaded when the rows are drawn, so a redraw shows the new file
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
 
 
 def get_render_jobs(asset_type: str, view_id: str, job_id: str = None) -> List[dict]:
@@ -46,21 +171,20 @@ def get_render_jobs(asset_type: str, view_id: str, job_id: str = None) -> List[d
 
     jobs = response.json()
     download_dir = paths.get_download_dirs(asset_type)[0]
+    cache_index = get_cache_index()
 
     for job in jobs:
-        url = job['file_url']
+        cached_path = cache_index.get(job)
+        if cached_path is not None:
+            job['file_path'] = cached_path
+            continue
 
-        filename = paths.extract_filename_from_url(url)
-        file_path = os.path.join(download_dir, filename)
-        job['file_path'] = file_path
-
-        if not os.path.exists(file_path):
-            thread = threading.Thread(
-                target=download_file,
-                args=(job['file_path'], job['file_url']),
-                daemon=True,
-            )
-            thread.start()
+        filename = paths.extract_filename_from_url(job['file_url'])
+        job['file_path'] = os.path.join(download_dir, filename)
+        if os.path.exists(job['file_path']):
+            cache_index.set(job, job['file_path'])
+        else:
+            download_render(job)
 
     return jobs
 
@@ -79,9 +203,6 @@ def update_render_list(
     """
     if not hasattr(props, 'view_id'):  # noqa WPS421
         return
-    preview_collection = render.render_previews[props.view_id]
-    if not hasattr(preview_collection, 'previews'):  # noqa WPS421
-        preview_collection.previews = []
 
     if set_jobs:
         jobs = props.render_data.get('jobs', None)
@@ -90,35 +211,72 @@ def update_render_list(
         props.render_data['jobs'] = jobs
 
     if jobs is not None:
-        update_props_render_list(props, jobs, preview_collection)
+        update_props_render_list(props, jobs)
 
         logging.debug(f'Updated renders for {props.name}')
 
 
-def update_props_render_list(props, jobs, preview_collection):  # noqa WPS210
-    """Update render list on props.
+def update_props_render_list(props, jobs):  # noqa WPS210
+    """Update render list on props, only adding, moving or removing the rows that changed.
+
+    Previews are not loaded here, see get_render_icon.
 
     Parameters:
         props: Upload props
         jobs: not None
-        preview_collection: List[Tuple] not None
     """
-    props.render_list.clear()
-    available_previews = []
     sorted_jobs = sorted(jobs, key=lambda jb: jb['created'])
+    job_ids = {job['id'] for job in sorted_jobs}
+    render_list = props.render_list
+    for index in reversed(range(len(render_list))):
+        if render_list[index].job_id not in job_ids:
+            render_list.remove(index)
+
     for index, job in enumerate(sorted_jobs):
-        job_id = job['id']
-        if job_id not in preview_collection:
-            preview_img = preview_collection.load(job_id, job['file_path'], 'IMAGE')
-        else:
-            preview_img = preview_collection[job_id]
-
-        new_render = props.render_list.add()
-        new_render['name'] = job['job_name'] or ''
-        new_render['index'] = index
-        new_render['job_id'] = job_id
-        new_render['icon_id'] = preview_img.icon_id
-        new_render['file_path'] = job['file_path']
-        enum_item = (job_id, job['job_name'] or '', '', preview_img.icon_id, index)
-        available_previews.append(enum_item)
-    preview_collection.previews = available_previews
+        position = _find_render(render_list, job['id'], index)
+        if position is None:
+            render_list.add()
+            position = len(render_list) - 1
+        if position != index:
+            render_list.move(position, index)
+        _set_if_changed(render_list[index], 'job_id', job['id'])
+        _set_if_changed(render_list[index], 'name', job['job_name'] or '')
+        _set_if_changed(render_list[index], 'index', index)
+        _set_if_changed(render_list[index], 'file_path', job['file_path'])
+
+    if props.render_list_index >= len(render_list):
+        props.render_list_index = max(len(render_list) - 1, 0)
+
+
+def _find_render(render_list, job_id: str, start: int) -> Optional[int]:
+    for position in range(start, len(render_list)):
+        if render_list[position].job_id == job_id:
+            return position
+    return None
+
+
+def _set_if_changed(item, name: str, value):
+    if item.get(name) != value:
+        item[name] = value
+
+
+def get_render_icon(view_id: str, job_id: str, file_path: str) -> int:
+    """Get the preview icon of a render, loading it on first use.
+
+    Called when drawing the visible rows of the render list, so only the renders
+    that are shown are loaded.
+
+    Parameters:
+        view_id: view_id of the asset
+        job_id: id of the render job
+        file_path: path of the render output
+
+    Returns:
+        int: icon_id, 0 while the render is not downloaded
+    """
+    preview_collection = render.render_previews[view_id]
+    if job_id in preview_collection:
+        return preview_collection[job_id].icon_id
+    if not os.path.exists(file_path):
+        return 0
+    return preview_collection.load(job_id, file_path, 'IMAGE').icon_id
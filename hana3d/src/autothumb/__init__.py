@@ -1,27 +1,188 @@
 """Automatic thumbnailer."""
+import asyncio
+import functools
 import json
 import logging
 import os
 import pathlib
+import shutil
 import tempfile
-from typing import Callable, Union
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, Union
 
 import bpy
+from bpy.props import EnumProperty
 
+from .batch import get_batch_job, render_thumbnails_batch
+from .cache import cache_thumbnail, get_cached_thumbnail, get_fingerprint
+from .preview import PREVIEW_READY, get_preview_path
+from .render_queue import RenderQueue
 from ..asset.asset_type import AssetType
 from ..async_loop import run_async_function
-from ..subprocess_async.subprocess_async import Subprocess  # noqa: S404
 from ..ui import colors
 from ..ui.main import UI
-from ... import hana3d_types, paths, utils
+from ..worker_pool.worker_pool import run_blender_script
+from ... import paths, utils
 from ...config import HANA3D_DESCRIPTION, HANA3D_NAME
 from ...report_tools import execute_wrapper
 
+if TYPE_CHECKING:
+    from ...hana3d_types import UploadProps  # noqa: WPS433
+
 HANA3D_EXPORT_DATA_FILE = f'{HANA3D_NAME}_data.json'
+SCRIPT_PATH = os.path.dirname(os.path.realpath(__file__))
+THUMBNAIL_TIMEOUT = 30 * 60
+
+thumbnail_tasks: Dict[int, asyncio.Future] = {}
+
+
+def _save_source_file(tempdir: str) -> str:
+    ext = os.path.splitext(bpy.data.filepath)[1] or '.blend'
+    filepath = os.path.join(tempdir, f'thumbnailer_{HANA3D_NAME}{ext}')
+
+    if bpy.data.use_autopack is True:
+        bpy.ops.file.autopack_toggle()
+    utils.save_file(filepath, compress=False, copy=True)
+    return filepath
+
+
+def get_thumbnail_path(asset_name: str) -> Tuple[str, str]:
+    """Get a thumbnail path next to the current file that is not used yet.
+
+    Parameters:
+        asset_name: name of the asset
+
+    Returns:
+        thumb_path, rel_thumb_path: absolute and relative paths, without extension
+    """
+    file_dir = os.path.dirname(bpy.data.filepath)
+    thumb_path = os.path.join(file_dir, asset_name)
+    rel_thumb_path = os.path.join('//', asset_name)
+
+    counter = 0
+    while os.path.isfile(f'{thumb_path}.jpg'):
+        new_name = f'{asset_name}_{str(counter).zfill(4)}'
+        thumb_path = os.path.join(file_dir, new_name)
+        rel_thumb_path = os.path.join('//', new_name)
+        counter += 1
+    return thumb_path, rel_thumb_path
+
+
+def get_model_thumbnail_data(
+    props: 'UploadProps',
+    obnames: List[str],
+    save_only: bool = False,
+    blend_filepath: str = '',
+) -> dict:
+    """Get settings read by the model thumbnailer script.
+
+    Parameters:
+        props: Hana3D upload props of the model
+        obnames: names of the objects of the model
+        save_only: save the thumbnailer scene instead of rendering it
+        blend_filepath: where the thumbnailer scene is saved when save_only is set
+
+    Returns:
+        dict: thumbnail settings
+    """
+    return {
+        'type': 'model',
+        'models': str(obnames),
+        'thumbnail_angle': props.thumbnail_angle,
+        'thumbnail_snap_to': props.thumbnail_snap_to,
+        'thumbnail_background_lightness': props.thumbnail_background_lightness,
+        'thumbnail_resolution': props.thumbnail_resolution,
+        'thumbnail_samples': props.thumbnail_samples,
+        'thumbnail_denoising': props.thumbnail_denoising,
+        'save_only': save_only,
+        'blend_filepath': blend_filepath,
+    }
+
+
+def get_material_thumbnail_data(
+    props: 'UploadProps',
+    material_name: str,
+    save_only: bool = False,
+    blend_filepath: str = '',
+) -> dict:
+    """Get settings read by the material thumbnailer script.
+
+    Parameters:
+        props: Hana3D upload props of the material
+        material_name: name of the material
+        save_only: save the thumbnailer scene instead of rendering it
+        blend_filepath: where the thumbnailer scene is saved when save_only is set
+
+    Returns:
+        dict: thumbnail settings
+    """
+    return {
+        'type': 'material',
+        'material': material_name,
+        'thumbnail_type': props.thumbnail_generator_type,
+        'thumbnail_scale': props.thumbnail_scale,
+        'thumbnail_background': props.thumbnail_background,
+        'thumbnail_background_lightness': props.thumbnail_background_lightness,
+        'thumbnail_resolution': props.thumbnail_resolution,
+        'thumbnail_samples': props.thumbnail_samples,
+        'thumbnail_denoising': props.thumbnail_denoising,
+        'adaptive_subdivision': props.adaptive_subdivision,
+        'texture_size_meters': props.texture_size_meters,
+        'save_only': save_only,
+        'blend_filepath': blend_filepath,
+    }
+
+
+def get_thumbnail_fingerprint(
+    asset_type: AssetType,
+    asset: bpy.types.ID,
+    thumbnail_data: dict,
+) -> Optional[str]:
+    """Fingerprint the content and thumbnail settings of a model or material.
+
+    Parameters:
+        asset_type: 'model' or 'material'
+        asset: main object of the model, or the material
+        thumbnail_data: thumbnail settings, as read by the thumbnailer script
+
+    Returns:
+        Optional[str]: fingerprint, None for asset types that are not cached
+    """
+    thumbnailer_filepath = paths.get_thumbnailer_filepath(asset_type)
+    if asset_type == 'model':
+        return get_fingerprint(
+            objects=utils.get_hierarchy(asset),
+            settings=thumbnail_data,
+            thumbnailer_filepath=thumbnailer_filepath,
+        )
+    if asset_type == 'material':
+        return get_fingerprint(
+            materials=[asset],
+            settings=thumbnail_data,
+            thumbnailer_filepath=thumbnailer_filepath,
+        )
+    return None
+
+
+def _load_cached_thumbnail(
+    props: 'UploadProps',
+    fingerprint: Optional[str],
+    thumb_path: str,
+    rel_thumb_path: str,
+) -> bool:
+    if fingerprint is None:
+        return False
+    cached_thumbnail = get_cached_thumbnail(fingerprint)
+    if cached_thumbnail is None:
+        return False
+    ext = os.path.splitext(cached_thumbnail)[1]
+    shutil.copyfile(cached_thumbnail, f'{thumb_path}{ext}')
+    props.thumbnail = f'{rel_thumb_path}{ext}'
+    props.thumbnail_generating_state = 'thumbnail loaded from cache'
+    return True
 
 
 def _common_setup(  # noqa: WPS211,WPS210
-    props: hana3d_types.UploadProps,
+    props: 'UploadProps',
     asset_name: str,
     asset_type: AssetType,
     json_data: dict,
@@ -31,44 +192,81 @@ def _common_setup(  # noqa: WPS211,WPS210
     props.is_generating_thumbnail = True
     props.thumbnail_generating_state = 'starting blender instance'
 
-    binary_path = bpy.app.binary_path
-    script_path = os.path.dirname(os.path.realpath(__file__))
-    basename, ext = os.path.splitext(bpy.data.filepath)
-    if not basename:
-        basename = os.path.join(basename, 'temp')
-    if not ext:
-        ext = '.blend'
     tempdir = tempfile.mkdtemp()
-
-    filepath = os.path.join(tempdir, f'thumbnailer_{HANA3D_NAME}{ext}')
+    filepath = _save_source_file(tempdir)
     tfpath = paths.get_thumbnailer_filepath(asset_type)
     datafile = os.path.join(tempdir, HANA3D_EXPORT_DATA_FILE)
 
-    if bpy.data.use_autopack is True:
-        bpy.ops.file.autopack_toggle()
-    utils.save_file(filepath, compress=False, copy=True)
-
+    preferences = bpy.context.preferences.addons[HANA3D_NAME].preferences
+    json_data['preview'] = preferences.thumbnail_preview and not json_data['save_only']
     with open(datafile, 'w') as json_file:
         json.dump(json_data, json_file)
 
-    cmd = [
-        binary_path,
-        '--background',
-        '-noaudio',
-        tfpath,
-        '--python',
-        os.path.join(script_path, f'{asset_type}_bg.py'),
-        '--',
-        datafile,
-        filepath,
-        thumb_path,
-        tempdir,
-        HANA3D_NAME,
-    ]
-
-    subprocess = Subprocess()
     props.thumbnail_generating_state = 'rendering thumbnail'
-    run_async_function(subprocess.subprocess, done_callback=done_callback, cmd=cmd)
+    preview_path = f'{get_preview_path(str(thumb_path))}.jpg'
+
+    def update_state(progress: str):  # noqa: WPS430
+        if progress == PREVIEW_READY and os.path.isfile(preview_path):
+            props.thumbnail = bpy.path.relpath(preview_path)
+            progress = 'refining thumbnail'
+        props.thumbnail_generating_state = progress
+
+    render = functools.partial(
+        run_blender_script,
+        blend_file=tfpath,
+        script=os.path.join(SCRIPT_PATH, f'{asset_type}_bg.py'),
+        args=[datafile, filepath, str(thumb_path), tempdir, HANA3D_NAME],
+        timeout=THUMBNAIL_TIMEOUT,
+        progress_callback=update_state,
+    )
+    thumbnail_tasks[props.as_pointer()] = run_async_function(
+        RenderQueue().run,
+        done_callback=done_callback,
+        key=props.as_pointer(),
+        render=render,
+        state_callback=update_state,
+    )
+
+
+def _remove_preview(rel_thumb_path: str):
+    preview_path = bpy.path.abspath(f'{get_preview_path(rel_thumb_path)}.jpg')
+    if os.path.isfile(preview_path):
+        os.remove(preview_path)
+
+
+def cancel_thumbnail(props: 'UploadProps'):
+    """Kill the thumbnail render of an asset, if it is running.
+
+    Parameters:
+        props: Hana3D upload props of the asset
+    """
+    task = thumbnail_tasks.pop(props.as_pointer(), None)
+    if task is not None and not task.done():
+        task.cancel()
+
+
+def prioritize_thumbnail(props: 'UploadProps') -> bool:
+    """Move a queued thumbnail render to the front of the render queue.
+
+    Parameters:
+        props: Hana3D upload props of the asset
+
+    Returns:
+        bool: False if the render of the asset is not queued
+    """
+    return RenderQueue().prioritize(props.as_pointer())
+
+
+def is_thumbnail_queued(props: 'UploadProps') -> bool:
+    """Check if the thumbnail render of an asset is waiting in the render queue.
+
+    Parameters:
+        props: Hana3D upload props of the asset
+
+    Returns:
+        bool: True if the render is queued and not running yet
+    """
+    return RenderQueue().is_queued(props.as_pointer())
 
 
 class GenerateModelThumbnailOperator(bpy.types.Operator):
@@ -110,6 +308,7 @@ class GenerateModelThumbnailOperator(bpy.types.Operator):
         layout.prop(props, 'thumbnail_denoising')
         preferences = context.preferences.addons[HANA3D_NAME].preferences
         layout.prop(preferences, 'thumbnail_use_gpu')
+        layout.prop(preferences, 'thumbnail_preview')
 
     @execute_wrapper
     def execute(self, context):
@@ -153,9 +352,20 @@ class GenerateModelThumbnailOperator(bpy.types.Operator):
         return wm.invoke_props_dialog(self)
 
     def _done_callback(self, task):
-        self.props.thumbnail = f'{self.rel_thumb_path}.jpg'
-        self.props.thumbnail_generating_state = 'rendering done'
+        thumbnail_tasks.pop(self.props.as_pointer(), None)
         self.props.is_generating_thumbnail = False
+        _remove_preview(self.rel_thumb_path)
+        if task.cancelled():
+            self.props.thumbnail = self.previous_thumbnail
+            self.props.thumbnail_generating_state = 'rendering cancelled'
+        elif task.exception() is not None:
+            self.props.thumbnail = self.previous_thumbnail
+            self.props.thumbnail_generating_state = f'rendering failed: {task.exception()}'
+        else:
+            self.props.thumbnail = f'{self.rel_thumb_path}.jpg'
+            self.props.thumbnail_generating_state = 'rendering done'
+            if self.fingerprint is not None:
+                cache_thumbnail(self.fingerprint, bpy.path.abspath(self.props.thumbnail))
 
         if bpy.data.use_autopack is True:
             bpy.ops.file.autopack_toggle()
@@ -176,31 +386,31 @@ class GenerateModelThumbnailOperator(bpy.types.Operator):
         for ob in obs:
             obnames.append(ob.name)
 
-        json_data = {
-            'type': 'model',
-            'models': str(obnames),
-            'thumbnail_angle': self.props.thumbnail_angle,
-            'thumbnail_snap_to': self.props.thumbnail_snap_to,
-            'thumbnail_background_lightness': self.props.thumbnail_background_lightness,
-            'thumbnail_resolution': self.props.thumbnail_resolution,
-            'thumbnail_samples': self.props.thumbnail_samples,
-            'thumbnail_denoising': self.props.thumbnail_denoising,
-            'save_only': save_only,
-            'blend_filepath': blend_filepath,
-        }
-
-        file_dir = os.path.dirname(bpy.data.filepath)
-        thumb_path = os.path.join(file_dir, asset_name)
-        self.rel_thumb_path = os.path.join('//', asset_name)
-
-        counter = 0
-        while os.path.isfile(f'{thumb_path}.jpg'):
-            new_name = f'{asset_name}_{str(counter).zfill(4)}'
-            thumb_path = os.path.join(file_dir, new_name)
-            self.rel_thumb_path = os.path.join('//', new_name)
-            counter += 1
-
-        _common_setup(self.props, asset_name, 'model', json_data, thumb_path, self._done_callback)
+        json_data = get_model_thumbnail_data(self.props, obnames, save_only, blend_filepath)
+        thumb_path, self.rel_thumb_path = get_thumbnail_path(asset_name)
+
+        self.fingerprint = None
+        if not save_only:
+            self.fingerprint = get_thumbnail_fingerprint(AssetType.model, mainmodel, json_data)
+            cached = _load_cached_thumbnail(
+                self.props,
+                self.fingerprint,
+                thumb_path,
+                self.rel_thumb_path,
+            )
+            if cached:
+                return
+
+        # The preview replaces the thumbnail while rendering, it is restored if the render fails
+        self.previous_thumbnail = self.props.thumbnail
+        _common_setup(
+            self.props,
+            asset_name,
+            'model',
+            json_data,
+            thumb_path,
+            self._done_callback,
+        )
 
 
 class GenerateMaterialThumbnailOperator(bpy.types.Operator):
@@ -241,6 +451,7 @@ class GenerateMaterialThumbnailOperator(bpy.types.Operator):
         layout.prop(props, 'adaptive_subdivision')
         preferences = context.preferences.addons[HANA3D_NAME].preferences
         layout.prop(preferences, 'thumbnail_use_gpu')
+        layout.prop(preferences, 'thumbnail_preview')
 
     @execute_wrapper
     def execute(self, context):
@@ -284,9 +495,20 @@ class GenerateMaterialThumbnailOperator(bpy.types.Operator):
         return wm.invoke_props_dialog(self)
 
     def _done_callback(self, task):
-        self.props.thumbnail = f'{self.rel_thumb_path}.jpg'
-        self.props.thumbnail_generating_state = 'rendering done'
+        thumbnail_tasks.pop(self.props.as_pointer(), None)
         self.props.is_generating_thumbnail = False
+        _remove_preview(self.rel_thumb_path)
+        if task.cancelled():
+            self.props.thumbnail = self.previous_thumbnail
+            self.props.thumbnail_generating_state = 'rendering cancelled'
+        elif task.exception() is not None:
+            self.props.thumbnail = self.previous_thumbnail
+            self.props.thumbnail_generating_state = f'rendering failed: {task.exception()}'
+        else:
+            self.props.thumbnail = f'{self.rel_thumb_path}.jpg'
+            self.props.thumbnail_generating_state = 'rendering done'
+            if self.fingerprint is not None:
+                cache_thumbnail(self.fingerprint, bpy.path.abspath(self.props.thumbnail))
 
         if bpy.data.use_autopack is True:
             bpy.ops.file.autopack_toggle()
@@ -301,33 +523,28 @@ class GenerateMaterialThumbnailOperator(bpy.types.Operator):
         if asset_name is None:
             asset_name = material.name
 
-        json_data = {
-            'type': 'material',
-            'material': material.name,
-            'thumbnail_type': self.props.thumbnail_generator_type,
-            'thumbnail_scale': self.props.thumbnail_scale,
-            'thumbnail_background': self.props.thumbnail_background,
-            'thumbnail_background_lightness': self.props.thumbnail_background_lightness,
-            'thumbnail_resolution': self.props.thumbnail_resolution,
-            'thumbnail_samples': self.props.thumbnail_samples,
-            'thumbnail_denoising': self.props.thumbnail_denoising,
-            'adaptive_subdivision': self.props.adaptive_subdivision,
-            'texture_size_meters': self.props.texture_size_meters,
-            'save_only': save_only,
-            'blend_filepath': blend_filepath,
-        }
-
-        file_dir = os.path.dirname(bpy.data.filepath)
-        thumb_path = os.path.join(file_dir, asset_name)
-        self.rel_thumb_path = os.path.join('//', asset_name)
-
-        counter = 0
-        while os.path.isfile(f'{thumb_path}.jpg'):
-            new_name = f'{asset_name}_{str(counter).zfill(4)}'
-            thumb_path = os.path.join(file_dir, new_name)
-            self.rel_thumb_path = os.path.join('//', new_name)
-            counter += 1
-
+        json_data = get_material_thumbnail_data(
+            self.props,
+            material.name,
+            save_only,
+            blend_filepath,
+        )
+        thumb_path, self.rel_thumb_path = get_thumbnail_path(asset_name)
+
+        self.fingerprint = None
+        if not save_only:
+            self.fingerprint = get_thumbnail_fingerprint(AssetType.material, material, json_data)
+            cached = _load_cached_thumbnail(
+                self.props,
+                self.fingerprint,
+                thumb_path,
+                self.rel_thumb_path,
+            )
+            if cached:
+                return
+
+        # The preview replaces the thumbnail while rendering, it is restored if the render fails
+        self.previous_thumbnail = self.props.thumbnail
         _common_setup(
             self.props,
             asset_name,
@@ -477,10 +694,194 @@ class GenerateSceneThumbnailOperator(bpy.types.Operator):
         context.scene.render.resolution_y = resolution_y
 
 
+class GenerateBatchThumbnailsOperator(bpy.types.Operator):
+    """Generate Cycles thumbnails for all selected assets in one background session."""
+
+    bl_idname = f'object.{HANA3D_NAME}_batch_thumbnail'
+    bl_label = f'{HANA3D_DESCRIPTION} Batch Thumbnail Generator'
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    asset_type: EnumProperty(  # type: ignore
+        name='Type',
+        items=(
+            ('MODEL', 'Model', 'thumbnails of the selected models'),
+            ('MATERIAL', 'Material', 'thumbnails of the active materials of selected objects'),
+        ),
+        default='MODEL',
+    )
+
+    @classmethod
+    def poll(cls, context):
+        """Batch thumbnailer poll.
+
+        Parameters:
+            context: Blender context
+
+        Returns:
+            bool: if there are selected objects in a saved file
+        """
+        return bpy.data.filepath != '' and len(context.selected_objects) > 0
+
+    @execute_wrapper
+    def execute(self, context):
+        """Batch thumbnailer execute.
+
+        Parameters:
+            context: Blender context
+
+        Returns:
+            enum set in {‘RUNNING_MODAL’, ‘CANCELLED’, ‘FINISHED’, ‘PASS_THROUGH’, ‘INTERFACE’}
+        """
+        if self.asset_type == 'MODEL':
+            assets = self._get_models(context)
+        else:
+            assets = self._get_materials(context)
+        if not assets:
+            UI().add_report('No assets selected for thumbnail generation', color=colors.RED)
+            return {'CANCELLED'}
+
+        asset_type = self.asset_type.lower()
+        jobs = []
+        self.assets = []
+        for name, asset, thumbnail_data in assets:
+            props = getattr(asset, HANA3D_NAME)
+            thumb_path, rel_thumb_path = get_thumbnail_path(name)
+            fingerprint = get_thumbnail_fingerprint(asset_type, asset, thumbnail_data)
+            if _load_cached_thumbnail(props, fingerprint, thumb_path, rel_thumb_path):
+                continue
+            props.is_generating_thumbnail = True
+            props.thumbnail_generating_state = 'waiting for batch'
+            jobs.append(get_batch_job(name, '', thumb_path, thumbnail_data))
+            self.assets.append((props, rel_thumb_path, fingerprint))
+        if not jobs:
+            UI().add_report('All thumbnails loaded from cache')
+            return {'FINISHED'}
+
+        filepath = _save_source_file(tempfile.mkdtemp())
+        for job in jobs:
+            job['file_input'] = filepath
+
+        render = functools.partial(
+            render_thumbnails_batch,
+            asset_type=asset_type,
+            jobs=jobs,
+            progress_callback=UI().add_report,
+        )
+        task = run_async_function(
+            RenderQueue().run,
+            done_callback=self._done_callback,
+            key=self.assets[0][0].as_pointer(),
+            render=render,
+            state_callback=self._update_state,
+        )
+        for props, _, _ in self.assets:
+            thumbnail_tasks[props.as_pointer()] = task
+        return {'FINISHED'}
+
+    def _get_models(self, context) -> List[Tuple[str, bpy.types.ID, dict]]:
+        roots = []
+        for ob in context.selected_objects:
+            while ob.parent is not None:
+                ob = ob.parent
+            if ob not in roots:
+                roots.append(ob)
+
+        models = []
+        for root in roots:
+            obnames = [ob.name for ob in utils.get_hierarchy(root)]
+            thumbnail_data = get_model_thumbnail_data(getattr(root, HANA3D_NAME), obnames)
+            models.append((root.name, root, thumbnail_data))
+        return models
+
+    def _get_materials(self, context) -> List[Tuple[str, bpy.types.ID, dict]]:
+        materials = []
+        for ob in context.selected_objects:
+            material = ob.active_material
+            if material is not None and material not in materials:
+                materials.append(material)
+
+        return [
+            (
+                material.name,
+                material,
+                get_material_thumbnail_data(getattr(material, HANA3D_NAME), material.name),
+            )
+            for material in materials
+        ]
+
+    def _update_state(self, state: str):
+        for props, _, _ in self.assets:
+            props.thumbnail_generating_state = state
+
+    def _done_callback(self, task):
+        for props, _, _ in self.assets:
+            thumbnail_tasks.pop(props.as_pointer(), None)
+        if task.cancelled() or task.exception() is not None:
+            error = 'cancelled' if task.cancelled() else task.exception()
+            for props, _, _ in self.assets:
+                props.is_generating_thumbnail = False
+                props.thumbnail_generating_state = f'rendering failed: {error}'
+            return
+
+        report = task.result()
+        for (props, rel_thumb_path, fingerprint), job_result in zip(
+            self.assets,
+            report['results'],
+        ):
+            props.is_generating_thumbnail = False
+            if job_result['status'] == 'done':
+                props.thumbnail = f'{rel_thumb_path}.jpg'
+                props.thumbnail_generating_state = 'rendering done'
+                if fingerprint is not None:
+                    cache_thumbnail(fingerprint, f'{job_result["thumbnail_path"]}.jpg')
+            else:
+                props.thumbnail_generating_state = f'rendering failed: {job_result["error"]}'
+        UI().add_report(
+            f'Rendered {len(report["results"])} thumbnails in {report["total_time"]:.0f}s',
+        )
+
+
+class PrioritizeThumbnailOperator(bpy.types.Operator):
+    """Render the thumbnail of the active asset before other queued thumbnails."""
+
+    bl_idname = f'object.{HANA3D_NAME}_prioritize_thumbnail'
+    bl_label = f'{HANA3D_DESCRIPTION} Prioritize Thumbnail'
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    asset_type: EnumProperty(  # type: ignore
+        name='Type',
+        items=(
+            ('MODEL', 'Model', 'thumbnail of the active model'),
+            ('MATERIAL', 'Material', 'thumbnail of the active material'),
+        ),
+        default='MODEL',
+    )
+
+    @execute_wrapper
+    def execute(self, context):
+        """Prioritize thumbnail execute.
+
+        Parameters:
+            context: Blender context
+
+        Returns:
+            enum set in {‘RUNNING_MODAL’, ‘CANCELLED’, ‘FINISHED’, ‘PASS_THROUGH’, ‘INTERFACE’}
+        """
+        if self.asset_type == 'MODEL':
+            asset = utils.get_active_model(context)
+        else:
+            asset = utils.get_active_material(context)
+        if asset is None or not prioritize_thumbnail(getattr(asset, HANA3D_NAME)):
+            return {'CANCELLED'}
+        return {'FINISHED'}
+
+
 classes = (
     GenerateModelThumbnailOperator,
     GenerateMaterialThumbnailOperator,
     GenerateSceneThumbnailOperator,
+    GenerateBatchThumbnailsOperator,
+    PrioritizeThumbnailOperator,
 )
 
 
@@ -0,0 +1,69 @@
+"""Render thumbnails of many assets in a single background Blender session."""
+import json
+import os
+import tempfile
+from typing import Callable, List, Optional
+
+from ..asset.asset_type import AssetType
+from ..worker_pool.worker_pool import run_blender_script
+from ... import paths
+from ...config import HANA3D_NAME
+
+BATCH_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'batch_bg.py')
+BATCH_JOB_TIMEOUT = 10 * 60
+
+
+def get_batch_job(name: str, file_input: str, thumbnail_path: str, thumbnail_data: dict) -> dict:
+    """Create a batch job.
+
+    Parameters:
+        name: name of the asset, used in the report
+        file_input: blend file with the asset
+        thumbnail_path: output path, without extension
+        thumbnail_data: thumbnail settings, as read by the model or material thumbnailer
+
+    Returns:
+        dict: batch job
+    """
+    return {
+        'name': name,
+        'file_input': file_input,
+        'thumbnail_path': thumbnail_path,
+        'data': thumbnail_data,
+    }
+
+
+async def render_thumbnails_batch(
+    asset_type: AssetType,
+    jobs: List[dict],
+    progress_callback: Optional[Callable[[str], None]] = None,
+    threads: Optional[int] = None,
+) -> dict:
+    """Render the thumbnails of all jobs, opening the thumbnailer scene only once.
+
+    Parameters:
+        asset_type: 'model' or 'material'
+        jobs: jobs created by get_batch_job
+        progress_callback: called with the progress messages of the batch
+        threads: number of render threads, None to let Blender use all cores
+
+    Returns:
+        dict: report with asset_type, total_time and the status, error and render_time of each job
+    """
+    tempdir = tempfile.mkdtemp()
+    batch_path = os.path.join(tempdir, 'thumbnail_batch.json')
+    report_path = os.path.join(tempdir, 'thumbnail_batch_report.json')
+    with open(batch_path, 'w') as batch_file:
+        json.dump({'asset_type': asset_type, 'report_path': report_path, 'jobs': jobs}, batch_file)
+
+    await run_blender_script(
+        paths.get_thumbnailer_filepath(asset_type),
+        BATCH_SCRIPT,
+        [batch_path, HANA3D_NAME],
+        timeout=BATCH_JOB_TIMEOUT * max(len(jobs), 1),
+        progress_callback=progress_callback,
+        threads=threads,
+    )
+
+    with open(report_path, 'r') as report_file:
+        return json.load(report_file)
@@ -0,0 +1,102 @@
+"""Blender script to render the thumbnails of many assets in one session.
+
+The thumbnailer scene is opened once. Each asset is appended, rendered and removed
+before the next one, and a JSON report with the result of every job is written at the end.
+"""
+import json
+import logging
+import sys
+import time
+import traceback
+from importlib import import_module
+from typing import Dict, Set
+
+import bpy
+
+HANA3D_NAME = sys.argv[-1]
+HANA3D_BATCH_DATA = sys.argv[-2]
+
+module = import_module(HANA3D_NAME)
+bg_blender = module.bg_blender  # type: ignore
+
+
+def _get_ids() -> Set[bpy.types.ID]:
+    return set(bpy.data.user_map().keys())
+
+
+def _get_collections_visibility() -> Dict[str, tuple]:
+    return {
+        collection.name: (collection.hide_viewport, collection.hide_render, collection.hide_select)
+        for collection in bpy.context.scene.collection.children
+    }
+
+
+def _restore_collections_visibility(visibility: Dict[str, tuple]):
+    for collection in bpy.context.scene.collection.children:
+        if collection.name in visibility:
+            hide_viewport, hide_render, hide_select = visibility[collection.name]
+            collection.hide_viewport = hide_viewport
+            collection.hide_render = hide_render
+            collection.hide_select = hide_select
+
+
+def _render_job(thumbnailer, job: dict):
+    ids_before = _get_ids()
+    visibility = _get_collections_visibility()
+    try:
+        thumbnailer.setup_thumbnail_scene(job['data'], job['file_input'])
+        thumbnailer.render_thumbnail(job['thumbnail_path'])
+    finally:
+        bpy.data.batch_remove(_get_ids() - ids_before)
+        _restore_collections_visibility(visibility)
+
+
+def render_batch(batch: dict) -> dict:
+    """Render all jobs of a batch, continuing after failed jobs.
+
+    Parameters:
+        batch: asset_type and list of jobs with name, file_input, thumbnail_path and data
+
+    Returns:
+        dict: report with the result of each job
+    """
+    thumbnailer = import_module(f'{HANA3D_NAME}.src.autothumb.{batch["asset_type"]}_bg')
+    batch_start = time.time()
+    jobs = batch['jobs']
+    results = []
+    for index, job in enumerate(jobs):
+        bg_blender.progress(f'rendering {index + 1}/{len(jobs)}: {job["name"]}')
+        job_start = time.time()
+        job_result = {'name': job['name'], 'thumbnail_path': job['thumbnail_path']}
+        try:
+            _render_job(thumbnailer, job)
+        except Exception as error:
+            traceback.print_exc()
+            job_result.update(status='failed', error=str(error))
+        else:
+            job_result.update(status='done', error=None)
+        job_result['render_time'] = time.time() - job_start
+        results.append(job_result)
+
+    return {
+        'asset_type': batch['asset_type'],
+        'total_time': time.time() - batch_start,
+        'results': results,
+    }
+
+
+if __name__ == '__main__':
+    try:
+        with open(HANA3D_BATCH_DATA, 'r') as batch_file:
+            batch_data = json.load(batch_file)
+
+        report = render_batch(batch_data)
+
+        with open(batch_data['report_path'], 'w') as report_file:
+            json.dump(report, report_file, indent=4)
+
+    except Exception as error:
+        logging.error(error)
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,223 @@
+"""Cache of rendered thumbnails keyed by asset content and thumbnail settings."""
+import array
+import glob
+import hashlib
+import json
+import logging
+import os
+import shutil
+from typing import Iterable, Optional
+
+import bpy
+
+from ... import paths
+
+CACHE_SUBDIR = 'thumbnails'
+
+# Settings that only tell the script what to do, not how the thumbnail looks
+IGNORED_SETTINGS = frozenset((
+    'save_only',
+    'blend_filepath',
+    'models',
+    'material',
+    'type',
+    'preview',
+))
+SIMPLE_PROPERTY_TYPES = frozenset(('BOOLEAN', 'INT', 'FLOAT', 'STRING', 'ENUM'))
+IGNORED_PROPERTIES = frozenset((
+    'rna_type',
+    'name',
+    'name_full',
+    'session_uid',
+    'is_evaluated',
+    'is_library_indirect',
+    'is_runtime_data',
+    'tag',
+    'users',
+    'use_fake_user',
+    'select',
+    'mode',
+))
+
+
+class _Fingerprint(object):
+    """Incremental hash of the datablocks that show up in a thumbnail."""
+
+    def __init__(self):
+        self._hash = hashlib.sha256()
+        self._visited = set()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+    def update(self, *values):
+        for fingerprint_value in values:
+            self._hash.update(repr(fingerprint_value).encode())
+            self._hash.update(b';')
+
+    def add_struct(self, struct):
+        for prop in struct.bl_rna.properties:
+            identifier = prop.identifier
+            if identifier in IGNORED_PROPERTIES or prop.type not in SIMPLE_PROPERTY_TYPES:
+                continue
+            prop_value = getattr(struct, identifier, None)
+            if getattr(prop, 'is_array', False) or getattr(prop, 'array_length', 0) > 0:
+                prop_value = _to_tuple(prop_value)
+            self.update(identifier, prop_value)
+
+    def add_object(self, ob: bpy.types.Object):
+        self.update('object', ob.type, _to_tuple(ob.matrix_local))
+        self.add_struct(ob)
+        for modifier in ob.modifiers:
+            self.update('modifier', modifier.type)
+            self.add_struct(modifier)
+        for slot in ob.material_slots:
+            self.update('slot', slot.link)
+            if slot.material is not None:
+                self.add_material(slot.material)
+        if ob.data is None or not self._visit(ob.data):
+            return
+        self.add_struct(ob.data)
+        if ob.type == 'MESH':
+            self._add_mesh(ob.data)
+
+    def add_material(self, material: bpy.types.Material):
+        if not self._visit(material):
+            return
+        self.update('material')
+        self.add_struct(material)
+        if material.use_nodes and material.node_tree is not None:
+            self._add_node_tree(material.node_tree)
+
+    def _visit(self, datablock: bpy.types.ID) -> bool:
+        key = (type(datablock).__name__, datablock.name_full)
+        if key in self._visited:
+            self.update('visited', key)
+            return False
+        self._visited.add(key)
+        return True
+
+    def _add_mesh(self, mesh: bpy.types.Mesh):
+        for collection, attribute, typecode, size in (
+            (mesh.vertices, 'co', 'f', 3),
+            (mesh.loops, 'vertex_index', 'i', 1),
+            (mesh.polygons, 'loop_total', 'i', 1),
+            (mesh.polygons, 'material_index', 'i', 1),
+            (mesh.polygons, 'use_smooth', 'i', 1),
+        ):
+            self._add_foreach(collection, attribute, typecode, size)
+        for uv_layer in mesh.uv_layers:
+            self._add_foreach(uv_layer.data, 'uv', 'f', 2)
+
+    def _add_foreach(self, collection, attribute: str, typecode: str, size: int):
+        attribute_values = array.array(typecode, [0]) * (len(collection) * size)
+        collection.foreach_get(attribute, attribute_values)
+        self._hash.update(attribute_values.tobytes())
+
+    def _add_node_tree(self, node_tree: bpy.types.NodeTree):
+        for node in sorted(node_tree.nodes, key=lambda tree_node: tree_node.name):
+            self.update('node', node.bl_idname, node.name)
+            self.add_struct(node)
+            for socket in node.inputs:
+                if hasattr(socket, 'default_value'):  # noqa: WPS421
+                    self.update(socket.identifier, _to_tuple(socket.default_value))
+            image = getattr(node, 'image', None)
+            if image is not None:
+                self._add_image(image)
+            group = getattr(node, 'node_tree', None)
+            if group is not None and self._visit(group):
+                self._add_node_tree(group)
+        for link in node_tree.links:
+            self.update(
+                'link',
+                link.from_node.name,
+                link.from_socket.identifier,
+                link.to_node.name,
+                link.to_socket.identifier,
+            )
+
+    def _add_image(self, image: bpy.types.Image):
+        if not self._visit(image):
+            return
+        self.add_struct(image)
+        self.add_struct(image.colorspace_settings)
+        if image.packed_file is not None:
+            self.update('packed', image.packed_file.size)
+            return
+        filepath = bpy.path.abspath(image.filepath, library=image.library)
+        if os.path.exists(filepath):
+            stat = os.stat(filepath)
+            self.update('file', stat.st_size, stat.st_mtime)
+
+
+def _to_tuple(prop_value):
+    try:
+        return tuple(_to_tuple(item) for item in prop_value)
+    except TypeError:
+        return prop_value
+
+
+def get_fingerprint(
+    objects: Iterable[bpy.types.Object] = (),
+    materials: Iterable[bpy.types.Material] = (),
+    settings: Optional[dict] = None,
+    thumbnailer_filepath: Optional[str] = None,
+) -> str:
+    """Fingerprint everything that changes how a thumbnail looks.
+
+    Parameters:
+        objects: objects of a model asset
+        materials: material of a material asset
+        settings: thumbnail settings, as sent to the thumbnailer script
+        thumbnailer_filepath: blend file with the thumbnailer scene
+
+    Returns:
+        str: hex digest
+    """
+    fingerprint = _Fingerprint()
+    for ob in sorted(objects, key=lambda obj: obj.name):
+        fingerprint.add_object(ob)
+    for material in materials:
+        fingerprint.add_material(material)
+
+    settings = settings or {}
+    relevant_settings = {
+        setting: settings[setting]
+        for setting in settings
+        if setting not in IGNORED_SETTINGS
+    }
+    fingerprint.update(json.dumps(relevant_settings, sort_keys=True))
+    if thumbnailer_filepath is not None and os.path.exists(thumbnailer_filepath):
+        fingerprint.update(os.path.getmtime(thumbnailer_filepath))
+    return fingerprint.hexdigest()
+
+
+def get_cached_thumbnail(fingerprint: str) -> Optional[str]:
+    """Get path of a thumbnail rendered with the same fingerprint.
+
+    Parameters:
+        fingerprint: digest returned by get_fingerprint
+
+    Returns:
+        Optional[str]: path of the cached image, None if it was never rendered
+    """
+    cache_dir = paths.get_temp_dir(CACHE_SUBDIR)
+    cached = glob.glob(os.path.join(cache_dir, f'{fingerprint}.*'))
+    return cached[0] if cached else None
+
+
+def cache_thumbnail(fingerprint: str, thumbnail_path: str):
+    """Keep a copy of a rendered thumbnail.
+
+    Parameters:
+        fingerprint: digest returned by get_fingerprint
+        thumbnail_path: path of the rendered image
+    """
+    if not os.path.isfile(thumbnail_path):
+        return
+    ext = os.path.splitext(thumbnail_path)[1]
+    cache_path = os.path.join(paths.get_temp_dir(CACHE_SUBDIR), f'{fingerprint}{ext}')
+    try:
+        shutil.copyfile(thumbnail_path, cache_path)
+    except OSError as error:
+        logging.warning(f'Could not cache thumbnail {thumbnail_path}: {error}')
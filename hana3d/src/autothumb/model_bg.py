@@ -12,20 +12,16 @@ import bpy
 import mathutils
 
 HANA3D_NAME = sys.argv[-1]
-HANA3D_EXPORT_TEMP_DIR = sys.argv[-2]
-HANA3D_THUMBNAIL_PATH = sys.argv[-3]
-HANA3D_EXPORT_FILE_INPUT = sys.argv[-4]
-HANA3D_EXPORT_DATA = sys.argv[-5]
 
 module = import_module(HANA3D_NAME)
 append_link = module.append_link  # type: ignore
 utils = module.utils  # type: ignore
+bg_blender = module.bg_blender  # type: ignore
+thumbnail_preview = import_module(f'{HANA3D_NAME}.src.autothumb.preview')
 
 
-def _get_obnames():
-    with open(HANA3D_EXPORT_DATA, 'r') as data_file:
-        model_data = json.load(data_file)
-    return ast.literal_eval(model_data['models'])
+def _get_obnames(data: dict):
+    return ast.literal_eval(data['models'])
 
 
 def _center_obs_for_thumbnail(obs):  # noqa: WPS210
@@ -62,85 +58,122 @@ def _center_obs_for_thumbnail(obs):  # noqa: WPS210
     bpy.context.view_layer.update()
 
 
+def setup_thumbnail_scene(data: dict, file_input: str) -> bpy.types.Image:  # noqa: WPS210,WPS213
+    """Append the model into the thumbnailer scene and apply the thumbnail settings.
+
+    Parameters:
+        data: thumbnail settings
+        file_input: blend file with the model
+
+    Returns:
+        bpy.types.Image: environment image of the thumbnailer scene
+    """
+    bg_blender.progress('preparing thumbnail scene')
+
+    context = bpy.context
+    scene = context.scene
+
+    user_preferences = context.preferences.addons[HANA3D_NAME].preferences
+
+    obnames = _get_obnames(data)
+    link = not data['save_only']
+    main_object, allobs = append_link.append_objects(
+        file_name=file_input,
+        obnames=obnames,
+        link=link,
+    )
+    context.view_layer.update()
+
+    camdict = {
+        'GROUND': 'camera ground',
+        'WALL': 'camera wall',
+        'CEILING': 'camera ceiling',
+        'FLOAT': 'camera float',
+    }
+
+    context.scene.camera = bpy.data.objects[camdict[data['thumbnail_snap_to']]]
+    _center_obs_for_thumbnail(allobs)
+    if user_preferences.thumbnail_use_gpu:
+        context.scene.cycles.device = 'GPU'
+
+    fdict = {
+        'DEFAULT': 1,
+        'FRONT': 2,
+        'SIDE': 3,
+        'TOP': 4,
+    }
+    scene.frame_set(fdict[data['thumbnail_angle']])
+
+    snapdict = {'GROUND': 'Ground', 'WALL': 'Wall', 'CEILING': 'Ceiling', 'FLOAT': 'Float'}
+
+    collection = context.scene.collection.children[snapdict[data['thumbnail_snap_to']]]
+    collection.hide_viewport = False
+    collection.hide_render = False
+    collection.hide_select = False
+
+    main_object.rotation_euler = (0, 0, 0)
+    # material declared on thumbnailer.blend
+    node_tree = bpy.data.materials['hana3d background'].node_tree
+    value_output = node_tree.nodes['Value'].outputs['Value']
+    value_output.default_value = data['thumbnail_background_lightness']
+    scene.cycles.samples = data['thumbnail_samples']
+    context.view_layer.cycles.use_denoising = data['thumbnail_denoising']
+    context.view_layer.update()
+
+    # import blender's HDR here
+    hdr_path = Path('datafiles/studiolights/world/interior.exr')
+    bpath = Path(bpy.utils.resource_path('LOCAL'))
+    ipath = str(bpath / hdr_path)
+
+    # this  stuff is for mac and possibly linux. For blender // means relative path.
+    # for Mac, // means start of absolute path
+    if ipath.startswith('//'):
+        ipath = ipath[1:]
+
+    hdr_img = bpy.data.images['interior.exr']
+    hdr_img.filepath = ipath
+    hdr_img.reload()
+
+    context.scene.render.resolution_x = int(data['thumbnail_resolution'])
+    context.scene.render.resolution_y = int(data['thumbnail_resolution'])
+    return hdr_img
+
+
+def render_thumbnail(thumbnail_path: str, preview: bool = False):
+    """Render the thumbnailer scene.
+
+    Parameters:
+        thumbnail_path: output path, without extension
+        preview: render a fast preview before the full-quality thumbnail
+    """
+    if bg_blender.progress not in bpy.app.handlers.render_stats:
+        bpy.app.handlers.render_stats.append(bg_blender.progress)
+    if preview:
+        bg_blender.progress('rendering thumbnail preview')
+        thumbnail_preview.render_preview(thumbnail_path)
+        bg_blender.progress(thumbnail_preview.PREVIEW_READY)
+
+    bpy.context.scene.render.filepath = thumbnail_path
+    bg_blender.progress('rendering thumbnail')
+    bpy.ops.render.render(write_still=True, animation=False)
+
+
 if __name__ == '__main__':
+    HANA3D_THUMBNAIL_PATH = sys.argv[-3]
+    HANA3D_EXPORT_FILE_INPUT = sys.argv[-4]
+    HANA3D_EXPORT_DATA = sys.argv[-5]
     try:    # noqa: WPS229
         logging.info('autothumb_model_bg')
         with open(HANA3D_EXPORT_DATA, 'r') as data_file:
             data = json.load(data_file)  # noqa: WPS110
 
-        context = bpy.context
-        scene = context.scene
-
-        user_preferences = context.preferences.addons[HANA3D_NAME].preferences
-
-        obnames = _get_obnames()
-        link = not data['save_only']
-        main_object, allobs = append_link.append_objects(
-            file_name=HANA3D_EXPORT_FILE_INPUT,
-            obnames=obnames,
-            link=link,
-        )
-        context.view_layer.update()
-
-        camdict = {
-            'GROUND': 'camera ground',
-            'WALL': 'camera wall',
-            'CEILING': 'camera ceiling',
-            'FLOAT': 'camera float',
-        }
-
-        context.scene.camera = bpy.data.objects[camdict[data['thumbnail_snap_to']]]
-        _center_obs_for_thumbnail(allobs)
-        if user_preferences.thumbnail_use_gpu:
-            context.scene.cycles.device = 'GPU'
-
-        fdict = {
-            'DEFAULT': 1,
-            'FRONT': 2,
-            'SIDE': 3,
-            'TOP': 4,
-        }
-        scene.frame_set(fdict[data['thumbnail_angle']])
-
-        snapdict = {'GROUND': 'Ground', 'WALL': 'Wall', 'CEILING': 'Ceiling', 'FLOAT': 'Float'}
-
-        collection = context.scene.collection.children[snapdict[data['thumbnail_snap_to']]]
-        collection.hide_viewport = False
-        collection.hide_render = False
-        collection.hide_select = False
-
-        main_object.rotation_euler = (0, 0, 0)
-        # material declared on thumbnailer.blend
-        node_tree = bpy.data.materials['hana3d background'].node_tree
-        value_output = node_tree.nodes['Value'].outputs['Value']
-        value_output.default_value = data['thumbnail_background_lightness']
-        scene.cycles.samples = data['thumbnail_samples']
-        context.view_layer.cycles.use_denoising = data['thumbnail_denoising']
-        context.view_layer.update()
-
-        # import blender's HDR here
-        hdr_path = Path('datafiles/studiolights/world/interior.exr')
-        bpath = Path(bpy.utils.resource_path('LOCAL'))
-        ipath = str(bpath / hdr_path)
-
-        # this  stuff is for mac and possibly linux. For blender // means relative path.
-        # for Mac, // means start of absolute path
-        if ipath.startswith('//'):
-            ipath = ipath[1:]
-
-        hdr_img = bpy.data.images['interior.exr']
-        hdr_img.filepath = ipath
-        hdr_img.reload()
-
-        context.scene.render.resolution_x = int(data['thumbnail_resolution'])
-        context.scene.render.resolution_y = int(data['thumbnail_resolution'])
+        hdr_img = setup_thumbnail_scene(data, HANA3D_EXPORT_FILE_INPUT)
 
         if data['save_only']:
             hdr_img.pack()
             bpy.ops.wm.save_as_mainfile(filepath=data['blend_filepath'], compress=True, copy=True)
         else:
-            context.scene.render.filepath = HANA3D_THUMBNAIL_PATH
-            bpy.ops.render.render(write_still=True, animation=False)
+            render_thumbnail(HANA3D_THUMBNAIL_PATH, preview=data.get('preview', False))
 
     except Exception as error:
         logging.error(error)
@@ -0,0 +1,48 @@
+"""Fast low-quality render shown while the full-quality thumbnail renders."""
+import bpy
+
+PREVIEW_SUFFIX = '_preview'
+PREVIEW_READY = 'thumbnail preview ready'
+PREVIEW_SAMPLES = 4
+PREVIEW_RESOLUTION_PERCENTAGE = 50
+
+
+def get_preview_path(thumbnail_path: str) -> str:
+    """Get the output path of the preview of a thumbnail.
+
+    Parameters:
+        thumbnail_path: output path of the thumbnail, without extension
+
+    Returns:
+        str: output path of the preview, without extension
+    """
+    return f'{thumbnail_path}{PREVIEW_SUFFIX}'
+
+
+def render_preview(thumbnail_path: str):
+    """Render the thumbnailer scene with few samples at half resolution.
+
+    The scene settings are restored afterwards, so the full-quality render
+    can reuse the same scene setup.
+
+    Parameters:
+        thumbnail_path: output path of the thumbnail, without extension
+    """
+    scene = bpy.context.scene
+    view_layer = bpy.context.view_layer
+    samples = scene.cycles.samples
+    resolution_percentage = scene.render.resolution_percentage
+    use_denoising = view_layer.cycles.use_denoising
+    filepath = scene.render.filepath
+
+    scene.cycles.samples = min(PREVIEW_SAMPLES, samples)
+    scene.render.resolution_percentage = PREVIEW_RESOLUTION_PERCENTAGE
+    view_layer.cycles.use_denoising = True
+    scene.render.filepath = get_preview_path(thumbnail_path)
+    try:
+        bpy.ops.render.render(write_still=True, animation=False)
+    finally:
+        scene.cycles.samples = samples
+        scene.render.resolution_percentage = resolution_percentage
+        view_layer.cycles.use_denoising = use_denoising
+        scene.render.filepath = filepath
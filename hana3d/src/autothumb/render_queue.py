@@ -0,0 +1,159 @@
+"""Queue of local thumbnail renders that share the machine cores."""
+import asyncio
+import itertools
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from ..metaclasses.singleton import Singleton
+from ..worker_pool.worker_pool import WorkerPool
+
+MIN_THREADS_PER_JOB = 4
+MEMORY_PER_JOB = 2 * 1024 * 1024 * 1024
+
+StateCallback = Callable[[str], None]
+
+
+def _available_memory() -> Optional[int]:
+    try:
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, ValueError, OSError):
+        return None
+
+
+class _QueuedJob(object):
+    def __init__(self, order: int, state_callback: StateCallback):
+        self.order = order
+        self.state_callback = state_callback
+
+
+class RenderQueue(object, metaclass=Singleton):
+    """Runs a few thumbnail renders at a time, splitting the cores between them."""
+
+    def __init__(self):
+        """Create a RenderQueue object."""
+        self._counter = itertools.count()
+        self._queued: Dict[int, _QueuedJob] = {}
+        self._running: Dict[int, _QueuedJob] = {}
+        self._changed: Optional[asyncio.Condition] = None
+
+    def max_running_jobs(self) -> int:
+        """Number of renders that fit in the machine cores and free memory.
+
+        Returns:
+            int: maximum number of renders running at the same time
+        """
+        cores = os.cpu_count() or 1
+        max_jobs = max(1, cores // MIN_THREADS_PER_JOB)
+        memory = _available_memory()
+        if memory is not None:
+            max_jobs = min(max_jobs, max(1, memory // MEMORY_PER_JOB))
+        pool_size = WorkerPool().size()
+        if pool_size > 0:
+            max_jobs = min(max_jobs, pool_size)
+        return max_jobs
+
+    def threads_per_job(self) -> Optional[int]:
+        """Number of render threads given to a job starting now.
+
+        The cores are split between the running jobs and the queued ones that will start
+        next to them, not between as many jobs as could fit.
+
+        Returns:
+            Optional[int]: threads passed to Blender, None to use all cores when it renders alone
+        """
+        jobs = min(self.max_running_jobs(), len(self._running) + len(self._queued))
+        if jobs <= 1:
+            return None
+        return max(1, (os.cpu_count() or 1) // jobs)
+
+    def is_queued(self, key: int) -> bool:
+        """Check if a job is waiting for its turn.
+
+        Parameters:
+            key: key the job was queued with
+
+        Returns:
+            bool: True if the job is queued and not running yet
+        """
+        return key in self._queued
+
+    def prioritize(self, key: int) -> bool:
+        """Move a queued job to the front of the queue.
+
+        Parameters:
+            key: key the job was queued with
+
+        Returns:
+            bool: False if the job is not queued
+        """
+        job = self._queued.get(key)
+        if job is None:
+            return False
+        job.order = min(queued.order for queued in self._queued.values()) - 1
+        self._update_positions()
+        asyncio.ensure_future(self._notify())
+        return True
+
+    async def run(
+        self,
+        key: int,
+        render: Callable[..., Awaitable[Any]],
+        state_callback: StateCallback,
+    ) -> Any:
+        """Wait for a free slot and run a render with its share of the cores.
+
+        Cancelling the awaiting task removes the job from the queue or stops the render.
+
+        Parameters:
+            key: identifies the job, usually the pointer of the asset upload props
+            render: called with the keyword argument threads when the job starts
+            state_callback: called with the queued and running state of the job
+
+        Returns:
+            Any: result of render
+
+        Raises:
+            ValueError: if a job with the same key is already queued or running
+        """
+        if key in self._queued or key in self._running:
+            raise ValueError(f'Render job {key} is already queued or running')
+        if self._changed is None:
+            self._changed = asyncio.Condition()
+        self._queued[key] = _QueuedJob(next(self._counter), state_callback)
+        self._update_positions()
+        try:
+            async with self._changed:
+                await self._changed.wait_for(lambda: self._can_start(key))
+                self._running[key] = self._queued.pop(key)
+        except asyncio.CancelledError:
+            self._queued.pop(key, None)
+            self._update_positions()
+            asyncio.ensure_future(self._notify())
+            raise
+        self._update_positions()
+
+        threads = self.threads_per_job()
+        if threads is None:
+            state_callback('rendering thumbnail')
+        else:
+            state_callback(f'rendering thumbnail ({threads} threads)')
+        try:
+            return await render(threads=threads)
+        finally:
+            self._running.pop(key, None)
+            asyncio.ensure_future(self._notify())
+
+    def _can_start(self, key: int) -> bool:
+        if len(self._running) >= self.max_running_jobs():
+            return False
+        next_key = min(self._queued, key=lambda queued: self._queued[queued].order)
+        return next_key == key
+
+    def _update_positions(self):
+        queued_jobs = sorted(self._queued.values(), key=lambda job: job.order)
+        for position, job in enumerate(queued_jobs):
+            job.state_callback(f'queued ({position + 1}/{len(queued_jobs)})')
+
+    async def _notify(self):
+        async with self._changed:
+            self._changed.notify_all()
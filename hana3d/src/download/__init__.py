@@ -42,6 +42,7 @@ from ..libraries.libraries import set_library_props, update_libraries_list
 from ..search.query import Query
 from ..search.search import AssetData, get_search_results
 from ..tags.tags import update_tags_list
+from ..textures.textures import resolve_textures
 from ..ui import colors
 from ..ui.main import UI
 from ... import append_link, paths, render_tools, utils
@@ -481,6 +482,8 @@ def append_asset(asset_data: AssetData, **kwargs):
     elif asset_data.asset_type == 'material':
         asset = import_material(asset_data, file_names, **kwargs)
 
+    resolve_textures()
+
     wm[f'{HANA3D_NAME}_assets_used'] = wm.get(f'{HANA3D_NAME}_assets_used', {})
     wm[f'{HANA3D_NAME}_assets_used'][asset_data.view_id] = asdict(asset_data)
 
@@ -0,0 +1 @@
+"""Values computed from evaluated objects, cached until the objects change."""
@@ -0,0 +1,114 @@
+"""Bounds of evaluated objects, computed with NumPy.
+
+Vertex coordinates are read with a single `foreach_get` per object and transformed
+with one matrix product, instead of one `Matrix @ Vector` per vertex in Python. The
+transform is done in double precision, so objects far from the origin keep precise
+bounds, only the buffer read from Blender is single precision.
+"""
+from typing import Iterable, Optional, Tuple
+
+import bpy
+import numpy
+from mathutils import Matrix
+
+from .object_cache import ObjectCache
+
+BOUNDS_KEY = 'bounds'
+BOUNDS_TYPES = frozenset(('MESH', 'CURVE'))
+EMPTY_BOUNDS = ()
+
+Bounds = Tuple[float, float, float, float, float, float]
+
+
+def _get_coordinates(mesh: Optional[bpy.types.Mesh]) -> numpy.ndarray:
+    if mesh is None:
+        return numpy.empty((0, 3), dtype=numpy.float32)
+    coordinates = numpy.empty(len(mesh.vertices) * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', coordinates)
+    return coordinates.reshape(-1, 3)
+
+
+def _get_evaluated_coordinates(
+    blend_object: bpy.types.Object,
+    depsgraph: bpy.types.Depsgraph,
+) -> numpy.ndarray:
+    object_eval = blend_object.evaluated_get(depsgraph)
+    if blend_object.type == 'MESH':
+        return _get_coordinates(object_eval.data)
+    try:
+        return _get_coordinates(object_eval.to_mesh())
+    finally:
+        object_eval.to_mesh_clear()
+
+
+def _compute_bounds(
+    blend_object: bpy.types.Object,
+    matrix: Matrix,
+    depsgraph: bpy.types.Depsgraph,
+) -> tuple:
+    coordinates = _get_evaluated_coordinates(blend_object, depsgraph)
+    if not len(coordinates):
+        return EMPTY_BOUNDS
+    transform = numpy.array(matrix, dtype=numpy.float64)
+    points = coordinates.astype(numpy.float64) @ transform[:3, :3].T
+    points += transform[:3, 3]
+    return points.min(axis=0), points.max(axis=0)
+
+
+def get_object_bounds(
+    blend_object: bpy.types.Object,
+    matrix: Matrix,
+    depsgraph: bpy.types.Depsgraph,
+) -> tuple:
+    """Get the bounds of the evaluated vertices of an object, in the space given by matrix.
+
+    Results are cached until the object or its data updates.
+
+    Parameters:
+        blend_object: mesh or curve object
+        matrix: transform from the object space to the space of the bounds
+        depsgraph: evaluated depsgraph
+
+    Returns:
+        tuple: arrays with the minimum and maximum coordinates, empty if there are no vertices
+    """
+    cache = ObjectCache()
+    key = (BOUNDS_KEY, tuple(value for row in matrix for value in row))
+    bounds = cache.get(blend_object, key)
+    if bounds is None:
+        bounds = _compute_bounds(blend_object, matrix, depsgraph)
+        cache.store(blend_object, key, bounds)
+    return bounds
+
+
+def get_bounds(
+    objects: Iterable[bpy.types.Object],
+    space: Optional[Matrix] = None,
+) -> Optional[Bounds]:
+    """Get the bounds of the evaluated mesh and curve objects.
+
+    Parameters:
+        objects: objects to bound, other types are ignored
+        space: transform from world space to the space of the bounds, None for world space
+
+    Returns:
+        Optional[Bounds]: minx, miny, minz, maxx, maxy, maxz, None if there are no vertices
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    minimums = []
+    maximums = []
+    for blend_object in objects:
+        if blend_object.type not in BOUNDS_TYPES:
+            continue
+        matrix = blend_object.matrix_world
+        if space is not None:
+            matrix = space @ matrix
+        object_bounds = get_object_bounds(blend_object, matrix, depsgraph)
+        if object_bounds:
+            minimums.append(object_bounds[0])
+            maximums.append(object_bounds[1])
+    if not minimums:
+        return None
+    minimum = numpy.min(minimums, axis=0)
+    maximum = numpy.max(maximums, axis=0)
+    return (*map(float, minimum), *map(float, maximum))  # type: ignore
@@ -0,0 +1,119 @@
+"""Face counts of objects, at render settings, from the evaluated depsgraph.
+
+Python can not evaluate a depsgraph for render, so modifiers whose viewport
+settings differ from the render ones are switched to the render settings while
+the depsgraph is evaluated, and switched back right after. The depsgraph updates
+caused by the switch are ignored by the caches, which would drop their values of
+the counted objects otherwise.
+
+Modifiers of objects linked from libraries can not be edited, so those objects are
+counted at their viewport settings, and their render face count is approximate.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+import bpy
+
+from .object_cache import ObjectCache
+
+FACE_COUNT_KEY = 'face_count'
+RENDER_FACE_COUNT_KEY = 'render_face_count'
+FACE_COUNT_TYPES = frozenset(('MESH', 'CURVE'))
+RENDER_LEVELS_MODIFIERS = frozenset(('SUBSURF', 'MULTIRES'))
+
+
+class _RenderSettings(object):
+    def __init__(self, objects: Iterable[bpy.types.Object]):
+        self._objects = objects
+        self._changed: List[Tuple[bpy.types.Modifier, str, object]] = []
+
+    def __enter__(self) -> '_RenderSettings':
+        # Pending updates of the user are evaluated first, so they are not ignored
+        bpy.context.evaluated_depsgraph_get()
+        for blend_object in self._objects:
+            if blend_object.library is not None:
+                continue
+            for modifier in blend_object.modifiers:
+                self._set(modifier, 'show_viewport', modifier.show_render)
+                if modifier.type in RENDER_LEVELS_MODIFIERS:
+                    self._set(modifier, 'levels', modifier.render_levels)
+        ObjectCache().ignore_updates = True
+        return self
+
+    def __exit__(self, *exc_info):
+        try:
+            for modifier, attribute, viewport_value in reversed(self._changed):
+                setattr(modifier, attribute, viewport_value)
+            if self._changed:
+                # Evaluate the restored settings while their update is still ignored
+                bpy.context.evaluated_depsgraph_get()
+        finally:
+            ObjectCache().ignore_updates = False
+
+    def _set(self, modifier: bpy.types.Modifier, attribute: str, render_value: object):
+        viewport_value = getattr(modifier, attribute)
+        if viewport_value != render_value:
+            self._changed.append((modifier, attribute, viewport_value))
+            setattr(modifier, attribute, render_value)
+
+
+def _count_mesh_faces(blend_object: bpy.types.Object) -> int:
+    if blend_object.type == 'MESH':
+        return len(blend_object.data.polygons)
+    mesh = blend_object.to_mesh()
+    try:
+        return 0 if mesh is None else len(mesh.polygons)
+    finally:
+        blend_object.to_mesh_clear()
+
+
+def _count_render_faces(objects: List[bpy.types.Object]) -> Dict[str, int]:
+    with _RenderSettings(objects):
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        return {
+            blend_object.name: _count_mesh_faces(blend_object.evaluated_get(depsgraph))
+            for blend_object in objects
+        }
+
+
+def _get_face_count(blend_object: bpy.types.Object) -> int:
+    cache = ObjectCache()
+    face_count = cache.get(blend_object, FACE_COUNT_KEY)
+    if face_count is None:
+        face_count = _count_mesh_faces(blend_object)
+        cache.store(blend_object, FACE_COUNT_KEY, face_count)
+    return face_count
+
+
+def get_face_counts(objects: Iterable[bpy.types.Object]) -> Tuple[int, int]:
+    """Count faces of mesh and curve objects, without and with their modifiers at render.
+
+    Counts are cached until the object or its data updates, the depsgraph is only
+    evaluated for objects whose counts are not cached.
+
+    Parameters:
+        objects: objects to count, other types are ignored
+
+    Returns:
+        Tuple[int, int]: face count of the original data and face count at render
+    """
+    cache = ObjectCache()
+    mesh_objects = [
+        blend_object
+        for blend_object in objects
+        if blend_object.type in FACE_COUNT_TYPES
+    ]
+    render_face_counts = {}
+    missing = []
+    for blend_object in mesh_objects:
+        render_face_count = cache.get(blend_object, RENDER_FACE_COUNT_KEY)
+        if render_face_count is None:
+            missing.append(blend_object)
+        else:
+            render_face_counts[blend_object.name] = render_face_count
+    if missing:
+        evaluated_counts = _count_render_faces(missing)
+        for blend_object in missing:
+            cache.store(blend_object, RENDER_FACE_COUNT_KEY, evaluated_counts[blend_object.name])
+        render_face_counts.update(evaluated_counts)
+    face_count = sum(_get_face_count(blend_object) for blend_object in mesh_objects)
+    return face_count, sum(render_face_counts.values())
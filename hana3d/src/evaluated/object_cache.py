@@ -0,0 +1,149 @@
+"""Cache of values computed from evaluated objects, invalidated by depsgraph updates."""
+from typing import Any, Dict, Hashable, Optional, Set, Tuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+from ..metaclasses.singleton import Singleton
+
+Datablock = Tuple[str, str]
+
+
+def _get_key(datablock: Optional[bpy.types.ID]) -> Optional[Datablock]:
+    if datablock is None:
+        return None
+    return type(datablock).__name__, datablock.name
+
+
+class _Entry(object):
+    def __init__(self, data: Optional[Datablock]):
+        self.data = data
+        self.values: Dict[Hashable, Any] = {}
+
+
+class ObjectCache(object, metaclass=Singleton):
+    """Values computed from an evaluated object, kept until the object or its data updates.
+
+    Attributes:
+        ignore_updates: True while objects are changed temporarily to compute values,
+            so the depsgraph updates of those changes do not drop cached values
+    """
+
+    def __init__(self):
+        """Create an ObjectCache object."""
+        self._entries: Dict[str, _Entry] = {}
+        self.ignore_updates = False
+
+    def get(self, blend_object: bpy.types.Object, key: Hashable) -> Optional[Any]:
+        """Get a value computed from an object.
+
+        Parameters:
+            blend_object: original object
+            key: name of the value
+
+        Returns:
+            Optional[Any]: cached value, None if it must be computed again
+        """
+        entry = self._entries.get(blend_object.name)
+        if entry is None or entry.data != _get_key(blend_object.data):
+            return None
+        return entry.values.get(key)
+
+    def store(self, blend_object: bpy.types.Object, key: Hashable, value: Any):
+        """Keep a value computed from an object until the object updates.
+
+        Parameters:
+            blend_object: original object
+            key: name of the value
+            value: value to keep
+        """
+        data = _get_key(blend_object.data)
+        entry = self._entries.get(blend_object.name)
+        if entry is None or entry.data != data:
+            entry = _Entry(data)
+            self._entries[blend_object.name] = entry
+        entry.values[key] = value
+
+    def invalidate(self, object_names: Set[str], datablocks: Set[Datablock]):
+        """Drop values of updated objects and of objects using updated data.
+
+        Parameters:
+            object_names: names of the updated objects
+            datablocks: (type, name) of the updated object data
+        """
+        dirty = [
+            object_name
+            for object_name, entry in self._entries.items()
+            if object_name in object_names or entry.data in datablocks
+        ]
+        for object_name in dirty:
+            del self._entries[object_name]  # noqa: WPS420
+
+    def clear(self):
+        """Drop all values."""
+        self._entries.clear()
+
+    def __bool__(self) -> bool:
+        """Check if there are cached values.
+
+        Returns:
+            bool: True if any value is cached
+        """
+        return bool(self._entries)
+
+
+@persistent
+def depsgraph_update_post(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    """Invalidate values of updated objects.
+
+    Parameters:
+        scene: updated scene
+        depsgraph: depsgraph with the updated datablocks
+    """
+    cache = ObjectCache()
+    if not cache or cache.ignore_updates:
+        return
+    object_names: Set[str] = set()
+    datablocks: Set[Datablock] = set()
+    for update in depsgraph.updates:
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.Object):
+            object_names.add(datablock.name)
+        else:
+            datablocks.add((type(datablock).__name__, datablock.name))
+    cache.invalidate(object_names, datablocks)
+
+
+@persistent
+def clear_cache(*args):
+    """Drop all values when datablocks are replaced or animated.
+
+    Runs on file load, undo and frame change, which evaluates animated objects again
+    without a depsgraph update.
+
+    Parameters:
+        args: handler arguments, unused
+    """
+    ObjectCache().clear()
+
+
+HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, depsgraph_update_post),
+    (bpy.app.handlers.load_post, clear_cache),
+    (bpy.app.handlers.undo_post, clear_cache),
+    (bpy.app.handlers.redo_post, clear_cache),
+    (bpy.app.handlers.frame_change_post, clear_cache),
+)
+
+
+def register():
+    """Register object cache handlers."""
+    for handlers, handler in HANDLERS:
+        handlers.append(handler)
+
+
+def unregister():
+    """Unregister object cache handlers."""
+    for handlers, handler in HANDLERS:
+        if handler in handlers:
+            handlers.remove(handler)
@@ -36,6 +36,18 @@ def get_report_file() -> str:
     return os.path.join(dir_path, f'{HANA3D_NAME}_report.log')
 
 
+def get_validation_report_file() -> str:
+    """Get validation timings report filepath.
+
+    Returns:
+        str: validation_report_file_path
+    """
+    dir_path = os.path.join(expanduser('~'), 'hana3d_logs')
+    if not os.path.isdir(dir_path):
+        os.mkdir(dir_path)
+    return os.path.join(dir_path, f'{HANA3D_NAME}_validation_report.json')
+
+
 def setup_logger():  # noqa WPS210,WPS213
     """Logger setup."""
     log_level = HANA3D_LOG_LEVEL
@@ -2,6 +2,7 @@
 from bpy.types import Panel
 
 from ..upload import upload
+from ... import render_tools
 from ...config import HANA3D_DESCRIPTION, HANA3D_NAME, HANA3D_RENDER, HANA3D_UI
 
 
@@ -77,9 +78,14 @@ class Hana3DRenderPanel(Panel):  # noqa: WPS214
             active_propname='render_list_index',
             item_dyntip_propname='not_working',
         )
+        active_render = asset_props.render_list[asset_props.render_list_index]
         row = box.row()
         row.template_icon(
-            icon_value=asset_props.render_list[asset_props.render_list_index]['icon_id'],
+            icon_value=render_tools.get_render_icon(
+                asset_props.view_id,
+                active_render.job_id,
+                active_render.file_path,
+            ),
             scale=10,
         )
 
@@ -3,6 +3,7 @@ import bpy
 from bpy.types import Panel
 
 from .lib import draw_selected_libraries, draw_selected_tags, label_multiline
+from ..autothumb import is_thumbnail_queued
 from ..edit_asset import edit
 from ..unified_props import Unified
 from ..upload import upload
@@ -53,6 +54,7 @@ class Hana3DUploadPanel(Panel):  # noqa: WPS214
         self._draw_tags(layout, props)
 
         self._prop_needed(layout, props, 'publish_message', props.publish_message)
+        layout.prop(props, 'external_textures')
 
         if props.upload_state != '':
             label_multiline(layout, text=props.upload_state, width=context.region.width)
@@ -141,9 +143,23 @@ class Hana3DUploadPanel(Panel):  # noqa: WPS214
                 row.operator(f'scene.{HANA3D_NAME}_thumbnail', text='', icon='IMAGE_DATA')
             elif asset_type == 'MATERIAL':
                 row.operator(f'material.{HANA3D_NAME}_thumbnail', text='', icon='IMAGE_DATA')
+            if asset_type in {'MODEL', 'MATERIAL'} and len(context.selected_objects) > 1:
+                op = row.operator(
+                    f'object.{HANA3D_NAME}_batch_thumbnail',
+                    text='',
+                    icon='RENDERLAYERS',
+                )
+                op.asset_type = asset_type
         if props.is_generating_thumbnail or props.thumbnail_generating_state != '':
             row = box.row()
             row.label(text=props.thumbnail_generating_state)
+            if props.is_generating_thumbnail and is_thumbnail_queued(props):
+                op = row.operator(
+                    f'object.{HANA3D_NAME}_prioritize_thumbnail',
+                    text='',
+                    icon='TRIA_UP',
+                )
+                op.asset_type = asset_type
             if props.is_generating_thumbnail:
                 op = row.operator(f'object.{HANA3D_NAME}_kill_bg_process', text='', icon='CANCEL')
                 op.process_source = asset_type
@@ -17,6 +17,8 @@ class UserPreferences(object):
     id_token: str
     max_assetbar_rows: int
     thumb_size: int
+    blender_workers: int
+    background_validation: bool
 
 
 class Preferences(object):
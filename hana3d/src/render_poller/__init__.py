@@ -0,0 +1 @@
+"""Async poller of notrenderfarm render jobs."""
@@ -0,0 +1,168 @@
+"""Single async poller for all active notrenderfarm jobs."""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+from ..async_loop import run_async_function
+from ..metaclasses.singleton import Singleton
+from ..requests_async.requests_async import Request
+from ... import paths
+
+MIN_POLL_INTERVAL = 5
+MAX_POLL_INTERVAL = 60
+BACKOFF_FACTOR = 1.5
+
+
+@dataclass
+class RenderJob:
+    """Render job tracked by the poller.
+
+    Attributes:
+        job_id: notrenderfarm job id
+        name: job name, used in logs
+        on_progress: called on the main thread with the progress of a running job
+        on_output: called in an executor thread with the finished job, returns False
+            when the output is not available yet and should be retried
+        on_done: called on the main thread when the job stops, with the error if it failed
+        is_cancelled: returns True when the user cancelled the job
+        interval: seconds until the next poll
+        progress: last reported progress
+    """
+
+    job_id: str
+    name: str
+    on_progress: Callable[[float], None]
+    on_output: Callable[[dict], bool]
+    on_done: Callable[[Optional[Exception]], None]
+    is_cancelled: Callable[[], bool]
+    interval: float = MIN_POLL_INTERVAL
+    progress: Optional[float] = None
+
+    def backoff(self, progress: Optional[float] = None):
+        """Poll again soon while the job moves, and less often while it does not.
+
+        Parameters:
+            progress: progress reported by the last poll
+        """
+        if progress is not None and progress != self.progress:
+            self.interval = MIN_POLL_INTERVAL
+        else:
+            self.interval = min(self.interval * BACKOFF_FACTOR, MAX_POLL_INTERVAL)
+        self.progress = progress
+
+
+class RenderJobPoller(object, metaclass=Singleton):
+    """Polls the status of all active render jobs from the asyncio loop."""
+
+    def __init__(self):
+        """Create a RenderJobPoller object."""
+        self._jobs: Dict[str, RenderJob] = {}
+        self._next_poll: Dict[str, float] = {}
+        self._task: Optional[asyncio.Future] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def track(self, job: RenderJob):
+        """Start polling a job, must be called from the main thread.
+
+        Parameters:
+            job: job to be polled until it finishes
+        """
+        self._jobs[job.job_id] = job
+        self._next_poll[job.job_id] = 0
+        if self._task is None or self._task.done():
+            self._task = run_async_function(self._poll_jobs)
+        elif self._wakeup is not None:
+            self._wakeup.set()
+
+    def active_jobs(self) -> List[RenderJob]:
+        """Jobs that are being polled.
+
+        Returns:
+            List[RenderJob]: active jobs
+        """
+        return list(self._jobs.values())
+
+    async def _poll_jobs(self):
+        loop = asyncio.get_event_loop()
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        wakeup = self._wakeup
+        while self._jobs:
+            now = loop.time()
+            due = [
+                job
+                for job_id, job in self._jobs.items()
+                if self._next_poll[job_id] <= now
+            ]
+            await asyncio.gather(*[self._poll_job(job) for job in due])
+            for job in due:
+                if job.job_id in self._jobs:
+                    self._next_poll[job.job_id] = loop.time() + job.interval
+            if self._next_poll:
+                await self._wait(wakeup, max(min(self._next_poll.values()) - loop.time(), 0))
+
+    async def _wait(self, wakeup: asyncio.Event, delay: float):
+        wakeup.clear()
+        try:
+            await asyncio.wait_for(wakeup.wait(), delay)
+        except asyncio.TimeoutError:
+            return
+
+    async def _poll_job(self, job: RenderJob):  # noqa: WPS231
+        if job.is_cancelled():
+            # Only the polling stops, the job itself keeps running on notrenderfarm
+            logging.info(f'Render job {job.name} cancelled')
+            self._stop(job)
+            return
+
+        try:
+            status = await self._get_status(job.job_id)
+        except Exception as error:
+            logging.warning(f'Could not get status of render job {job.name} ({error!r})')
+            job.backoff()
+            return
+
+        if status['status'] == 'FINISHED':
+            await self._get_output(job, status)
+        elif status['status'] == 'CANCELLED':
+            logging.info(f'Render job {job.name} cancelled')
+            self._stop(job)
+        elif status['status'] == 'ERRORED':
+            self._stop(job, Exception(f'Error in render job: {status}'))
+        elif status['status'] == 'IN_PROGRESS':
+            job.on_progress(status['progress'])
+            job.backoff(status['progress'])
+        else:
+            self._stop(job, Exception(f'Undexpected notrenderfarm job status: {status["status"]}'))
+
+    async def _get_status(self, job_id: str) -> dict:
+        request = Request()
+        url = paths.get_api_url('render_jobs', job_id)
+        response = await request.get(url, headers=request.get_headers())
+        response.raise_for_status()
+        return response.json()
+
+    async def _get_output(self, job: RenderJob, status: dict):
+        if not status.get('output'):
+            self._stop(job, Exception('notrenderfarm returned no output'))
+            return
+        loop = asyncio.get_event_loop()
+        try:
+            output_ready = await loop.run_in_executor(None, job.on_output, status)
+        except Exception as error:
+            self._stop(job, error)
+            return
+        if output_ready:
+            self._stop(job)
+        else:
+            # Backend has not ingested the results from the render farm yet
+            job.interval = MIN_POLL_INTERVAL
+
+    def _stop(self, job: RenderJob, error: Optional[Exception] = None):
+        self._jobs.pop(job.job_id, None)
+        self._next_poll.pop(job.job_id, None)
+        try:
+            job.on_done(error)
+        except Exception:
+            logging.exception(f'Failed to finish render job {job.name}')
@@ -1,10 +1,27 @@
 """Hana3D subprocess async."""
 
 import asyncio
-import functools
 import logging
 import subprocess  # noqa: S404
-from typing import List
+from typing import Callable, List, Optional
+
+PROGRESS_MARKER = 'progress{'
+
+
+def parse_progress(line: str) -> Optional[str]:
+    """Get the message of a progress marker written by a background script.
+
+    Parameters:
+        line: line of the script output
+
+    Returns:
+        Optional[str]: progress message, None if the line is not a progress marker
+    """
+    start = line.find(PROGRESS_MARKER)
+    if start == -1:
+        return None
+    end = line.rfind('}')
+    return line[start + len(PROGRESS_MARKER):end].strip()
 
 
 class Subprocess(object):  # noqa : WPS214
@@ -13,25 +30,82 @@ class Subprocess(object):  # noqa : WPS214
     def __init__(self):
         """Create a Subprocess object."""
 
-    async def subprocess(self, cmd: List[str]) -> subprocess.CompletedProcess:    # noqa : WPS210
+    async def subprocess(  # noqa : WPS210
+        self,
+        cmd: List[str],
+        timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> subprocess.CompletedProcess:
         """Run a command in a non-blocking subprocess.
 
+        The output is read line by line while the process runs, and the process is killed
+        when the timeout expires or the awaiting task is cancelled.
+
         Parameters:
             cmd: command to be executed.
+            timeout: seconds to wait for the process, None to wait forever.
+            progress_callback: called with the message of each progress marker in the output.
 
         Returns:
             subprocess.CompletedProcess: the return value representing a process that has finished.
 
         Raises:
             Exception: Subprocess exited in error
+            TimeoutError: Subprocess did not finish in time
         """
-        loop = asyncio.get_event_loop()
-        partial = functools.partial(subprocess.run, cmd, capture_output=True)
-        output = await loop.run_in_executor(None, partial)
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout: List[bytes] = []
+        stderr: List[bytes] = []
+        communicate = asyncio.gather(
+            self._read_stream(process.stdout, stdout, progress_callback),
+            self._read_stream(process.stderr, stderr, progress_callback),
+            process.wait(),
+        )
+        try:
+            _, _, returncode = await asyncio.wait_for(communicate, timeout)
+        except asyncio.TimeoutError:
+            self._kill(process)
+            raise TimeoutError(f'Subprocess did not finish in {timeout}s: {cmd}')
+        except asyncio.CancelledError:
+            self._kill(process)
+            raise
 
+        output = subprocess.CompletedProcess(
+            cmd,
+            returncode,
+            stdout=b''.join(stdout),
+            stderr=b''.join(stderr),
+        )
         if output.returncode != 0:
-            error_msg = output.stderr
+            error_msg = output.stderr.decode(errors='replace')
             raise Exception(f'Subprocess raised error:\n{error_msg}')
 
-        logging.debug(f'Subprocess {cmd}: {output.stdout}')
+        logging.debug(f'Subprocess {cmd}: {output.stdout.decode(errors="replace")}')
         return output
+
+    async def _read_stream(
+        self,
+        stream: Optional[asyncio.StreamReader],
+        lines: List[bytes],
+        progress_callback: Optional[Callable[[str], None]],
+    ):
+        if stream is None:
+            return
+        while True:
+            line = await stream.readline()
+            if not line:
+                return
+            lines.append(line)
+            progress = parse_progress(line.decode(errors='replace'))
+            if progress is not None and progress_callback is not None:
+                progress_callback(progress)
+
+    def _kill(self, process: asyncio.subprocess.Process):
+        if process.returncode is None:
+            logging.info(f'Killing subprocess {process.pid}')
+            process.kill()
+            asyncio.ensure_future(process.wait())
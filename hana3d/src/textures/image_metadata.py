@@ -0,0 +1,297 @@
+"""Image dimensions read from file headers, without decoding pixels.
+
+Reading `Image.size` of an image that is not loaded makes Blender decode the whole
+file. The headers of the formats used for textures have the dimensions in the first
+bytes, so they are parsed here and cached by path and modification time.
+"""
+import io
+import logging
+import os
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, List, Optional, Tuple
+
+import bpy
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+JPEG_SIGNATURE = b'\xff\xd8'
+EXR_SIGNATURE = b'\x76\x2f\x31\x01'
+TIFF_SIGNATURES = (b'II*\x00', b'MM\x00*')
+TGA_EXTENSIONS = frozenset(('.tga', '.tpic'))
+
+PNG_CHANNELS = {0: 1, 2: 3, 3: 3, 4: 2, 6: 4}
+# Start of frame markers, other than DHT (C4), JPG (C8) and DAC (CC)
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}  # noqa: WPS432
+JPEG_STANDALONE_MARKERS = frozenset(range(0xD0, 0xDA)) | {0x01}  # noqa: WPS432
+TIFF_WIDTH = 256
+TIFF_HEIGHT = 257
+TIFF_SAMPLES_PER_PIXEL = 277
+TIFF_SHORT = 3
+TIFF_LONG = 4
+TGA_HEADER_SIZE = 18
+TGA_GRAYSCALE_TYPES = frozenset((3, 11))
+
+
+@dataclass(frozen=True)
+class ImageMetadata:
+    """Image properties read from the file header.
+
+    Attributes:
+        width: width in pixels
+        height: height in pixels
+        channels: number of channels
+        file_format: Blender file format identifier
+    """
+
+    width: int
+    height: int
+    channels: int
+    file_format: str
+
+
+class _HeaderError(Exception):
+    """File header is truncated or not in the expected format."""
+
+
+def _read(header_file: BinaryIO, size: int) -> bytes:
+    header_bytes = header_file.read(size)
+    if len(header_bytes) != size:
+        raise _HeaderError('Unexpected end of file')
+    return header_bytes
+
+
+def _read_png(header_file: BinaryIO) -> ImageMetadata:
+    header_file.seek(len(PNG_SIGNATURE))
+    _, chunk_type = struct.unpack('>I4s', _read(header_file, 8))
+    if chunk_type != b'IHDR':
+        raise _HeaderError('PNG without IHDR chunk')
+    width, height, _, color_type = struct.unpack('>IIBB', _read(header_file, 10))
+    return ImageMetadata(width, height, PNG_CHANNELS.get(color_type, 4), 'PNG')
+
+
+def _read_jpeg(header_file: BinaryIO) -> ImageMetadata:
+    header_file.seek(len(JPEG_SIGNATURE))
+    while True:
+        marker_prefix, marker = _read(header_file, 2)
+        if marker_prefix != 0xFF:  # noqa: WPS432
+            raise _HeaderError('Invalid JPEG marker')
+        if marker == 0xFF:  # noqa: WPS432
+            # Fill byte before a marker
+            header_file.seek(-1, io.SEEK_CUR)
+            continue
+        if marker in JPEG_STANDALONE_MARKERS:
+            continue
+        (length,) = struct.unpack('>H', _read(header_file, 2))
+        if marker in JPEG_SOF_MARKERS:
+            _, height, width, channels = struct.unpack('>BHHB', _read(header_file, 6))
+            return ImageMetadata(width, height, channels, 'JPEG')
+        header_file.seek(length - 2, io.SEEK_CUR)
+
+
+def _read_string(header_file: BinaryIO) -> bytes:
+    chars: List[bytes] = []
+    while True:
+        char = _read(header_file, 1)
+        if char == b'\x00':
+            return b''.join(chars)
+        chars.append(char)
+
+
+def _count_exr_channels(channel_list: bytes) -> int:
+    channels = 0
+    position = 0
+    while position < len(channel_list) and channel_list[position] != 0:
+        position = channel_list.index(b'\x00', position) + 17  # noqa: WPS432
+        channels += 1
+    return channels
+
+
+def _read_exr(header_file: BinaryIO) -> ImageMetadata:
+    header_file.seek(len(EXR_SIGNATURE) + 4)
+    size: Optional[Tuple[int, int]] = None
+    channels: Optional[int] = None
+    while True:
+        attribute_name = _read_string(header_file)
+        if not attribute_name:
+            break
+        _read_string(header_file)
+        (attribute_size,) = struct.unpack('<i', _read(header_file, 4))
+        if attribute_name == b'dataWindow':
+            xmin, ymin, xmax, ymax = struct.unpack('<iiii', _read(header_file, attribute_size))
+            size = (xmax - xmin + 1, ymax - ymin + 1)
+        elif attribute_name == b'channels':
+            channels = _count_exr_channels(_read(header_file, attribute_size))
+        else:
+            header_file.seek(attribute_size, io.SEEK_CUR)
+        if size is not None and channels is not None:
+            return ImageMetadata(size[0], size[1], channels, 'OPEN_EXR')
+    raise _HeaderError('EXR without dataWindow or channels')
+
+
+def _read_tiff(header_file: BinaryIO, byte_order: str) -> ImageMetadata:
+    header_file.seek(4)
+    (ifd_offset,) = struct.unpack(f'{byte_order}I', _read(header_file, 4))
+    header_file.seek(ifd_offset)
+    (entry_count,) = struct.unpack(f'{byte_order}H', _read(header_file, 2))
+    tags = {TIFF_SAMPLES_PER_PIXEL: 1}
+    for _ in range(entry_count):
+        tag, field_type, _, field_value = struct.unpack(
+            f'{byte_order}HHI4s',
+            _read(header_file, 12),
+        )
+        if field_type == TIFF_SHORT:
+            tags[tag] = struct.unpack(f'{byte_order}H', field_value[:2])[0]
+        elif field_type == TIFF_LONG:
+            tags[tag] = struct.unpack(f'{byte_order}I', field_value)[0]
+    if TIFF_WIDTH not in tags or TIFF_HEIGHT not in tags:
+        raise _HeaderError('TIFF without dimensions')
+    return ImageMetadata(
+        tags[TIFF_WIDTH],
+        tags[TIFF_HEIGHT],
+        tags[TIFF_SAMPLES_PER_PIXEL],
+        'TIFF',
+    )
+
+
+def _read_tga(header_file: BinaryIO) -> ImageMetadata:
+    header_file.seek(0)
+    header = _read(header_file, TGA_HEADER_SIZE)
+    image_type = header[2]
+    width, height, pixel_depth = struct.unpack('<HHB', header[12:17])  # noqa: WPS432
+    if image_type in TGA_GRAYSCALE_TYPES:
+        channels = 1
+    elif pixel_depth == 32:  # noqa: WPS432
+        channels = 4
+    else:
+        channels = 3
+    return ImageMetadata(width, height, channels, 'TARGA')
+
+
+def read_metadata(header_file: BinaryIO, extension: str = '') -> Optional[ImageMetadata]:
+    """Parse the dimensions and channels of an image from its header.
+
+    Parameters:
+        header_file: image file opened in binary mode
+        extension: lowercase extension of the file, TGA files are only recognized by it
+
+    Returns:
+        Optional[ImageMetadata]: image properties, None if the format is not supported
+    """
+    signature = header_file.read(len(PNG_SIGNATURE))
+    try:
+        if signature.startswith(PNG_SIGNATURE):
+            return _read_png(header_file)
+        if signature.startswith(JPEG_SIGNATURE):
+            return _read_jpeg(header_file)
+        if signature.startswith(EXR_SIGNATURE):
+            return _read_exr(header_file)
+        for tiff_signature, byte_order in zip(TIFF_SIGNATURES, '<>'):
+            if signature.startswith(tiff_signature):
+                return _read_tiff(header_file, byte_order)
+        if extension in TGA_EXTENSIONS:
+            return _read_tga(header_file)
+    except (_HeaderError, struct.error, ValueError) as error:
+        logging.debug(f'Could not parse image header: {error}')
+    return None
+
+
+class _MetadataCache(object):
+    def __init__(self):
+        self._entries: Dict[str, Tuple[Tuple[int, int], Optional[ImageMetadata]]] = {}
+
+    def get(self, filepath: str) -> Optional[ImageMetadata]:
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            self._entries.pop(filepath, None)
+            return None
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        entry = self._entries.get(filepath)
+        if entry is not None and entry[0] == file_version:
+            return entry[1]
+        extension = os.path.splitext(filepath)[1].lower()
+        try:
+            with open(filepath, 'rb') as header_file:
+                metadata = read_metadata(header_file, extension)
+        except OSError:
+            return None
+        self._entries[filepath] = (file_version, metadata)
+        return metadata
+
+
+_cache = _MetadataCache()
+
+
+def get_file_metadata(filepath: str) -> Optional[ImageMetadata]:
+    """Get the properties of an image file, cached until the file changes.
+
+    Parameters:
+        filepath: absolute path of the image
+
+    Returns:
+        Optional[ImageMetadata]: image properties, None if the file does not exist
+            or its format is not supported
+    """
+    return _cache.get(filepath)
+
+
+def is_file_missing(image: bpy.types.Image) -> bool:
+    """Check if an image that is not packed points to a file that does not exist.
+
+    Parameters:
+        image: image datablock
+
+    Returns:
+        bool: True if the file of the image does not exist
+    """
+    if image.packed_file:
+        return False
+    return not os.path.exists(image.filepath_from_user())
+
+
+def get_image_metadata(image: bpy.types.Image) -> Optional[ImageMetadata]:
+    """Get the properties of an image without loading its pixels.
+
+    Loaded and generated images are answered by Blender, which does not need to
+    decode them again. File and packed images are read from the file header.
+
+    Parameters:
+        image: image datablock
+
+    Returns:
+        Optional[ImageMetadata]: image properties, None if the image file is missing
+    """
+    if image.has_data or image.source != 'FILE':
+        return _get_blender_metadata(image)
+    filepath = image.filepath_from_user()
+    if image.packed_file:
+        extension = os.path.splitext(filepath)[1].lower()
+        metadata = read_metadata(io.BytesIO(image.packed_file.data), extension)
+    else:
+        metadata = get_file_metadata(filepath)
+        if metadata is None and not os.path.exists(filepath):
+            return None
+    if metadata is None:
+        # Format not supported by the header parser
+        return _get_blender_metadata(image)
+    return metadata
+
+
+def get_image_size(image: bpy.types.Image) -> Tuple[int, int]:
+    """Get width and height of an image without loading its pixels.
+
+    Parameters:
+        image: image datablock
+
+    Returns:
+        Tuple[int, int]: width and height, (0, 0) if the image file is missing, like Blender
+    """
+    metadata = get_image_metadata(image)
+    if metadata is None:
+        return 0, 0
+    return metadata.width, metadata.height
+
+
+def _get_blender_metadata(image: bpy.types.Image) -> ImageMetadata:
+    width, height = image.size
+    return ImageMetadata(width, height, image.channels, image.file_format)
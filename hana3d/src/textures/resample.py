@@ -0,0 +1,121 @@
+"""Area averaging resampler for downscaling texture pixels with NumPy.
+
+Each output pixel is the average of the source pixels it covers, weighting the
+pixels cut by its borders by the covered fraction. Color is averaged in linear
+space and premultiplied by alpha, so dark fringes do not appear around bright
+or transparent areas.
+"""
+from typing import Tuple
+
+import numpy
+
+SRGB_THRESHOLD = 0.04045
+LINEAR_THRESHOLD = 0.0031308
+SRGB_SCALE = 12.92
+SRGB_OFFSET = 0.055
+SRGB_GAMMA = 2.4
+ROWS_PER_CHUNK = 256
+
+
+def _floor_power_of_two(number: int) -> int:
+    return 1 << (number.bit_length() - 1)
+
+
+def get_target_size(width: int, height: int, max_size: int) -> Tuple[int, int]:
+    """Get the largest power of two size that fits in the image and in max_size.
+
+    Each axis is reduced on its own, so non-square images stay non-square.
+
+    Parameters:
+        width: width of the image in pixels
+        height: height of the image in pixels
+        max_size: maximum width and height
+
+    Returns:
+        Tuple[int, int]: target width and height
+    """
+    return (
+        _floor_power_of_two(min(width, max_size)),
+        _floor_power_of_two(min(height, max_size)),
+    )
+
+
+def _along_axis(values: numpy.ndarray, axis: int, ndim: int) -> numpy.ndarray:
+    shape = [1] * ndim
+    shape[axis] = len(values)
+    return values.reshape(shape)
+
+
+def _resample_axis(pixels: numpy.ndarray, new_size: int, axis: int) -> numpy.ndarray:
+    old_size = pixels.shape[axis]
+    if new_size == old_size:
+        return pixels
+    if old_size % new_size == 0:
+        factor = old_size // new_size
+        shape = pixels.shape[:axis] + (new_size, factor) + pixels.shape[axis + 1:]
+        return pixels.reshape(shape).mean(axis=axis + 1, dtype=numpy.float32)
+
+    # Borders of the output pixels in source pixels, as integer and fractional parts
+    borders = numpy.arange(new_size + 1) * old_size
+    first = borders // new_size
+    fraction = (borders % new_size).astype(numpy.float32) / new_size
+    sums = numpy.add.reduceat(pixels, first[:-1], axis=axis, dtype=numpy.float32)
+    border_pixels = numpy.take(pixels, numpy.minimum(first, old_size - 1), axis=axis)
+    border_pixels *= _along_axis(fraction, axis, pixels.ndim)
+    sums += numpy.diff(border_pixels, axis=axis)
+    sums *= new_size / old_size
+    return sums
+
+
+def _to_linear(rgb: numpy.ndarray):
+    low = rgb <= SRGB_THRESHOLD
+    linear = numpy.power((rgb + SRGB_OFFSET) / (1 + SRGB_OFFSET), SRGB_GAMMA)
+    linear[low] = rgb[low] / SRGB_SCALE
+    rgb[...] = linear
+
+
+def _to_srgb(rgb: numpy.ndarray):
+    numpy.clip(rgb, 0, 1, out=rgb)
+    low = rgb <= LINEAR_THRESHOLD
+    srgb = (1 + SRGB_OFFSET) * numpy.power(rgb, 1 / SRGB_GAMMA) - SRGB_OFFSET
+    srgb[low] = rgb[low] * SRGB_SCALE
+    rgb[...] = srgb
+
+
+def _premultiply(pixels: numpy.ndarray, srgb: bool):
+    # In chunks of rows, to avoid temporaries as large as the whole image
+    for start in range(0, pixels.shape[0], ROWS_PER_CHUNK):
+        chunk = pixels[start:start + ROWS_PER_CHUNK]
+        if srgb:
+            _to_linear(chunk[..., :3])
+        if chunk.shape[-1] == 4:
+            chunk[..., :3] *= chunk[..., 3:]
+
+
+def _unpremultiply(pixels: numpy.ndarray, srgb: bool):
+    if pixels.shape[-1] == 4:
+        alpha = pixels[..., 3:]
+        numpy.divide(pixels[..., :3], alpha, out=pixels[..., :3], where=alpha > 0)
+    if srgb:
+        _to_srgb(pixels[..., :3])
+
+
+def resample(pixels: numpy.ndarray, width: int, height: int, srgb: bool) -> numpy.ndarray:
+    """Downscale pixels by area averaging.
+
+    Parameters:
+        pixels: float32 array of shape (height, width, channels), modified in place
+        width: target width, not larger than the source width
+        height: target height, not larger than the source height
+        srgb: True if color is sRGB encoded and must be averaged in linear space
+
+    Returns:
+        numpy.ndarray: float32 array of shape (height, width, channels)
+    """
+    _premultiply(pixels, srgb)
+    resized = _resample_axis(pixels, height, 0)
+    resized = _resample_axis(resized, width, 1)
+    if resized is pixels:
+        resized = resized.copy()
+    _unpremultiply(resized, srgb)
+    return resized
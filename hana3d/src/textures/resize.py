@@ -0,0 +1,176 @@
+"""Downscale textures in background Blender workers.
+
+Images are read, resampled and written by background Blender processes, so the UI
+does not freeze and the full size pixels are never loaded in the user session. Each
+result is written as a new file, next to the original when possible, and the image
+is relinked to it as soon as it is written.
+"""
+import asyncio
+import json
+import logging
+import os
+import uuid
+from typing import Iterable, List, Optional
+
+import bpy
+
+from .image_metadata import get_image_size
+from .resample import get_target_size
+from .textures import TEXTURE_PROP
+from ..async_loop import run_async_function
+from ..worker_pool.worker_pool import WorkerPool, run_blender_script
+from ... import paths
+from ...config import HANA3D_NAME
+
+RESIZE_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'resize_bg.py')
+RESIZE_SUBDIR = 'resized_textures'
+RESIZE_TIMEOUT = 300
+MAX_RESIZE_WORKERS = 4
+RESIZED = 'resized '
+
+
+def _get_output_dir(image: bpy.types.Image) -> str:
+    if not image.packed_file:
+        image_dir = os.path.dirname(image.filepath_from_user())
+        if os.access(image_dir, os.W_OK):
+            return image_dir
+    return paths.get_temp_dir(RESIZE_SUBDIR)
+
+
+def _get_extension(image: bpy.types.Image) -> str:
+    return os.path.splitext(image.filepath_from_user())[1] or '.png'
+
+
+def _write_packed_file(image: bpy.types.Image) -> str:
+    packed_path = os.path.join(
+        paths.get_temp_dir(RESIZE_SUBDIR),
+        f'{uuid.uuid4()}{_get_extension(image)}',
+    )
+    with open(packed_path, 'wb') as packed_file:
+        packed_file.write(image.packed_file.data)
+    return packed_path
+
+
+def _make_job(image: bpy.types.Image, width: int, height: int) -> dict:
+    filepath = image.filepath_from_user()
+    stem = os.path.splitext(os.path.basename(filepath))[0] or bpy.path.clean_name(image.name)
+    output_path = os.path.join(
+        _get_output_dir(image),
+        f'{stem}_{width}x{height}{_get_extension(image)}',
+    )
+    return {
+        'image': image.name,
+        'input': _write_packed_file(image) if image.packed_file else filepath,
+        'output': output_path,
+        'width': width,
+        'height': height,
+        'colorspace': image.colorspace_settings.name,
+        'packed': bool(image.packed_file),
+    }
+
+
+def resize_images(images: Iterable[bpy.types.Image], max_size: int) -> Optional[asyncio.Future]:
+    """Downscale images to power of two sizes not larger than max_size.
+
+    Images that only exist in memory, generated or with unsaved painting, are scaled
+    right away. Image files are resized in background workers.
+
+    Parameters:
+        images: images to resize
+        max_size: maximum width and height
+
+    Returns:
+        Optional[asyncio.Future]: task that finishes when all image files were relinked,
+            None if there was nothing to resize in the background
+    """
+    jobs = []
+    for image in images:
+        width, height = get_image_size(image)
+        if not width or not height:
+            continue
+        target_width, target_height = get_target_size(width, height, max_size)
+        if (target_width, target_height) == (width, height):
+            continue
+        if image.source != 'FILE' or image.is_dirty:
+            image.scale(target_width, target_height)
+        else:
+            jobs.append(_make_job(image, target_width, target_height))
+    if not jobs:
+        return None
+    return run_async_function(resize_in_workers, jobs=jobs)
+
+
+async def resize_in_workers(jobs: List[dict]):
+    """Split resize jobs between background Blender processes.
+
+    Parameters:
+        jobs: image, input and output paths and target size of each image file
+    """
+    # Largest images first, so each worker gets a similar amount of pixels
+    jobs = sorted(jobs, key=lambda job: job['width'] * job['height'], reverse=True)
+    worker_count = min(len(jobs), WorkerPool().size() or MAX_RESIZE_WORKERS)
+    chunks = [jobs[start::worker_count] for start in range(worker_count)]
+    pending = {job['image'] for job in jobs}
+
+    def on_progress(message: str):  # noqa: WPS430
+        if message.startswith(RESIZED):
+            job = json.loads(message[len(RESIZED):])
+            _relink_image(job)
+            pending.discard(job['image'])
+
+    try:
+        chunk_results = await asyncio.gather(
+            *[_run_chunk(chunk, on_progress) for chunk in chunks],
+            return_exceptions=True,
+        )
+    finally:
+        for job in jobs:
+            if job['packed'] and os.path.exists(job['input']):
+                os.remove(job['input'])
+    for chunk_result in chunk_results:
+        if isinstance(chunk_result, Exception):
+            logging.error(f'Texture resize worker failed: {chunk_result}')
+    for image_name in sorted(pending):
+        logging.error(f'Could not resize {image_name}')
+
+
+async def _run_chunk(chunk: List[dict], progress_callback):
+    jobs_path = os.path.join(paths.get_temp_dir(RESIZE_SUBDIR), f'{uuid.uuid4()}.json')
+    with open(jobs_path, 'w') as jobs_file:
+        json.dump(chunk, jobs_file)
+    try:
+        await run_blender_script(
+            paths.get_clean_filepath(),
+            RESIZE_SCRIPT,
+            [HANA3D_NAME, jobs_path],
+            RESIZE_TIMEOUT * len(chunk),
+            progress_callback,
+        )
+    finally:
+        os.remove(jobs_path)
+
+
+def _get_relinked_path(image: bpy.types.Image, output_path: str) -> str:
+    if image.filepath.startswith('//') and bpy.data.is_saved:
+        try:
+            return bpy.path.relpath(output_path)
+        except ValueError:
+            # Output on another drive
+            return output_path
+    return output_path
+
+
+def _relink_image(job: dict):
+    image = bpy.data.images.get(job['image'])
+    if image is None:
+        return
+    if image.packed_file:
+        image.unpack(method='REMOVE')
+    image.filepath = _get_relinked_path(image, job['output'])
+    if TEXTURE_PROP in image:
+        # The shared texture has the content of the original file
+        del image[TEXTURE_PROP]  # noqa: WPS420
+    image.reload()
+    if job['packed']:
+        image.pack()
+    logging.info(f'Resized {image.name} to {job["width"]}x{job["height"]}')
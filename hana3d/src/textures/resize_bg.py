@@ -0,0 +1,82 @@
+"""Blender script that downscales image files and writes them as new files."""
+import json
+import logging
+import sys
+import traceback
+from importlib import import_module
+
+import bpy
+import numpy
+
+HANA3D_NAME, JOBS_FILE = sys.argv[-2:]  # noqa: WPS414
+
+bg_blender = import_module(f'{HANA3D_NAME}.bg_blender')
+resample = import_module(f'{HANA3D_NAME}.src.textures.resample')
+resize = import_module(f'{HANA3D_NAME}.src.textures.resize')
+
+RGBA = 4
+
+
+def _read_pixels(image: bpy.types.Image) -> numpy.ndarray:
+    width, height = image.size
+    pixels = numpy.empty(width * height * image.channels, dtype=numpy.float32)
+    image.pixels.foreach_get(pixels)
+    return pixels.reshape(height, width, image.channels)
+
+
+def _to_rgba(pixels: numpy.ndarray) -> numpy.ndarray:
+    # New images always have 4 channels
+    channels = pixels.shape[-1]
+    if channels == RGBA:
+        return pixels
+    rgba = numpy.ones(pixels.shape[:2] + (RGBA,), dtype=numpy.float32)
+    if channels < 3:
+        rgba[..., :3] = pixels[..., :1]
+    else:
+        rgba[..., :3] = pixels[..., :3]
+    if channels == 2:
+        rgba[..., 3] = pixels[..., 1]
+    return rgba
+
+
+def resize_image(job: dict):
+    """Write a downscaled copy of an image file.
+
+    Parameters:
+        job: input and output paths, target width and height
+    """
+    image = bpy.data.images.load(job['input'])
+    output = None
+    try:
+        image.colorspace_settings.name = job['colorspace']
+        srgb = not image.is_float and job['colorspace'] == 'sRGB'
+        pixels = resample.resample(_read_pixels(image), job['width'], job['height'], srgb)
+        output = bpy.data.images.new(
+            job['image'],
+            job['width'],
+            job['height'],
+            alpha=image.channels in {2, RGBA},
+            float_buffer=image.is_float,
+        )
+        output.colorspace_settings.name = job['colorspace']
+        output.pixels.foreach_set(_to_rgba(pixels).ravel())
+        output.filepath_raw = job['output']
+        output.file_format = image.file_format
+        output.save()
+    finally:
+        bpy.data.images.remove(image)
+        if output is not None:
+            bpy.data.images.remove(output)
+
+
+if __name__ == '__main__':
+    with open(JOBS_FILE, 'r') as jobs_file:
+        jobs = json.load(jobs_file)
+    for job in jobs:
+        logging.info(f'Resizing {job["input"]} to {job["width"]}x{job["height"]}')
+        try:
+            resize_image(job)
+        except Exception:
+            traceback.print_exc()
+            continue
+        bg_blender.progress(f'{resize.RESIZED}{json.dumps(job)}')
@@ -0,0 +1,173 @@
+"""Content-addressed textures shared between assets.
+
+When an asset is uploaded with external textures, its images are not packed in the
+blend file. Each image file is uploaded once, named by the SHA-256 of its content,
+and the image keeps that name in a custom property. On download the files are looked
+up in a local texture cache shared by all assets, and only the missing ones are fetched.
+"""
+import asyncio
+import functools
+import logging
+import os
+from typing import Dict, List, Optional, Set
+
+import bpy
+import requests
+
+from ..async_loop import run_async_function
+from ..requests_async.requests_async import Request
+from ..ui.main import UI
+from ..upload.async_functions import confirm_upload, get_upload_url, upload_file
+from ... import paths
+
+# Not prefixed by the stage, so assets uploaded from any build of the addon resolve
+TEXTURE_PROP = 'hana3d_texture'
+TEXTURES_DIR = 'textures'
+MAX_CONCURRENT_TRANSFERS = 4
+CHUNK_SIZE = 1024 * 1024
+
+_downloading: Set[str] = set()
+
+
+def get_external_images() -> Dict[str, List[bpy.types.Image]]:
+    """Get images that reference a shared texture.
+
+    Returns:
+        Dict[str, List[bpy.types.Image]]: images by texture name
+    """
+    images: Dict[str, List[bpy.types.Image]] = {}
+    for image in bpy.data.images:
+        texture_name = image.get(TEXTURE_PROP)
+        if texture_name is not None:
+            images.setdefault(texture_name, []).append(image)
+    return images
+
+
+def resolve_textures():
+    """Point external images to the texture cache, downloading missing textures."""
+    cache_dir = paths.get_texture_cache_dir()
+    missing = []
+    for texture_name, images in get_external_images().items():
+        texture_path = os.path.join(cache_dir, texture_name)
+        if os.path.exists(texture_path):
+            _relink_images(images, texture_path)
+        elif texture_name not in _downloading:
+            missing.append(texture_name)
+
+    if missing:
+        run_async_function(download_textures, texture_names=missing)
+
+
+async def download_textures(texture_names: List[str]):
+    """Download textures to the cache and relink the images that use them.
+
+    Parameters:
+        texture_names: content-addressed names of the textures
+    """
+    _downloading.update(texture_names)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSFERS)
+    try:
+        await asyncio.gather(*[
+            _download_texture(texture_name, semaphore)
+            for texture_name in texture_names
+        ])
+    finally:
+        _downloading.difference_update(texture_names)
+
+
+async def upload_textures(
+    correlation_id: str,
+    upload_data: dict,
+    texture_dir: str,
+    pending_uploads: List[str],
+):
+    """Upload the textures written by the upload script that the server does not have yet.
+
+    Parameters:
+        correlation_id: Correlation ID
+        upload_data: Upload data
+        texture_dir: directory with the content-addressed texture files
+        pending_uploads: IDs of the unconfirmed uploads, cancelled if the asset upload fails
+
+    Raises:
+        Exception: a texture could not be uploaded
+    """
+    if not os.path.isdir(texture_dir):
+        return
+    ui = UI()
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSFERS)
+
+    async def upload_texture(texture_name: str):  # noqa: WPS430
+        file_info = {
+            'type': 'texture',
+            'index': 0,
+            'file_path': os.path.join(texture_dir, texture_name),
+            'publish_message': None,
+        }
+        async with semaphore:
+            upload = await get_upload_url(ui, correlation_id, upload_data, file_info)
+            if upload.get('exists'):
+                logging.debug(f'Texture {texture_name} already uploaded')
+                return
+            pending_uploads.append(upload['id'])
+            uploaded = await upload_file(
+                ui,
+                correlation_id,
+                file_info,
+                upload['s3UploadUrl'],
+                upload.get('s3Multipart'),
+            )
+        if not uploaded:
+            raise Exception(f'Failed to send texture {texture_name}')
+        await confirm_upload(correlation_id, upload['id'], skip_post_process=True)
+        pending_uploads.remove(upload['id'])
+
+    await asyncio.gather(*[
+        upload_texture(texture_name)
+        for texture_name in sorted(os.listdir(texture_dir))
+    ])
+
+
+def _relink_images(images: List[bpy.types.Image], texture_path: str):
+    for image in images:
+        if bpy.path.abspath(image.filepath) != texture_path:
+            image.filepath = texture_path
+            image.reload()
+
+
+def _write_response(response: requests.Response, file_path: str):
+    tmp_path = f'{file_path}_tmp'
+    with open(tmp_path, 'wb') as texture_file:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            texture_file.write(chunk)
+    os.replace(tmp_path, file_path)
+
+
+async def _get_download_url(texture_name: str) -> Optional[str]:
+    request = Request()
+    url = paths.get_api_url('textures', texture_name)
+    response = await request.get(url, headers=request.get_headers())
+    if not response.ok:
+        return None
+    return response.json().get('url')
+
+
+async def _download_texture(texture_name: str, semaphore: asyncio.Semaphore):
+    texture_path = os.path.join(paths.get_texture_cache_dir(), texture_name)
+    async with semaphore:
+        download_url = await _get_download_url(texture_name)
+        if download_url is None:
+            logging.error(f'Could not find texture {texture_name}')
+            return
+        loop = asyncio.get_event_loop()
+        response = await loop.run_in_executor(
+            None,
+            functools.partial(requests.get, download_url, stream=True),
+        )
+        if not response.ok:
+            logging.error(f'Failed to download texture {texture_name} ({response.status_code})')
+            return
+        await loop.run_in_executor(None, _write_response, response, texture_path)
+
+    images = get_external_images().get(texture_name, [])
+    _relink_images(images, texture_path)
@@ -7,4 +7,4 @@ from .render_image import ShowRenderImage
 from .run_asset_bar import RunAssetBarWithContext
 from .transfer_data import TransferHana3DData
 from .undo import UndoWithContext
-from .validator import FixOperator, IgnoreOperator, ValidationPanel
+from .validator import FixOperator, IgnoreOperator, RevalidateOperator, ValidationPanel
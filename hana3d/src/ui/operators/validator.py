@@ -1,42 +1,44 @@
 """Shows validation panel before upload."""
 import logging
-from typing import List
 
 import bpy
 from bpy.props import IntProperty
 
+from ...preferences.preferences import Preferences
 from ...unified_props import Unified
 from ...upload.upload import get_upload_props
-from ...validators import BaseValidator, Category, dummy_fix_function
-from ...validators.animated_meshes_check import animated_meshes_check
-from ...validators.animation_count import animation_count
-from ...validators.joint_count import joint_count
-from ...validators.missing_references import missing_references_check
-from ...validators.morph_target_check import morph_target_checker
-from ...validators.object_count import object_count
-from ...validators.square_textures import square_textures
-from ...validators.textures_size import textures_size
-from ...validators.uv_check import uv_checker
-from ...validators.vertex_color_check import vertex_color_checker
+from ...validators import (
+    BaseValidator,
+    Category,
+    dummy_fix_function,
+    run_fixes,
+    run_validators,
+)
+from ...validators.background import BackgroundValidation
+from ...validators.default_validators import validators
 from ....config import HANA3D_DESCRIPTION, HANA3D_NAME, HANA3D_UI
 from ....report_tools import execute_wrapper
 
-validators: List[BaseValidator] = [
-    animated_meshes_check,
-    animation_count,
-    # double_sided,
-    joint_count,
-    # material_count,
-    missing_references_check,
-    morph_target_checker,
-    object_count,
-    # scale_check,
-    square_textures,
-    textures_size,
-    # triangle_count,
-    uv_checker,
-    vertex_color_checker,
-]
+
+def _validate(use_cache: bool):
+    if Preferences().get().background_validation:
+        BackgroundValidation().start(
+            validators,
+            use_cache=use_cache,
+            done_callback=_update_skip_post_process,
+        )
+    else:
+        run_validators(validators, use_cache=use_cache)
+    _update_skip_post_process()
+
+
+def _update_skip_post_process(*args):
+    upload_props = get_upload_props()
+    upload_props.skip_post_process = False
+    for validator in validators:
+        valid, _ = validator.get_validation_result()
+        if not valid and validator.category == Category.error:
+            upload_props.skip_post_process = True
 
 
 class IgnoreOperator(bpy.types.Operator):
@@ -86,8 +88,20 @@ class FixOperator(bpy.types.Operator):  # noqa: WPS338, WPS214
             logging.info(f'Fixing validator {validator.name}')
         else:
             logging.info('Fixing all validators')
-            for validator in validators:  # noqa: WPS440
-                validator.run_fix()
+            run_fixes(validators)
+        return {'FINISHED'}
+
+
+class RevalidateOperator(bpy.types.Operator):
+    """Run all validators again, ignoring cached results."""
+
+    bl_idname = f'message.{HANA3D_NAME}_validation_revalidate'
+    bl_label = f'{HANA3D_DESCRIPTION} Revalidate All'
+    bl_options = {'REGISTER', 'INTERNAL'}
+
+    def execute(self, context):  # noqa: D102
+        logging.info('Revalidating all validators')
+        _validate(use_cache=False)
         return {'FINISHED'}
 
 
@@ -105,13 +119,7 @@ class ValidationPanel(bpy.types.Operator):  # noqa: WPS338, WPS214
 
     def invoke(self, context, event):  # noqa: D102
         logging.info('Invoking validator')
-        upload_props = get_upload_props()
-        upload_props.skip_post_process = False
-        for validator in validators:
-            validator.run_validation()
-            valid, _ = validator.get_validation_result()
-            if not valid and validator.category == Category.error:
-                upload_props.skip_post_process = True
+        _validate(use_cache=True)
         return context.window_manager.invoke_props_dialog(self, width=900)  # noqa: WPS432
 
     def _get_asset_type_from_ui(self):
@@ -135,14 +143,29 @@ class ValidationPanel(bpy.types.Operator):  # noqa: WPS338, WPS214
             text='Ignore all',
             icon='CANCEL',
         )
+        row.operator(
+            f'message.{HANA3D_NAME}_validation_revalidate',
+            text='Revalidate all',
+            icon='FILE_REFRESH',
+        )
+
+        background = BackgroundValidation()
+        if background.is_running():
+            self.layout.label(text=background.get_status(), icon='TIME')
 
         for index, validator in enumerate(validators):
             valid, message = validator.get_validation_result()
-            if not valid:
+            if background.is_pending(validator):
+                self.layout.label(text=validator.name, icon='TIME')
+            elif not valid:
                 box = self.layout.box()
                 self._draw_overview(box, index, validator)
                 self._draw_report(box, valid, message)
                 error_dict[validator.category] += 1
+            elif validator.metrics is not None:
+                row = self.layout.row()
+                row.label(text=validator.name, icon='CHECKMARK')
+                row.label(text=str(validator.metrics), icon='TIME')
 
         if error_dict[Category.error] > 0:
             self.layout.label(
@@ -152,10 +175,14 @@ class ValidationPanel(bpy.types.Operator):  # noqa: WPS338, WPS214
             self.layout.label(
                 text=f'{error_dict[Category.warning]} warnings detected.',
             )
+        self._draw_slowest()
         self._draw_upload_buttons(context)
 
     def _draw_overview(self, box, index: int, validator: BaseValidator):
-        box.label(text=validator.name)
+        header = box.row()
+        header.label(text=validator.name)
+        if validator.metrics is not None:
+            header.label(text=str(validator.metrics), icon='TIME')
         overview = box.row()
         overview.label(text=validator.category)
         overview.label(text=validator.description)
@@ -176,6 +203,17 @@ class ValidationPanel(bpy.types.Operator):  # noqa: WPS338, WPS214
         )
         ignore.index = index
 
+    def _draw_slowest(self):
+        measured = [
+            validator
+            for validator in validators
+            if validator.metrics is not None and not validator.metrics.cached
+        ]
+        if not measured:
+            return
+        slowest = max(measured, key=lambda validator: validator.metrics.wall_time)
+        self.layout.label(text=f'Slowest check: {slowest.name} ({slowest.metrics})')
+
     def _draw_report(self, box, valid: bool, message: str):
         report = box.row()
         icon = 'CHECKMARK' if valid else 'CANCEL'
@@ -188,6 +226,7 @@ class ValidationPanel(bpy.types.Operator):  # noqa: WPS338, WPS214
         upload_props = get_upload_props()
         row = self.layout.row()
         row.scale_y = 2.0
+        row.enabled = not BackgroundValidation().is_running()
 
         if upload_props.view_id == '' or unified_props.workspace != upload_props.view_workspace:
             optext = f'Upload {asset_type.lower()}'
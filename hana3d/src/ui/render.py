@@ -2,6 +2,7 @@
 import bpy
 from bpy.types import UIList
 
+from ... import render_tools
 from ...config import HANA3D_NAME
 
 
@@ -22,7 +23,8 @@ class RENDER_UL_List(UIList): # noqa N801
         show_image = layout.operator(f'{HANA3D_NAME}.show_image', icon='FULLSCREEN_ENTER')
         show_image.index = item.index
 
-        layout.label(text=item.name, icon_value=item.icon_id)
+        icon_id = render_tools.get_render_icon(data.view_id, item.job_id, item.file_path)
+        layout.label(text=item.name, icon_value=icon_id)
 
         remove_render = layout.operator(f'{HANA3D_NAME}.remove_render', icon='CANCEL', text='')
         remove_render.job_id = item.job_id
@@ -1,12 +1,14 @@
 """Upload assets module."""
 
+import asyncio
+import functools
 import json
 import logging
 import os
 import pathlib
 import tempfile
 import uuid
-from typing import List, Union
+from typing import Awaitable, Callable, List, Set, Union
 
 import bpy
 from bpy.props import BoolProperty, EnumProperty
@@ -21,8 +23,11 @@ from .async_functions import (
     upload_file,
 )
 from .export_data import get_export_data
-from .upload import get_upload_props
+from .manifest import UploadManifest, hash_asset_content, hash_files
+from .pipeline import UploadPipeline
+from .upload import get_upload_props, upload_tasks
 from ..async_loop.async_mixin import AsyncModalOperatorMixin
+from ..textures.textures import TEXTURES_DIR, upload_textures
 from ..ui.main import UI
 from ..unified_props import Unified
 from ... import hana3d_types, paths, render, utils
@@ -82,7 +87,7 @@ class UploadAssetOperator(AsyncModalOperatorMixin, bpy.types.Operator):  # noqa:
         props = get_upload_props()
         return bpy.context.view_layer.objects.active is not None and not props.uploading
 
-    async def async_execute(self, context):  # noqa: WPS217,WPS210
+    async def async_execute(self, context):
         """Upload async execute.
 
         Parameters:
@@ -94,9 +99,29 @@ class UploadAssetOperator(AsyncModalOperatorMixin, bpy.types.Operator):  # noqa:
         ui = UI()
         ui.add_report(text='Preparing upload')
 
-        props, workspace, correlation_id, basename, ext, tempdir = self._get_basic_data()
+        basic_data = self._get_basic_data()
+        props = basic_data[0]
         props.uploading = True
+        props_pointer = props.as_pointer()
+        upload_task = asyncio.current_task()
+        upload_tasks[props_pointer] = upload_task
+        try:
+            return await self._upload(ui, *basic_data)
+        finally:
+            # The pointer may be reused by other props once these are freed
+            if upload_tasks.get(props_pointer) is upload_task:
+                del upload_tasks[props_pointer]  # noqa: WPS420
 
+    async def _upload(  # noqa: WPS211,WPS217,WPS210
+        self,
+        ui: UI,
+        props: hana3d_types.UploadProps,
+        workspace: str,
+        correlation_id: str,
+        basename: str,
+        ext: str,
+        tempdir: str,
+    ):
         upload_set = ['METADATA', 'MAINFILE']
         self._update_props(props, upload_set)
 
@@ -117,6 +142,18 @@ class UploadAssetOperator(AsyncModalOperatorMixin, bpy.types.Operator):  # noqa:
                 props.view_workspace = workspace
                 return {'FINISHED'}
 
+            file_hashes = await hash_files({
+                'thumbnail': export_data['thumbnail_path'] if 'THUMBNAIL' in upload_set else None,
+            })
+            file_hashes['blend'] = hash_asset_content(export_data)
+            manifest = UploadManifest()
+            if self.reupload and manifest.get(props.view_id) == file_hashes:
+                props.uploading = False
+                ui.add_report(text='Files unchanged, uploaded metadata only')
+                props.view_workspace = workspace
+                return {'FINISHED'}
+
+            source_filepath = self._save_blend_file(tempdir, ext, export_data)
             if self.reupload:
                 upload_data['id_parent'] = props.view_id
             props.view_id = str(uuid.uuid4())
@@ -124,7 +161,6 @@ class UploadAssetOperator(AsyncModalOperatorMixin, bpy.types.Operator):  # noqa:
             upload_data['id'] = props.id
             filename = f'{upload_data["viewId"]}.blend'
 
-            source_filepath = self._save_blend_file(tempdir, ext)
             clean_file_path = paths.get_clean_filepath()
             datafile = self._write_json_file(
                 tempdir,
@@ -136,17 +172,20 @@ class UploadAssetOperator(AsyncModalOperatorMixin, bpy.types.Operator):  # noqa:
                 correlation_id,
             )
 
-            await create_blend_file(props, ui, datafile, clean_file_path, filename)
-
             files = self._get_files_info(upload_set, export_data, tempdir, filename)
+            create_blend = functools.partial(
+                create_blend_file, props, ui, datafile, clean_file_path, filename,
+            )
 
             uploaded = await self._upload_files(
-                context, files, correlation_id, upload_data, export_data, props,
+                files, correlation_id, upload_data, props, create_blend, tempdir,
             )
             if not uploaded:
                 props.uploading = False
                 return {'CANCELLED'}
 
+            manifest.set(props.view_id, file_hashes)
+
             if props.remote_thumbnail:
                 self._start_remote_thumbnail(props)
 
@@ -198,17 +237,34 @@ class UploadAssetOperator(AsyncModalOperatorMixin, bpy.types.Operator):  # noqa:
         else:
             props.remote_thumbnail = True
 
-    def _save_blend_file(self, tempdir: Union[str, pathlib.Path], ext: str) -> str:
+    def _save_blend_file(
+        self,
+        tempdir: Union[str, pathlib.Path],
+        ext: str,
+        export_data: dict,
+    ) -> str:
+        # Only the exported datablocks and their dependencies are written, instead of a full
+        # copy of the scene. Paths are made absolute so images can still be packed from the
+        # temporary directory.
         source_filepath = os.path.join(tempdir, f'export_hana3d{ext}')
-        autopack = bpy.data.use_autopack is True
-        if autopack:
-            bpy.ops.file.autopack_toggle()
-        bpy.ops.wm.save_as_mainfile(filepath=source_filepath, compress=False, copy=True)
-        if autopack:
-            bpy.ops.file.autopack_toggle()
+        bpy.data.libraries.write(
+            source_filepath,
+            self._get_export_datablocks(export_data),
+            path_remap='ABSOLUTE',
+            compress=False,
+        )
 
         return source_filepath
 
+    def _get_export_datablocks(self, export_data: dict) -> Set[bpy.types.ID]:
+        if export_data['type'] == 'MODEL':
+            return {bpy.data.objects[name] for name in export_data['models']}
+        elif export_data['type'] == 'SCENE':
+            return {bpy.data.scenes[export_data['scene']]}
+        elif export_data['type'] == 'MATERIAL':
+            return {bpy.data.materials[export_data['material']]}
+        raise Exception(f'Unexpected asset_type={export_data["type"]}')
+
     def _write_json_file(   # noqa: WPS211
         self,
         tempdir: str,
@@ -265,33 +321,73 @@ class UploadAssetOperator(AsyncModalOperatorMixin, bpy.types.Operator):  # noqa:
 
     async def _upload_files(  # noqa: WPS211
         self,
-        context,
         files: list,
         correlation_id: str,
         upload_data: dict,
-        export_data: dict,
         props: hana3d_types.UploadProps,
+        create_blend: Callable[[], Awaitable],
+        tempdir: str,
     ):
+        # The thumbnail is uploaded while the blend file is still being exported,
+        # the blend file and texture uploads wait only for its export.
         ui = UI()
-        upload = {}
+        pending_uploads: List[str] = []
+        pipeline = UploadPipeline()
+        pipeline.add_step('blend_export', create_blend)
+        for file_info in files:
+            depends_on = ['blend_export'] if file_info['type'] == 'blend' else []
+            upload_step = functools.partial(
+                self._upload_file,
+                ui,
+                file_info,
+                correlation_id,
+                upload_data,
+                props,
+                pending_uploads,
+            )
+            pipeline.add_step(f'{file_info["type"]}_upload', upload_step, depends_on)
+        if props.external_textures:
+            texture_dir = os.path.join(tempdir, TEXTURES_DIR)
+            texture_step = functools.partial(
+                upload_textures, correlation_id, upload_data, texture_dir, pending_uploads,
+            )
+            pipeline.add_step('texture_upload', texture_step, ['blend_export'])
+
         try:
-            for file_info in files:
-                upload = await get_upload_url(ui, correlation_id, upload_data, file_info)
-                uploaded = await upload_file(ui, file_info, upload['s3UploadUrl'])
-                if not uploaded:
-                    raise Exception('Failed to send file')
-                if file_info['type'] == 'blend':
-                    skip_post_process = props.skip_post_process
-                    await confirm_upload(correlation_id, upload['id'], skip_post_process)
+            await pipeline.run()
             return True
         except Exception as err:
             logging.error(err)
             ui.add_report(text=str(err))
-            upload_id = upload.get('id')
-            if upload_id is not None:
+            for upload_id in pending_uploads:
                 await cancel_upload(correlation_id, upload_id)
             return False
 
+    async def _upload_file(  # noqa: WPS211
+        self,
+        ui: UI,
+        file_info: dict,
+        correlation_id: str,
+        upload_data: dict,
+        props: hana3d_types.UploadProps,
+        pending_uploads: List[str],
+    ):
+        upload = await get_upload_url(ui, correlation_id, upload_data, file_info)
+        pending_uploads.append(upload['id'])
+        uploaded = await upload_file(
+            ui,
+            correlation_id,
+            file_info,
+            upload['s3UploadUrl'],
+            upload.get('s3Multipart'),
+        )
+        if not uploaded:
+            raise Exception('Failed to send file')
+        if file_info['type'] == 'blend':
+            skip_post_process = props.skip_post_process
+            await confirm_upload(correlation_id, upload['id'], skip_post_process)
+        pending_uploads.remove(upload['id'])
+
     def _start_remote_thumbnail(self, props: hana3d_types.UploadProps):
         thread = render.RenderThread(
             props,
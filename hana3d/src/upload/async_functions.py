@@ -1,21 +1,22 @@
 """Auxiliary upload async functions."""
+import functools
 import json
 import logging
 import os
 import subprocess  # noqa: S404
-import time
-from typing import Set, Union
+from typing import Optional, Set, Union
 
-import bpy
 import requests
 
+from .multipart import PART_SIZE, MultipartUpload, get_resumable_upload_id, retry_with_backoff
 from ..requests_async.requests_async import Request, UploadInChunks
-from ..subprocess_async.subprocess_async import Subprocess  # noqa: S404
 from ..ui.main import UI
+from ..worker_pool.worker_pool import run_blender_script
 from ... import hana3d_types, paths
 from ...config import HANA3D_NAME
 
 CHUNK_SIZE = 1024 * 1024 * 2
+CREATE_BLEND_TIMEOUT = 30 * 60
 
 
 async def create_asset(
@@ -86,25 +87,15 @@ async def create_blend_file(
         Subprocess output
     """
     ui.add_report(text='Creating upload file')
-    binary_path = bpy.app.binary_path
     script_path = os.path.dirname(os.path.realpath(__file__))
 
-    cmd = [
-        binary_path,
-        '--background',
-        '-noaudio',
+    output = await run_blender_script(
         clean_file_path,
-        '--python',
         os.path.join(script_path, 'upload_bg.py'),
-        '--',
-        datafile,
-        HANA3D_NAME,
-        filename,
-    ]
-
-    blender_subprocess = Subprocess()
-
-    output = await blender_subprocess.subprocess(cmd)
+        [datafile, HANA3D_NAME, filename],
+        timeout=CREATE_BLEND_TIMEOUT,
+        progress_callback=ui.add_report,
+    )
     ui.add_report(text='Created upload file')
     return output
 
@@ -139,6 +130,12 @@ async def get_upload_url(
         'comment': file_info['publish_message'],
     }
     upload_info['workspace'] = upload_data.get('workspace')
+    resume_upload_id = get_resumable_upload_id(
+        file_info['file_path'],
+        paths.get_temp_dir('uploads'),
+    )
+    if resume_upload_id is not None:
+        upload_info['multipartUploadId'] = resume_upload_id
     if file_info['type'] == 'blend':
         upload_info['viewId'] = upload_data.get('viewId')
         upload_info['id_parent'] = upload_data.get('id_parent')
@@ -148,38 +145,71 @@ async def get_upload_url(
     return response.json()
 
 
-async def upload_file(ui: UI, file_info: dict, upload_url: str) -> bool:
+async def upload_file(
+    ui: UI,
+    correlation_id: str,
+    file_info: dict,
+    upload_url: str,
+    multipart: Optional[dict] = None,
+) -> bool:
     """Upload file.
 
+    When the backend returns multipart upload info the file is sent in parallel parts
+    that can be resumed, otherwise it is streamed with a single PUT request.
+
     Arguments:
         ui: UI object
+        correlation_id: Correlation ID
         file_info: File information
         upload_url: URL to send PUT request
+        multipart: Multipart upload info (uploadId, partUrls, partSize and completeUrl)
 
     Returns:
         bool: if upload was successful
     """
     ui.add_report(text='Uploading file')
+    try:
+        if multipart:
+            await _upload_multipart(ui, correlation_id, file_info, multipart)
+        else:
+            await retry_with_backoff(functools.partial(_upload_single, file_info, upload_url))
+    except Exception as error:
+        logging.error(f'Failed to upload {file_info["file_path"]}: {error}')
+        return False
+    return True
+
+
+async def _upload_single(file_info: dict, upload_url: str):
     request = Request()
-    uploaded = False
-    for index in range(0, 5):
-        if not uploaded:
-            try:
-                upload_response = await request.put(
-                    upload_url,
-                    data=UploadInChunks(file_info['file_path'], CHUNK_SIZE, file_info['type']),
-                    stream=True,
-                )
-
-                if upload_response.status_code == 200:  # noqa: WPS432
-                    uploaded = True
-                else:
-                    logging.error(upload_response.text)
-            except Exception as error:
-                logging.error(f'{index}: {error}')
-                time.sleep(1)
-
-    return uploaded
+    upload_response = await request.put(
+        upload_url,
+        data=UploadInChunks(file_info['file_path'], CHUNK_SIZE, file_info['type']),
+        stream=True,
+    )
+    if upload_response.status_code != 200:  # noqa: WPS432
+        raise Exception(upload_response.text)
+
+
+async def _upload_multipart(ui: UI, correlation_id: str, file_info: dict, multipart: dict):
+    def report_progress(progress: float):  # noqa: WPS430
+        ui.add_report(text=f'Uploading {file_info["type"]}: {progress:.0%}')
+
+    multipart_upload = MultipartUpload(
+        file_info['file_path'],
+        multipart['uploadId'],
+        multipart['partUrls'],
+        paths.get_temp_dir('uploads'),
+        part_size=multipart.get('partSize', PART_SIZE),
+        progress_callback=report_progress,
+    )
+    parts = await multipart_upload.upload()
+
+    request = Request()
+    headers = request.get_headers(correlation_id)
+    complete_data = {'uploadId': multipart['uploadId'], 'parts': parts}
+    response = await request.post(multipart['completeUrl'], json=complete_data, headers=headers)
+    if not response.ok:
+        raise Exception(f'Could not complete multipart upload: {response.text}')
 
 
 async def cancel_upload(   # noqa: WPS210
@@ -227,7 +257,7 @@ async def confirm_upload(   # noqa: WPS210
     upload_response = await request.post(upload_done_url, headers=headers)
 
     dict_response = upload_response.json()
-    if isinstance(dict_response, dict):
+    if isinstance(dict_response, dict) and not skip_post_process:
         tempdir = paths.get_temp_dir()
         json_filepath = os.path.join(tempdir, 'post_process.json')
         with open(json_filepath, 'w') as json_file:
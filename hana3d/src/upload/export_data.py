@@ -55,6 +55,7 @@ def get_export_data(props: hana3d_types.UploadProps) -> Tuple[dict, dict]:
     upload_data['libraries'] = get_libraries(props)
 
     export_data['publish_message'] = props.publish_message
+    export_data['external_textures'] = props.external_textures
 
     return export_data, upload_data
 
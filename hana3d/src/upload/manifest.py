@@ -0,0 +1,135 @@
+"""Local record of the files sent by the last successful upload of each view."""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+import bpy
+
+from ..autothumb.cache import get_fingerprint
+from ... import paths
+
+HASH_CHUNK_SIZE = 1024 * 1024
+MAX_ENTRIES = 500
+MANIFEST_FILENAME = 'upload_manifest.json'
+
+
+def hash_file(file_path: str) -> str:
+    """Compute SHA-256 of a file reading it in chunks.
+
+    Parameters:
+        file_path: path of the file
+
+    Returns:
+        str: hex digest
+    """
+    file_hash = hashlib.sha256()
+    with open(file_path, 'rb') as opened_file:
+        for chunk in iter(lambda: opened_file.read(HASH_CHUNK_SIZE), b''):
+            file_hash.update(chunk)
+    return file_hash.hexdigest()
+
+
+def hash_asset_content(export_data: dict) -> str:
+    """Fingerprint the datablocks of an asset, leaving out the addon props and volatile data.
+
+    Unlike the hash of the written blend file, it does not change when only metadata
+    like name or tags is edited, or when a new view_id is assigned.
+
+    Parameters:
+        export_data: dict containing objects to be uploaded info
+
+    Returns:
+        str: hex digest
+    """
+    asset_type = export_data['type']
+    objects: List[bpy.types.Object] = []
+    materials: List[bpy.types.Material] = []
+    if asset_type == 'MODEL':
+        objects = [bpy.data.objects[name] for name in export_data['models']]
+    elif asset_type == 'SCENE':
+        objects = list(bpy.data.scenes[export_data['scene']].objects)
+    elif asset_type == 'MATERIAL':
+        materials = [bpy.data.materials[export_data['material']]]
+    return get_fingerprint(objects, materials)
+
+
+async def hash_files(file_paths: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    """Hash files concurrently in the executor so Blender is not blocked.
+
+    Parameters:
+        file_paths: file path by file type, None for files that are not uploaded
+
+    Returns:
+        Dict[str, Optional[str]]: hex digest by file type
+    """
+    loop = asyncio.get_event_loop()
+    existing = {
+        file_type: file_path
+        for file_type, file_path in file_paths.items()
+        if file_path is not None
+    }
+    digests = await asyncio.gather(*[
+        loop.run_in_executor(None, hash_file, file_path)
+        for file_path in existing.values()
+    ])
+    file_hashes: Dict[str, Optional[str]] = dict.fromkeys(file_paths)
+    file_hashes.update(zip(existing.keys(), digests))
+    return file_hashes
+
+
+class UploadManifest(object):
+    """Content hashes of the files sent by the last successful upload, by view_id."""
+
+    def __init__(self, manifest_path: Optional[str] = None):
+        """Create an UploadManifest object.
+
+        Parameters:
+            manifest_path: JSON file where the manifest is kept, defaults to the uploads temp dir
+        """
+        if manifest_path is None:
+            manifest_path = os.path.join(paths.get_temp_dir('uploads'), MANIFEST_FILENAME)
+        self.manifest_path = manifest_path
+
+    def get(self, view_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """Get hashes of the files last uploaded for view_id.
+
+        Parameters:
+            view_id: ID of the asset view
+
+        Returns:
+            Optional[Dict[str, Optional[str]]]: hex digest by file type, None if view is unknown
+        """
+        if not view_id:
+            return None
+        return self._load().get(view_id)
+
+    def set(self, view_id: str, file_hashes: Dict[str, Optional[str]]):  # noqa: WPS125
+        """Record hashes of the files uploaded for view_id.
+
+        Parameters:
+            view_id: ID of the asset view
+            file_hashes: hex digest by file type
+        """
+        manifest = self._load()
+        manifest.pop(view_id, None)
+        manifest[view_id] = file_hashes
+        while len(manifest) > MAX_ENTRIES:
+            manifest.pop(next(iter(manifest)))
+
+        tmp_path = f'{self.manifest_path}.tmp'
+        with open(tmp_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _load(self) -> dict:
+        if not os.path.exists(self.manifest_path):
+            return {}
+        try:
+            with open(self.manifest_path, 'r') as manifest_file:
+                return json.load(manifest_file)
+        except (OSError, ValueError) as error:
+            logging.warning(f'Ignoring corrupted upload manifest {self.manifest_path}: {error}')
+            return {}
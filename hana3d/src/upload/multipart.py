@@ -0,0 +1,238 @@
+"""Parallel multipart upload with resume."""
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, List, Optional
+
+from ..requests_async.requests_async import Request
+
+PART_SIZE = 8 * 1024 * 1024
+MAX_CONCURRENT_PARTS = 4
+MAX_RETRIES = 5
+BACKOFF_BASE = 1
+BACKOFF_MAX = 30
+
+
+@dataclass
+class PartState(object):
+    """State of a single part of a multipart upload."""
+
+    part_number: int
+    offset: int
+    size: int
+    etag: Optional[str] = None
+
+
+def _read_part(file_path: str, offset: int, size: int) -> bytes:
+    with open(file_path, 'rb') as opened_file:
+        opened_file.seek(offset)
+        return opened_file.read(size)
+
+
+async def retry_with_backoff(
+    function: Callable,
+    retries: int = MAX_RETRIES,
+    backoff_base: float = BACKOFF_BASE,
+    backoff_max: float = BACKOFF_MAX,
+):
+    """Await function until it succeeds, sleeping exponentially longer between attempts.
+
+    Parameters:
+        function: coroutine function without arguments
+        retries: maximum number of attempts
+        backoff_base: seconds to wait after the first failure
+        backoff_max: maximum seconds to wait between attempts
+
+    Returns:
+        Result of function
+
+    Raises:
+        Exception: last error raised by function
+    """
+    for attempt in range(retries):
+        try:
+            return await function()
+        except Exception as error:
+            if attempt == retries - 1:
+                raise error
+            delay = min(backoff_base * 2 ** attempt, backoff_max)
+            logging.warning(f'Attempt {attempt + 1} failed ({error}), retrying in {delay}s')
+            await asyncio.sleep(delay)
+
+
+def get_state_path(file_path: str, state_dir: str) -> str:
+    """Get the resume state file of a file, which is the same while the file is unchanged.
+
+    Parameters:
+        file_path: path of the file to be uploaded
+        state_dir: directory where the resume state is stored
+
+    Returns:
+        str: path of the state file
+    """
+    stat = os.stat(file_path)
+    key = f'{os.path.abspath(file_path)}:{stat.st_size}:{stat.st_mtime}'
+    state_name = hashlib.sha1(key.encode()).hexdigest()  # noqa: S303
+    return os.path.join(state_dir, f'{state_name}.json')
+
+
+def get_resumable_upload_id(file_path: str, state_dir: str) -> Optional[str]:
+    """Get the multipart upload of a file that was interrupted, so the storage can resume it.
+
+    Parameters:
+        file_path: path of the file to be uploaded
+        state_dir: directory where the resume state is stored
+
+    Returns:
+        Optional[str]: ID of the multipart upload, None if there is nothing to resume
+    """
+    try:
+        with open(get_state_path(file_path, state_dir), 'r') as state_file:
+            return json.load(state_file).get('upload_id')
+    except (OSError, ValueError):
+        return None
+
+
+class MultipartUpload(object):  # noqa: WPS214
+    """Upload file in parts concurrently, persisting finished parts so it can be resumed."""
+
+    def __init__(  # noqa: WPS211
+        self,
+        file_path: str,
+        upload_id: str,
+        part_urls: List[str],
+        state_dir: str,
+        part_size: int = PART_SIZE,
+        max_concurrent_parts: int = MAX_CONCURRENT_PARTS,
+        progress_callback: Optional[Callable[[float], None]] = None,
+    ):
+        """Create a MultipartUpload object.
+
+        Parameters:
+            file_path: path of the file to be uploaded
+            upload_id: ID of the multipart upload on the storage
+            part_urls: presigned URLs, one for each part
+            state_dir: directory where the resume state is stored
+            part_size: size of each part in bytes (the last one may be smaller)
+            max_concurrent_parts: maximum number of parts being sent at the same time
+            progress_callback: called with the uploaded fraction whenever a part finishes
+
+        Raises:
+            ValueError: number of part URLs does not match the file size
+        """
+        self.file_path = file_path
+        self.upload_id = upload_id
+        self.part_urls = part_urls
+        self.part_size = part_size
+        self.max_concurrent_parts = max_concurrent_parts
+        self.progress_callback = progress_callback
+        self.file_size = os.path.getsize(file_path)
+        self.state_path = get_state_path(file_path, state_dir)
+
+        part_count = max(1, -(-self.file_size // part_size))
+        if part_count != len(part_urls):
+            raise ValueError(f'Expected {part_count} part URLs, got {len(part_urls)}')
+
+        self.parts = self._load_state() or [
+            PartState(
+                part_number=index + 1,
+                offset=index * part_size,
+                size=min(part_size, self.file_size - index * part_size),
+            )
+            for index in range(part_count)
+        ]
+
+    @property
+    def uploaded_bytes(self) -> int:
+        """Bytes already confirmed by the storage.
+
+        Returns:
+            int: uploaded bytes
+        """
+        return sum(part.size for part in self.parts if part.etag is not None)
+
+    async def upload(self) -> List[Dict]:
+        """Upload all missing parts.
+
+        Returns:
+            List[Dict]: PartNumber and ETag of every part, to complete the upload
+
+        Raises:
+            Exception: a part could not be sent after all retries
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrent_parts)
+        pending = [part for part in self.parts if part.etag is None]
+        if len(pending) < len(self.parts):
+            logging.info(f'Resuming upload of {self.file_path}: {len(pending)} parts left')
+
+        tasks = [asyncio.ensure_future(self._upload_part(part, semaphore)) for part in pending]
+        if tasks:
+            done, running = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            failed = [task for task in done if task.exception() is not None]
+            if failed:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
+                raise failed[0].exception()  # type: ignore
+        self.clear_state()
+        return [{'PartNumber': part.part_number, 'ETag': part.etag} for part in self.parts]
+
+    def clear_state(self):
+        """Remove persisted state of this upload."""
+        if os.path.exists(self.state_path):
+            os.remove(self.state_path)
+
+    async def _upload_part(self, part: PartState, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            etag = await retry_with_backoff(functools.partial(self._send_part, part))
+        part.etag = etag
+        self._save_state()
+        if self.progress_callback is not None:
+            self.progress_callback(self.uploaded_bytes / max(self.file_size, 1))
+
+    async def _send_part(self, part: PartState) -> str:
+        loop = asyncio.get_event_loop()
+        part_data = await loop.run_in_executor(
+            None,
+            _read_part,
+            self.file_path,
+            part.offset,
+            part.size,
+        )
+        request = Request()
+        response = await request.put(self.part_urls[part.part_number - 1], data=part_data)
+        if not response.ok:
+            raise Exception(f'Part {part.part_number} failed ({response.status_code})')
+        return response.headers.get('ETag', '').strip('"')
+
+    def _load_state(self) -> Optional[List[PartState]]:
+        if not os.path.exists(self.state_path):
+            return None
+        try:
+            with open(self.state_path, 'r') as state_file:
+                state = json.load(state_file)
+        except (OSError, ValueError) as error:
+            logging.warning(f'Ignoring corrupted upload state {self.state_path}: {error}')
+            return None
+        if state.get('upload_id') != self.upload_id:
+            logging.info(f'Upload {state.get("upload_id")} of {self.file_path} expired, restarting')
+            return None
+        if state.get('part_size') != self.part_size:
+            return None
+        return [PartState(**part) for part in state['parts']]
+
+    def _save_state(self):
+        state = {
+            'upload_id': self.upload_id,
+            'file_path': self.file_path,
+            'part_size': self.part_size,
+            'parts': [asdict(part) for part in self.parts],
+        }
+        tmp_path = f'{self.state_path}.tmp'
+        with open(tmp_path, 'w') as state_file:
+            json.dump(state, state_file)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,67 @@
+"""Dependency graph of async upload steps."""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Iterable, List
+
+
+class UploadPipeline(object):
+    """Run async steps as soon as the steps they depend on are finished.
+
+    Independent steps run concurrently, so the pipeline takes as long as its slowest path.
+    """
+
+    def __init__(self):
+        """Create an empty UploadPipeline."""
+        self._steps: Dict[str, Callable[[], Awaitable]] = {}
+        self._dependencies: Dict[str, List[str]] = {}
+
+    def add_step(self, name: str, step: Callable[[], Awaitable], depends_on: Iterable[str] = ()):
+        """Add a step to the pipeline.
+
+        Parameters:
+            name: unique name of the step
+            step: coroutine function without arguments
+            depends_on: names of the steps that must finish before this one starts
+
+        Raises:
+            ValueError: step already added or dependency unknown
+        """
+        if name in self._steps:
+            raise ValueError(f'Step {name} already added')
+        for dependency in depends_on:
+            if dependency not in self._steps:
+                raise ValueError(f'Unknown dependency {dependency} for step {name}')
+        self._steps[name] = step
+        self._dependencies[name] = list(depends_on)
+
+    async def run(self) -> dict:
+        """Run all steps, cancelling the remaining ones if any step fails.
+
+        Returns:
+            dict: result of each step by name
+        """
+        tasks: Dict[str, asyncio.Future] = {}
+        for name, step in self._steps.items():
+            dependencies = [tasks[dependency] for dependency in self._dependencies[name]]
+            tasks[name] = asyncio.ensure_future(self._run_step(name, step, dependencies))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except Exception:
+            for task in tasks.values():
+                task.cancel()
+            raise
+        return {name: task.result() for name, task in tasks.items()}
+
+    async def _run_step(
+        self,
+        name: str,
+        step: Callable[[], Awaitable],
+        dependencies: List[asyncio.Future],
+    ):
+        if dependencies:
+            await asyncio.gather(*dependencies)
+        logging.debug(f'Starting upload step {name}')
+        step_result = await step()
+        logging.debug(f'Finished upload step {name}')
+        return step_result
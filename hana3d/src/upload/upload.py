@@ -1,10 +1,15 @@
 """Upload functions."""
+import asyncio
+from typing import Dict
+
 import bpy
 
 from ..asset.asset_type import AssetType
 from ... import utils
 from ...config import HANA3D_ASSET, HANA3D_NAME
 
+upload_tasks: Dict[int, asyncio.Future] = {}
+
 
 def get_upload_props():
     """Get upload props of the active asset.
@@ -51,3 +56,14 @@ def get_upload_props_by_view_id(asset_type: AssetType, view_id: str):
         return None
 
     return getattr(assets[0], HANA3D_NAME)
+
+
+def cancel_upload_task(props):
+    """Cancel the running upload of an asset, killing its background processes.
+
+    Parameters:
+        props: upload props of the asset
+    """
+    task = upload_tasks.pop(props.as_pointer(), None)
+    if task is not None and not task.done():
+        task.cancel()
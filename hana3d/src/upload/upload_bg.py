@@ -1,4 +1,5 @@
 """Blender script to create blend file to upload."""
+import hashlib
 import json
 import logging
 import os
@@ -14,6 +15,8 @@ HANA3D_EXPORT_DATA = sys.argv[-3]
 module = import_module(HANA3D_NAME)
 append_link = module.append_link    # type: ignore
 utils = module.utils    # type: ignore
+bg_blender = module.bg_blender    # type: ignore
+textures = import_module(f'{HANA3D_NAME}.src.textures.textures')
 
 
 def _get_parent_object():
@@ -48,6 +51,26 @@ def _fix_objects_origin(objects_group, coll):
     _set_origin_zero(coll)
 
 
+def _externalize_textures(texture_dir: str):
+    # Packed image files are written once, named by the hash of their content,
+    # and removed from the blend. The image keeps the name in a custom property
+    # so the file can be found in the texture cache when the asset is downloaded.
+    os.makedirs(texture_dir, exist_ok=True)
+    for image in bpy.data.images:
+        if image.source != 'FILE' or image.packed_file is None:
+            continue
+        image_data = image.packed_file.data
+        ext = os.path.splitext(image.filepath)[1] or '.png'
+        texture_name = f'{hashlib.sha256(image_data).hexdigest()}{ext.lower()}'
+        texture_path = os.path.join(texture_dir, texture_name)
+        if not os.path.exists(texture_path):
+            with open(texture_path, 'wb') as texture_file:
+                texture_file.write(image_data)
+        image[textures.TEXTURE_PROP] = texture_name
+        image.filepath = f'//{textures.TEXTURES_DIR}/{texture_name}'
+        image.unpack(method='REMOVE')
+
+
 if __name__ == '__main__':
     try:
         with open(HANA3D_EXPORT_DATA, 'r') as opened_file:
@@ -57,6 +80,7 @@ if __name__ == '__main__':
         upload_data = data_file['upload_data']
         correlation_id = data_file['correlation_id']
 
+        bg_blender.progress('appending asset')
         bpy.data.scenes.new('upload')
         for scene in bpy.data.scenes:
             if scene.name != 'upload':
@@ -89,8 +113,12 @@ if __name__ == '__main__':
                 matname=matname,
             )
 
+        bg_blender.progress('packing files')
         bpy.ops.file.pack_all()
+        if export_data.get('external_textures'):
+            _externalize_textures(os.path.join(data_file['temp_dir'], textures.TEXTURES_DIR))
 
+        bg_blender.progress('saving upload file')
         fpath = os.path.join(data_file['temp_dir'], FILENAME)
 
         bpy.ops.wm.save_as_mainfile(filepath=fpath, compress=True, copy=False)
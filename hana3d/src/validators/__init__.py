@@ -1,14 +1,21 @@
 """Upload validation module."""
+import asyncio
+import functools
 import logging
+import time
 from enum import Enum
-from typing import Callable, Optional, Tuple
+from typing import Callable, Iterable, Optional, Tuple
 
-from ..asset.asset_type import AssetType
+from .metrics import ValidationMetrics, ValidatorMetrics, count_datablocks, get_peak_memory
+from .scene_index import SceneIndex, build_scene_index
+from .validation_cache import ValidationCache, get_datablocks
 from ..ui import colors
 from ..ui.main import UI
 from ..upload.export_data import get_export_data
 from ..upload.upload import get_upload_props
 
+FIX_RUNNING_MESSAGE = 'Fix running in background'
+
 
 class Category(str, Enum):  # noqa : WPS600
     """Category enum class (WARNING | ERROR)."""
@@ -16,24 +23,22 @@ class Category(str, Enum):  # noqa : WPS600
     error = 'ERROR'
 
 
-def dummy_fix_function(asset_type: AssetType, export_data: dict):
+def dummy_fix_function(index: SceneIndex):
     """Fix validation error.
 
     Parameters:
-        asset_type: type of the asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Does nothing.
     """
     pass  # noqa: WPS420
 
 
-def dummy_validation_function(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def dummy_validation_function(index: SceneIndex) -> Tuple[bool, str]:
     """Check if validator passes test.
 
     Parameters:
-        asset_type: type of the asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: whether check passed and a report message
@@ -48,8 +53,10 @@ class BaseValidator(object):
     category: Category
     description: str
     validation_result: Tuple[bool, str]
-    validation_function: Callable[[AssetType, dict], Tuple[bool, str]]
-    fix_function: Callable[[AssetType, dict], None]
+    metrics: Optional[ValidatorMetrics]
+    reads: Optional[Tuple[str, ...]]
+    validation_function: Callable[[SceneIndex], Tuple[bool, str]]
+    fix_function: Callable[[SceneIndex], Optional[asyncio.Future]]
 
     def __init__(  # noqa: WPS211
         self,
@@ -58,6 +65,7 @@ class BaseValidator(object):
         description: str,
         validation_function: Callable = dummy_validation_function,
         fix_function: Callable = dummy_fix_function,
+        reads: Optional[Tuple[str, ...]] = None,
     ):
         """Check if validator passes test.
 
@@ -66,14 +74,19 @@ class BaseValidator(object):
             category: one of 'WARNING' or 'ERROR'
             description: short description of what is begin checked
             validation_function: function that checks for issues - returns a boolean and a message
-            fix_function: function that automatically corrects issues
+            fix_function: function that automatically corrects issues, may return a task
+                when the fix continues in the background
+            reads: fields of the SceneIndex the validation depends on, None if it also reads
+                data outside of the index and its result can not be cached
         """
         self.name = name
         self.category = category
         self.description = description
         self.validation_function = validation_function  # type: ignore
         self.fix_function = fix_function  # type: ignore
+        self.reads = reads
         self.validation_result = (False, 'Validation has yet to be run')
+        self.metrics = None
 
     def get_validation_result(self) -> Tuple[bool, str]:
         """Get validation result.
@@ -83,30 +96,154 @@ class BaseValidator(object):
         """
         return self.validation_result
 
-    def run_validation(self, export_data: Optional[dict] = None):
-        """Run checks for this validator."""
-        props = get_upload_props()
-        if not export_data:
-            export_data, _ = get_export_data(props)
-        asset_type = export_data['type'].lower()
-        logging.info(f'Export data: {export_data}')
-        self.validation_result = self.validation_function(asset_type, export_data)  # type: ignore
-
-    def run_fix(self, export_data: Optional[dict] = None):
-        """Run fix function for this validator."""
-        props = get_upload_props()
-        if not export_data:
-            export_data, _ = get_export_data(props)
-        asset_type = export_data['type'].lower()
-        logging.info(f'Export data: {export_data}')
-        self.fix_function(asset_type, export_data)  # type: ignore
-        self.run_validation(export_data)
+    def run_validation(
+        self,
+        export_data: Optional[dict] = None,
+        index: Optional[SceneIndex] = None,
+    ):
+        """Run checks for this validator.
+
+        Parameters:
+            export_data: dict containing objects to be uploaded info, defaults to the upload props
+            index: datablocks of the export set, built from export_data when not given
+        """
+        if index is None:
+            index = get_scene_index(export_data)
+        start_memory = get_peak_memory()
+        start_time = time.perf_counter()
+        self.validation_result = self.validation_function(index)  # type: ignore
+        self.metrics = ValidatorMetrics(
+            wall_time=time.perf_counter() - start_time,
+            new_peak_memory=get_peak_memory() - start_memory,
+            datablocks=count_datablocks(index, self.reads),
+        )
+        ValidationMetrics().add(self.name, self.metrics)
+
+    def run_fix(self, export_data: Optional[dict] = None) -> Optional[asyncio.Future]:
+        """Run fix function for this validator.
+
+        Parameters:
+            export_data: dict containing objects to be uploaded info, defaults to the upload props
+
+        Returns:
+            Optional[asyncio.Future]: task of a fix that continues in the background, the
+                validator runs again when it finishes
+        """
+        index = get_scene_index(export_data)
+        fix_task = self.fix_function(index)  # type: ignore
+        if isinstance(fix_task, asyncio.Future):
+            self.validation_result = (False, FIX_RUNNING_MESSAGE)
+            fix_task.add_done_callback(functools.partial(self._finish_fix, index))
+            return fix_task
+        self._finish_fix(index)
+        return None
+
+    def run_cached_validation(self, index: SceneIndex):
+        """Run checks for this validator, unless nothing it read changed since the last run.
+
+        Parameters:
+            index: datablocks of the export set
+        """
+        cache = ValidationCache()
+        if self.reads is not None:
+            cached_result = cache.get(self.name, index, self.reads)
+            if cached_result is not None:
+                self.set_cached_result(cached_result)
+                return
+        self.run_validation(index=index)
+        if self.reads is not None:
+            cache.store(self.name, index, self.reads, self.validation_result)
+
+    def set_cached_result(self, validation_result: Tuple[bool, str]):
+        """Reuse the result of an earlier run, keeping its metrics.
+
+        Parameters:
+            validation_result: cached result of this validator
+        """
+        self.validation_result = validation_result
+        if self.metrics is not None:
+            self.metrics = self.metrics.as_cached()
+            ValidationMetrics().add(self.name, self.metrics)
+
+    def ignore(self):
+        """Ignore validator result."""
+        self.validation_result = (True, 'Ignored')
+
+    def _finish_fix(self, index: SceneIndex, fix_task: Optional[asyncio.Future] = None):
+        if fix_task is not None and not fix_task.cancelled() and fix_task.exception():
+            logging.error(f'{self.name} fix failed: {fix_task.exception()!r}')
+        self._invalidate_cache(index)
+        self.run_validation(index.export_data)
         if not self.validation_result[0]:
             ui = UI()
             error = f'Could not fix {self.name} automatically'
             ui.add_report(text=error, color=colors.RED)
             logging.error(error)
 
-    def ignore(self):
-        """Ignore validator result."""
-        self.validation_result = (True, 'Ignored')
+    def _invalidate_cache(self, index: SceneIndex):
+        cache = ValidationCache()
+        if self.reads is None:
+            cache.clear()
+        else:
+            cache.invalidate(get_datablocks(index, self.reads))
+
+
+def _get_export_data() -> dict:
+    export_data, _ = get_export_data(get_upload_props())
+    return export_data
+
+
+def get_scene_index(export_data: Optional[dict] = None) -> SceneIndex:
+    """Build the index of the export set.
+
+    Parameters:
+        export_data: dict containing objects to be uploaded info, defaults to the upload props
+
+    Returns:
+        SceneIndex: datablocks of the export set
+    """
+    if not export_data:
+        export_data = _get_export_data()
+    asset_type = export_data['type'].lower()
+    logging.debug(f'Export data: {export_data}')
+    return build_scene_index(asset_type, export_data)
+
+
+def run_validators(
+    validators: Iterable[BaseValidator],
+    export_data: Optional[dict] = None,
+    use_cache: bool = True,
+):
+    """Run many validators over a single index of the export set.
+
+    Parameters:
+        validators: validators to run
+        export_data: dict containing objects to be uploaded info, defaults to the upload props
+        use_cache: reuse results of validators whose datablocks did not change,
+            False to revalidate everything
+    """
+    if not use_cache:
+        ValidationCache().clear()
+    index = get_scene_index(export_data)
+    start = time.perf_counter()
+    for validator in validators:
+        validator.run_cached_validation(index)
+    duration = time.perf_counter() - start
+    metrics = ValidationMetrics()
+    logging.info(f'Validation took {duration:.3f}s, slowest check: {metrics.get_slowest()}')
+    metrics.write_report()
+
+
+def run_fixes(validators: Iterable[BaseValidator], export_data: Optional[dict] = None):
+    """Run the fix function of many validators over the same export set.
+
+    The index is rebuilt after each fix, as fixes may add or remove datablocks.
+
+    Parameters:
+        validators: validators to fix
+        export_data: dict containing objects to be uploaded info, defaults to the upload props
+    """
+    if not export_data:
+        export_data = _get_export_data()
+    for validator in validators:
+        validator.run_fix(export_data)
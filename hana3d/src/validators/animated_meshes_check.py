@@ -1,12 +1,12 @@
 """Animated mesh Validator."""
 
 import logging
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import bpy
 
 from . import BaseValidator, Category
-from ..asset.asset_type import AssetType
+from .scene_index import SceneIndex
 
 
 def _check_armature_parent(blend_object: bpy.types.Object) -> bool:
@@ -25,7 +25,7 @@ def _check_animated(blend_object: bpy.types.Object) -> bool:
     return False
 
 
-def _get_incorrect_animated_meshes(models: List[str]) -> List[str]:
+def _get_incorrect_animated_meshes(models: Iterable[str]) -> List[str]:
     meshes = []
     for model in models:
         blend_object = bpy.data.objects[model]
@@ -34,22 +34,11 @@ def _get_incorrect_animated_meshes(models: List[str]) -> List[str]:
     return meshes
 
 
-def _get_object_list(asset_type: AssetType, export_data: dict):
-    if asset_type == AssetType.model:
-        return export_data.get('models', [])
-    if asset_type == AssetType.scene:
-        scene_name = export_data.get('scene')
-        scene = bpy.data.scenes[scene_name]
-        return scene.objects.keys()
-    return []
-
-
-def check_animated_meshes(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def check_animated_meshes(index: SceneIndex) -> Tuple[bool, str]:
     """Check if animated meshes are parented to ARMATURE object.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: if check passed and a report message
@@ -58,8 +47,7 @@ def check_animated_meshes(asset_type: AssetType, export_data: dict) -> Tuple[boo
     is_valid = True
     message = 'Asset has no animated meshes wrongly parented.'
 
-    object_list = _get_object_list(asset_type, export_data)
-    incorrect_objects = _get_incorrect_animated_meshes(object_list)
+    incorrect_objects = _get_incorrect_animated_meshes(index.objects)
 
     if incorrect_objects:
         message = f'Static meshes parented to armature: {", ".join(incorrect_objects)}'
@@ -71,4 +59,10 @@ def check_animated_meshes(asset_type: AssetType, export_data: dict) -> Tuple[boo
 
 name = 'Animated meshes check'
 description = 'Checks if only animated meshes are parented to armature'
-animated_meshes_check = BaseValidator(name, Category.warning, description, check_animated_meshes)
+animated_meshes_check = BaseValidator(
+    name,
+    Category.warning,
+    description,
+    check_animated_meshes,
+    reads=('objects',),
+)
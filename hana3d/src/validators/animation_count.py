@@ -1,17 +1,17 @@
 """Animation Count Validator."""
 
 import logging
-from typing import List, Tuple
+from typing import Iterable, Tuple
 
 import bpy
 
 from . import BaseValidator, Category
-from ..asset.asset_type import AssetType
+from .scene_index import SceneIndex
 
 MAX_ANIMATION_COUNT = 1
 
 
-def _get_animation_count(object_names: List[str]) -> int:
+def _get_animation_count(object_names: Iterable[str]) -> int:
     objects_with_animation = set()
     for object_name in object_names:
         blend_object = bpy.data.objects[object_name]
@@ -20,29 +20,17 @@ def _get_animation_count(object_names: List[str]) -> int:
     return len(objects_with_animation)
 
 
-def _get_object_list(asset_type: AssetType, export_data: dict):
-    if asset_type == AssetType.model:
-        return export_data.get('models', [])
-    if asset_type == AssetType.scene:
-        scene_name = export_data.get('scene')
-        scene = bpy.data.scenes[scene_name]
-        return scene.objects.keys()
-    return []
-
-
-def check_animation_count(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def check_animation_count(index: SceneIndex) -> Tuple[bool, str]:
     """Check if animation count is less than MAX_ANIMATION_COUNT.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: if check passed and a report message
     """
     logging.info('Running animation count...')
-    object_list = _get_object_list(asset_type, export_data)
-    animation_count = _get_animation_count(object_list)
+    animation_count = _get_animation_count(index.objects)
     message = f'Asset has {animation_count} animations'
 
     logging.info(message)
@@ -51,4 +39,10 @@ def check_animation_count(asset_type: AssetType, export_data: dict) -> Tuple[boo
 
 name = 'Animation Count'
 description = f'Checks if number of animations <= {MAX_ANIMATION_COUNT}'
-animation_count = BaseValidator(name, Category.error, description, check_animation_count)
+animation_count = BaseValidator(
+    name,
+    Category.error,
+    description,
+    check_animation_count,
+    reads=('objects',),
+)
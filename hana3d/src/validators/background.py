@@ -0,0 +1,218 @@
+"""Run validators in a background Blender worker, so large scenes do not freeze the UI."""
+import asyncio
+import functools
+import json
+import logging
+import os
+import uuid
+from typing import Callable, Dict, Iterable, List, Optional
+
+import bpy
+
+from . import BaseValidator, get_scene_index
+from .batch_validate import ADDON_DIR, VALIDATE_SCRIPT
+from .metrics import ValidationMetrics, ValidatorMetrics
+from .scene_index import SceneIndex, build_scene_index
+from .validation_cache import ValidationCache
+from ..async_loop import run_async_function
+from ..asset.asset_type import AssetType
+from ..metaclasses.singleton import Singleton
+from ..worker_pool.worker_pool import run_blender_script
+from ... import paths
+
+SNAPSHOT_SUBDIR = 'validation'
+VALIDATION_TIMEOUT = 600
+VALIDATING = 'validating '
+VALIDATED = 'validated '
+WAITING_MESSAGE = 'Waiting for background validation'
+
+
+def _write_snapshot(index: SceneIndex, snapshot_path: str):
+    export_data = index.export_data
+    if index.asset_type == AssetType.model:
+        datablocks = {bpy.data.objects[object_name] for object_name in index.objects}
+    elif index.asset_type == AssetType.scene:
+        datablocks = {bpy.data.scenes[export_data['scene']]}
+    else:
+        datablocks = {bpy.data.materials[export_data['material']]}
+    bpy.data.libraries.write(
+        snapshot_path,
+        datablocks,
+        path_remap='ABSOLUTE',
+        fake_user=True,
+    )
+
+
+def _redraw():
+    for window in bpy.context.window_manager.windows:
+        for area in window.screen.areas:
+            area.tag_redraw()
+
+
+class BackgroundValidation(object, metaclass=Singleton):
+    """Validation of the export set running in a background Blender worker."""
+
+    def __init__(self):
+        """Create a BackgroundValidation object."""
+        self.task: Optional[asyncio.Future] = None
+        self.current = ''
+        self._pending: Dict[str, BaseValidator] = {}
+        self._total = 0
+
+    def is_running(self) -> bool:
+        """Check if the background validation has not finished yet.
+
+        Returns:
+            bool: True while validators are running in the worker
+        """
+        return self.task is not None and not self.task.done()
+
+    def is_pending(self, validator: BaseValidator) -> bool:
+        """Check if the result of a validator has not arrived yet.
+
+        Parameters:
+            validator: validator to check
+
+        Returns:
+            bool: True if the validator is still waiting for the worker
+        """
+        return self.is_running() and validator.name in self._pending
+
+    def get_status(self) -> str:
+        """Progress of the background validation.
+
+        Returns:
+            str: number of finished checks and the check that is running
+        """
+        done = self._total - len(self._pending)
+        status = f'Validating in background: {done}/{self._total} checks'
+        if self.current:
+            status = f'{status} ({self.current})'
+        return status
+
+    def start(
+        self,
+        validators: Iterable[BaseValidator],
+        export_data: Optional[dict] = None,
+        use_cache: bool = True,
+        done_callback: Optional[Callable] = None,
+    ):
+        """Snapshot the export set and validate it in a background worker.
+
+        Results of validators whose datablocks did not change come from the cache, the
+        others are updated as each check finishes in the worker.
+
+        Parameters:
+            validators: validators to run
+            export_data: dict containing objects to be uploaded info, defaults to the upload props
+            use_cache: reuse results of validators whose datablocks did not change
+            done_callback: called with the task when all validators finished
+        """
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+        cache = ValidationCache()
+        if not use_cache:
+            cache.clear()
+        index = get_scene_index(export_data)
+        self._pending = {}
+        for validator in validators:
+            cached_result = None
+            if validator.reads is not None:
+                cached_result = cache.get(validator.name, index, validator.reads)
+            if cached_result is not None:
+                validator.set_cached_result(cached_result)
+            else:
+                validator.validation_result = (False, WAITING_MESSAGE)
+                self._pending[validator.name] = validator
+        self._total = len(self._pending)
+        self.current = ''
+        if not self._pending:
+            return
+        self.task = run_async_function(
+            self._validate,
+            done_callback,
+            index=index,
+            generation=cache.generation,
+        )
+
+    async def _validate(self, index: SceneIndex, generation: int):
+        snapshot_dir = paths.get_temp_dir(SNAPSHOT_SUBDIR)
+        job_name = str(uuid.uuid4())
+        snapshot_path = os.path.join(snapshot_dir, f'{job_name}.blend')
+        jobs_path = os.path.join(snapshot_dir, f'{job_name}.json')
+        results_path = os.path.join(snapshot_dir, f'{job_name}.jsonl')
+        job = dict(index.export_data)
+        job.update(path=snapshot_path, validators=list(self._pending))
+        try:  # noqa: WPS229
+            _write_snapshot(index, snapshot_path)
+            with open(jobs_path, 'w') as jobs_file:
+                json.dump([job], jobs_file)
+            await run_blender_script(
+                snapshot_path,
+                VALIDATE_SCRIPT,
+                [str(ADDON_DIR.parent), ADDON_DIR.name, jobs_path, results_path],
+                VALIDATION_TIMEOUT,
+                functools.partial(self._on_progress, index, generation),
+            )
+            self._read_results(results_path, index, generation)
+        except asyncio.CancelledError:
+            raise
+        except Exception as error:
+            logging.warning(f'Background validation failed ({error}), validating in Blender')
+        finally:
+            for temp_path in (snapshot_path, jobs_path, results_path):
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+        self._run_remaining(index)
+
+    def _on_progress(self, index: SceneIndex, generation: int, message: str):
+        if message.startswith(VALIDATING):
+            self.current = message[len(VALIDATING):]
+        elif message.startswith(VALIDATED):
+            self._set_result(json.loads(message[len(VALIDATED):]), index, generation)
+        _redraw()
+
+    def _set_result(self, validator_result: dict, index: SceneIndex, generation: int):
+        validator = self._pending.pop(validator_result['name'], None)
+        if validator is None:
+            return
+        validator.validation_result = (validator_result['valid'], validator_result['message'])
+        if 'metrics' not in validator_result:
+            # The validator crashed in the worker
+            return
+        validator.metrics = ValidatorMetrics(**validator_result['metrics'])
+        ValidationMetrics().add(validator.name, validator.metrics)
+        if validator.reads is not None:
+            # The snapshot was written from index, the cache drops the result if the
+            # datablocks it read changed since then
+            ValidationCache().store(
+                validator.name,
+                index,
+                validator.reads,
+                validator.validation_result,
+                since=generation,
+            )
+
+    def _read_results(self, results_path: str, index: SceneIndex, generation: int):
+        if not os.path.exists(results_path):
+            return
+        with open(results_path, 'r') as results_file:
+            file_results = [json.loads(line) for line in results_file if line.strip()]
+        for file_result in file_results:
+            if 'error' in file_result:
+                logging.warning(f'Background validation error: {file_result["error"]}')
+            for validator_result in file_result['validators']:
+                self._set_result(validator_result, index, generation)
+
+    def _run_remaining(self, index: SceneIndex):
+        remaining: List[BaseValidator] = list(self._pending.values())
+        if remaining:
+            # The scene may have changed while the worker was running
+            index = build_scene_index(index.asset_type, index.export_data)
+        for validator in remaining:
+            self.current = validator.name
+            validator.run_cached_validation(index)
+            self._pending.pop(validator.name, None)
+        self.current = ''
+        ValidationMetrics().write_report()
+        _redraw()
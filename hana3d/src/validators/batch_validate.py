@@ -0,0 +1,313 @@
+"""Validate many .blend files with background Blender workers.
+
+Runs outside of Blender, against an addon built for a stage, e.g.:
+    python hana3d/src/validators/batch_validate.py --addon path/to/hana3d_production \
+        --json report.json --junit report.xml assets/
+
+Each path is a directory, searched recursively for .blend files, or a JSON manifest with a
+list of files or of objects like {"path": ..., "type": "model", "models": [...]}.
+"""
+import argparse
+import json
+import os
+import subprocess  # noqa: S404
+import sys
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+from xml.etree import ElementTree  # noqa: S405
+
+VALIDATE_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'validate_bg.py')
+ADDON_DIR = Path(os.path.realpath(__file__)).parents[2]
+OUTPUT_TAIL = 2000
+
+
+def _read_manifest(manifest_path: Path, asset_type: str) -> List[dict]:
+    with open(manifest_path, 'r') as manifest_file:
+        entries = json.load(manifest_file)
+    jobs: List[dict] = []
+    for entry in entries:
+        job = {'path': entry} if isinstance(entry, str) else dict(entry)
+        job.setdefault('type', asset_type)
+        job['path'] = str((manifest_path.parent / job['path']).resolve())
+        jobs.append(job)
+    return jobs
+
+
+def collect_jobs(paths: Iterable[str], asset_type: str) -> List[dict]:
+    """List the files to validate.
+
+    Parameters:
+        paths: directories with .blend files or JSON manifests
+        asset_type: asset type of files that do not set one in the manifest
+
+    Returns:
+        List[dict]: path and export data of each file
+    """
+    jobs: List[dict] = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            jobs.extend(
+                {'path': str(blend_file.resolve()), 'type': asset_type}
+                for blend_file in sorted(path.rglob('*.blend'))
+            )
+        else:
+            jobs.extend(_read_manifest(path, asset_type))
+    return jobs
+
+
+def _run_worker(
+    blender: str,
+    addon_dir: Path,
+    jobs: List[dict],
+    timeout: float,
+) -> Tuple[Optional[List[dict]], str]:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        jobs_path = os.path.join(tmp_dir, 'jobs.json')
+        results_path = os.path.join(tmp_dir, 'results.jsonl')
+        with open(jobs_path, 'w') as jobs_file:
+            json.dump(jobs, jobs_file)
+        cmd = [
+            blender,
+            '--background',
+            '--factory-startup',
+            '-noaudio',
+            '--python',
+            VALIDATE_SCRIPT,
+            '--',
+            str(addon_dir.parent),
+            addon_dir.name,
+            jobs_path,
+            results_path,
+        ]
+        try:
+            process = subprocess.run(  # noqa: S603
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=timeout * len(jobs),
+            )
+        except subprocess.TimeoutExpired as timeout_error:
+            output = f'Timed out after {timeout_error.timeout}s'
+        else:
+            output = process.stdout.decode(errors='replace')[-OUTPUT_TAIL:]
+        if not os.path.exists(results_path):
+            # The script creates the results file once the addon is imported
+            return None, output
+        with open(results_path, 'r') as results_file:
+            return [json.loads(line) for line in results_file if line.strip()], output
+
+
+def validate_files(  # noqa: WPS211
+    jobs: List[dict],
+    blender: str,
+    addon_dir: Path,
+    workers: int,
+    files_per_worker: int,
+    timeout: float,
+) -> List[dict]:
+    """Split files between Blender processes and collect the validation results.
+
+    A Blender process that crashes or times out only loses the file it was validating,
+    the rest of its files are given to a new process. When it fails before validating
+    any file, e.g. because the addon can not be imported, all its files fail.
+
+    Parameters:
+        jobs: path and export data of each file
+        blender: path of the Blender executable
+        addon_dir: directory of the addon, named after its stage
+        workers: number of Blender processes running at the same time
+        files_per_worker: files validated by each Blender process before it exits
+        timeout: seconds allowed for each file
+
+    Returns:
+        List[dict]: validation results of each file
+    """
+    file_results: List[dict] = []
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: Dict[Future, List[dict]] = {}
+
+        def submit(chunk: List[dict]):  # noqa: WPS430
+            future = executor.submit(_run_worker, blender, addon_dir, chunk, timeout)
+            pending[future] = chunk
+
+        for start in range(0, len(jobs), files_per_worker):
+            submit(jobs[start:start + files_per_worker])
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = pending.pop(future)
+                chunk_results, output = future.result()
+                if chunk_results is None:
+                    chunk_results = _get_failed_results(
+                        chunk,
+                        f'Blender worker did not start: {output}',
+                    )
+                for file_result in chunk_results:
+                    _print_result(file_result, len(file_results) + 1, len(jobs))
+                    file_results.append(file_result)
+                remaining = chunk[len(chunk_results):]
+                if remaining:
+                    crashed = {
+                        'path': remaining[0]['path'],
+                        'validators': [],
+                        'error': f'Blender worker crashed: {output}',
+                    }
+                    _print_result(crashed, len(file_results) + 1, len(jobs))
+                    file_results.append(crashed)
+                if len(remaining) > 1:
+                    submit(remaining[1:])
+    return sorted(file_results, key=lambda file_result: file_result['path'])
+
+
+def _get_failed_results(jobs: List[dict], error: str) -> List[dict]:
+    return [{'path': job['path'], 'validators': [], 'error': error} for job in jobs]
+
+
+def _count_failures(file_result: dict) -> Dict[str, int]:
+    failures = {'ERROR': 0, 'WARNING': 0}
+    for validator_result in file_result['validators']:
+        if not validator_result['valid']:
+            failures[validator_result['category']] += 1
+    return failures
+
+
+def _print_result(file_result: dict, position: int, total: int):
+    if 'error' in file_result:
+        status = f'failed: {file_result["error"].splitlines()[0]}'
+    else:
+        failures = _count_failures(file_result)
+        status = f'{failures["ERROR"]} errors, {failures["WARNING"]} warnings'
+    print(f'[{position}/{total}] {file_result["path"]}: {status}')  # noqa: WPS421
+
+
+def write_json_report(file_results: List[dict], duration: float, report_path: str):
+    """Write the validation results and timings as JSON.
+
+    Parameters:
+        file_results: validation results of each file
+        duration: seconds taken to validate all files
+        report_path: path of the report
+    """
+    summary = {
+        'files': len(file_results),
+        'crashed': sum('error' in file_result for file_result in file_results),
+        'errors': sum(_count_failures(file_result)['ERROR'] for file_result in file_results),
+        'warnings': sum(_count_failures(file_result)['WARNING'] for file_result in file_results),
+        'duration': duration,
+    }
+    with open(report_path, 'w') as report_file:
+        json.dump({'summary': summary, 'files': file_results}, report_file, indent=2)
+
+
+def write_junit_report(file_results: List[dict], duration: float, report_path: str):
+    """Write the validation results as JUnit XML, one test suite per file.
+
+    Parameters:
+        file_results: validation results of each file
+        duration: seconds taken to validate all files
+        report_path: path of the report
+    """
+    testsuites = ElementTree.Element('testsuites', name='hana3d validation', time=f'{duration:.3f}')
+    for file_result in file_results:
+        testsuite = ElementTree.SubElement(
+            testsuites,
+            'testsuite',
+            name=file_result['path'],
+            tests=str(len(file_result['validators']) or 1),
+            time=f'{file_result.get("time", 0):.3f}',
+        )
+        if 'error' in file_result:
+            testcase = ElementTree.SubElement(testsuite, 'testcase', name='open file')
+            error = ElementTree.SubElement(testcase, 'error', message='Could not validate file')
+            error.text = file_result['error']
+            testsuite.set('errors', '1')
+        failures = 0
+        for validator_result in file_result['validators']:
+            testcase = ElementTree.SubElement(
+                testsuite,
+                'testcase',
+                classname=file_result['path'],
+                name=validator_result['name'],
+                time=f'{validator_result["time"]:.3f}',
+            )
+            if not validator_result['valid']:
+                failures += 1
+                failure = ElementTree.SubElement(
+                    testcase,
+                    'failure',
+                    type=validator_result['category'],
+                    message=validator_result['message'],
+                )
+                failure.text = validator_result['message']
+        testsuite.set('failures', str(failures))
+    ElementTree.ElementTree(testsuites).write(report_path, encoding='utf-8', xml_declaration=True)
+
+
+def _parse_args(argv: List[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run the upload validators on .blend files.')
+    parser.add_argument('paths', nargs='+', help='directories with .blend files or JSON manifests')
+    parser.add_argument('--blender', default='blender', help='path of the Blender executable')
+    parser.add_argument(
+        '--addon',
+        type=Path,
+        default=ADDON_DIR,
+        help='directory of the addon built for a stage, e.g. hana3d_production',
+    )
+    parser.add_argument(
+        '--asset-type',
+        default='scene',
+        choices=('model', 'material', 'scene'),
+        help='asset type of files that do not set one in a manifest',
+    )
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--files-per-worker', type=int, default=20)  # noqa: WPS432
+    parser.add_argument('--timeout', type=float, default=600, help='seconds allowed per file')
+    parser.add_argument('--json', help='path of the JSON report')
+    parser.add_argument('--junit', help='path of the JUnit XML report')
+    return parser.parse_args(argv)
+
+
+def main(argv: List[str]) -> int:
+    """Validate the files and write the reports.
+
+    Parameters:
+        argv: command line arguments
+
+    Returns:
+        int: exit code, 1 if any file has errors or could not be validated
+    """
+    args = _parse_args(argv)
+    if '_' not in args.addon.name:
+        print(f'{args.addon} is not built for a stage, pass --addon hana3d_<stage>')  # noqa: WPS421
+        return 1
+    jobs = collect_jobs(args.paths, args.asset_type)
+    start = time.perf_counter()
+    file_results = validate_files(
+        jobs,
+        args.blender,
+        args.addon.resolve(),
+        max(1, args.workers),
+        max(1, args.files_per_worker),
+        args.timeout,
+    )
+    duration = time.perf_counter() - start
+    if args.json:
+        write_json_report(file_results, duration, args.json)
+    if args.junit:
+        write_junit_report(file_results, duration, args.junit)
+
+    failed = [
+        file_result
+        for file_result in file_results
+        if 'error' in file_result or _count_failures(file_result)['ERROR']
+    ]
+    print(f'{len(file_results) - len(failed)}/{len(file_results)} files passed')  # noqa: WPS421
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,31 @@
+"""Validators run before upload."""
+from typing import List
+
+from . import BaseValidator
+from .animated_meshes_check import animated_meshes_check
+from .animation_count import animation_count
+from .joint_count import joint_count
+from .missing_references import missing_references_check
+from .morph_target_check import morph_target_checker
+from .object_count import object_count
+from .square_textures import square_textures
+from .textures_size import textures_size
+from .uv_check import uv_checker
+from .vertex_color_check import vertex_color_checker
+
+validators: List[BaseValidator] = [
+    animated_meshes_check,
+    animation_count,
+    # double_sided,
+    joint_count,
+    # material_count,
+    missing_references_check,
+    morph_target_checker,
+    object_count,
+    # scale_check,
+    square_textures,
+    textures_size,
+    # triangle_count,
+    uv_checker,
+    vertex_color_checker,
+]
@@ -0,0 +1,168 @@
+"""Timing and resource usage of validator runs.
+
+Measuring a run costs two clock reads and two getrusage calls, so it is always on.
+Memory is the new peak the process reached while the validator ran: the growth of the
+peak resident set size of Blender, which is a high-water mark. It is 0 when the validator
+stays below an earlier peak, even if it allocated a lot, and on platforms without the
+resource module, so it only points at validators that push Blender to new peaks.
+"""
+import json
+import logging
+import sys
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, Iterable, Optional
+
+from .scene_index import SceneIndex
+from ..logs.logger import get_validation_report_file
+from ..metaclasses.singleton import Singleton
+
+INDEX_FIELDS = ('objects', 'materials', 'images')
+MEGABYTE = 1024 * 1024
+MILLISECONDS = 1000
+
+
+def get_peak_memory() -> int:
+    """Get the peak resident set size of the process.
+
+    Returns:
+        int: peak memory in bytes, 0 if it can not be measured
+    """
+    try:
+        import resource  # noqa: WPS433
+    except ImportError:
+        return 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        return max_rss
+    return max_rss * 1024  # noqa: WPS432
+
+
+def count_datablocks(index: SceneIndex, reads: Optional[Iterable[str]]) -> int:
+    """Count the datablocks of the index that a validator visits.
+
+    Parameters:
+        index: datablocks of the asset that will be uploaded
+        reads: fields of the index the validator reads, None if unknown
+
+    Returns:
+        int: number of names in the fields read, or in all fields when unknown
+    """
+    return sum(len(getattr(index, field)) for field in reads or INDEX_FIELDS)
+
+
+@dataclass(frozen=True)
+class ValidatorMetrics:
+    """Resources used by a validator run.
+
+    Attributes:
+        wall_time: seconds taken by the validation function
+        new_peak_memory: growth of the peak memory of the process in bytes, 0 when the run
+            stayed below an earlier peak
+        datablocks: number of datablocks visited
+        cached: True if the result came from the cache and these are from the earlier run
+    """
+
+    wall_time: float
+    new_peak_memory: int
+    datablocks: int
+    cached: bool = False
+
+    def as_cached(self) -> 'ValidatorMetrics':
+        """Mark metrics of a run whose result was reused.
+
+        Returns:
+            ValidatorMetrics: same metrics marked as cached
+        """
+        return replace(self, cached=True)
+
+    def __str__(self) -> str:
+        """Short description for the validation panel.
+
+        Returns:
+            str: time, memory and datablocks of the run
+        """
+        description = f'{self.wall_time * MILLISECONDS:.1f} ms'
+        if self.new_peak_memory:
+            description = f'{description}, new peak +{self.new_peak_memory / MEGABYTE:.1f} MB'
+        description = f'{description}, {self.datablocks} datablocks'
+        if self.cached:
+            description = f'{description}, cached'
+        return description
+
+
+class _Stats(object):
+    def __init__(self):
+        self.runs = 0
+        self.cached_runs = 0
+        self.total_time = 0.0  # noqa: WPS358
+        self.max_time = 0.0  # noqa: WPS358
+        self.max_new_peak_memory = 0
+        self.max_datablocks = 0
+
+    def add(self, metrics: ValidatorMetrics):
+        if metrics.cached:
+            self.cached_runs += 1
+            return
+        self.runs += 1
+        self.total_time += metrics.wall_time
+        self.max_time = max(self.max_time, metrics.wall_time)
+        self.max_new_peak_memory = max(self.max_new_peak_memory, metrics.new_peak_memory)
+        self.max_datablocks = max(self.max_datablocks, metrics.datablocks)
+
+
+class ValidationMetrics(object, metaclass=Singleton):
+    """Metrics of the last run of each validator, aggregated over the session."""
+
+    def __init__(self):
+        """Create a ValidationMetrics object."""
+        self._last: Dict[str, ValidatorMetrics] = {}
+        self._stats: Dict[str, _Stats] = {}
+
+    def add(self, validator_name: str, metrics: ValidatorMetrics):
+        """Record a validator run.
+
+        Parameters:
+            validator_name: name of the validator
+            metrics: resources used by the run
+        """
+        self._last[validator_name] = metrics
+        self._stats.setdefault(validator_name, _Stats()).add(metrics)
+
+    def get_slowest(self) -> Optional[str]:
+        """Get the validator that took longest in its last run.
+
+        Returns:
+            Optional[str]: name of the validator, None if no validator ran
+        """
+        uncached = {
+            validator_name: metrics.wall_time
+            for validator_name, metrics in self._last.items()
+            if not metrics.cached
+        }
+        if not uncached:
+            return None
+        return max(uncached, key=lambda validator_name: uncached[validator_name])
+
+    def write_report(self):
+        """Write the metrics to the log directory, slowest validators first."""
+        validators = sorted(
+            self._stats.items(),
+            key=lambda validator_stats: validator_stats[1].total_time,
+            reverse=True,
+        )
+        report = {
+            'validators': [
+                {'name': validator_name, **vars(stats)}
+                for validator_name, stats in validators
+            ],
+            'last_run': {
+                validator_name: asdict(metrics)
+                for validator_name, metrics in self._last.items()
+            },
+        }
+        try:
+            with open(get_validation_report_file(), 'w') as report_file:
+                json.dump(report, report_file, indent=2)
+        except OSError as error:
+            logging.warning(f'Could not write validation report: {error}')
+
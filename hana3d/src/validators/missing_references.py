@@ -1,71 +1,39 @@
 """Missing references Validator."""
 import logging
-import os
-from contextlib import suppress
-from typing import List, Set, Tuple
+from typing import List, Tuple
 
 import bpy
 
 from . import BaseValidator, Category
-from ..asset.asset_type import AssetType
+from .scene_index import SceneIndex
+from ..textures.image_metadata import is_file_missing
 
 
-def _has_missing_reference(image: bpy.types.Image):
-    if not image.packed_file:
-        path = image.filepath_from_user()
-        return not os.path.exists(path)
-    return False
+def _get_missing_texture_names(index: SceneIndex) -> List[str]:
+    return [
+        image for image in index.images
+        if is_file_missing(bpy.data.images[image])
+    ]
 
 
-def _get_missing_textures_in_material(material: bpy.types.Material) -> Set[str]:
-    textures: Set[str] = set()
-    for node in material.node_tree.nodes:
-        if node.type == 'TEX_IMAGE' and _has_missing_reference(node.image):
-            textures.add(node.image.name)    # noqa: WPS220
-    return textures
-
-
-def _get_missing_textures_in_objects(models: List[str]) -> Set[str]:
-    textures: Set[str] = set()
-    with suppress(AttributeError):
-        for model in models:
-            for mat_slot in bpy.data.objects[model].material_slots:
-                textures = textures.union(_get_missing_textures_in_material(mat_slot.material))
-    return textures
-
-
-def _get_missing_texture_names(asset_type: AssetType, export_data: dict):
-    if asset_type == AssetType.model:
-        return _get_missing_textures_in_objects(export_data.get('models', []))
-    if asset_type == AssetType.scene:
-        scene_name = export_data.get('scene')
-        scene = bpy.data.scenes[scene_name]
-        return _get_missing_textures_in_objects(scene.objects.keys())
-    if asset_type == AssetType.material:
-        material = bpy.data.materials[export_data.get('material')]
-        return _get_missing_textures_in_material(material)
-
-
-def fix_textures_references(asset_type: AssetType, export_data: dict):
+def fix_textures_references(index: SceneIndex):
     """Remove missing textures references.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     """
-    missing_textures = _get_missing_texture_names(asset_type, export_data)
+    missing_textures = _get_missing_texture_names(index)
     for texture_name in missing_textures:
         texture = bpy.data.images[texture_name]
         bpy.data.images.remove(texture)
 
 
-def check_textures_references(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def check_textures_references(index: SceneIndex) -> Tuple[bool, str]:
     """Check if any of the texture references are missing.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: if check passed and a report message
@@ -74,7 +42,7 @@ def check_textures_references(asset_type: AssetType, export_data: dict) -> Tuple
     is_valid = True
     message = 'All referenced textures exist!'
 
-    missing_textures = _get_missing_texture_names(asset_type, export_data)
+    missing_textures = _get_missing_texture_names(index)
     if missing_textures:
         message = f'Textures missing: {", ".join(missing_textures)}'
         is_valid = False
@@ -6,38 +6,24 @@ from typing import List, Tuple
 import bpy
 
 from . import BaseValidator, Category
-from ..asset.asset_type import AssetType
+from .scene_index import SceneIndex
 
 
-def _get_morph_target_meshes(models: List[str]) -> List[str]:
-    meshes = []
-    for model in models:
-        blend_object = bpy.data.objects[model]
-        if blend_object.type == 'MESH' and blend_object.data.shape_keys:
-            meshes.append(model)
-    return meshes
+def _get_incorrect_meshes(index: SceneIndex) -> List[str]:
+    return [
+        mesh for mesh in index.meshes
+        if bpy.data.objects[mesh].data.shape_keys
+    ]
 
 
-def _get_incorrect_meshes(asset_type: AssetType, export_data: dict):
-    if asset_type == AssetType.model:
-        return _get_morph_target_meshes(export_data.get('models', []))
-    if asset_type == AssetType.scene:
-        scene_name = export_data.get('scene')
-        scene = bpy.data.scenes[scene_name]
-        return _get_morph_target_meshes(scene.objects.keys())
-    if asset_type == AssetType.material:
-        return []
-
-
-def fix_morph_target(asset_type: AssetType, export_data: dict):
+def fix_morph_target(index: SceneIndex):
     """Remove all shape keys from export data.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     """
-    meshes = _get_incorrect_meshes(asset_type, export_data)
+    meshes = _get_incorrect_meshes(index)
     view_layer = bpy.context.view_layer
     previous_selection = view_layer.objects.active
     for mesh in meshes:
@@ -46,12 +32,11 @@ def fix_morph_target(asset_type: AssetType, export_data: dict):
     view_layer.objects.active = previous_selection
 
 
-def check_morph_target(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def check_morph_target(index: SceneIndex) -> Tuple[bool, str]:
     """Check for shape keys in all meshes on export data.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: if check passed and a report message
@@ -60,7 +45,7 @@ def check_morph_target(asset_type: AssetType, export_data: dict) -> Tuple[bool,
     is_valid = True
     message = 'All meshes have no shape keys.'
 
-    incorrect_meshes = _get_incorrect_meshes(asset_type, export_data)
+    incorrect_meshes = _get_incorrect_meshes(index)
     if incorrect_meshes:
         message = f'Meshes with shape keys: {", ".join(incorrect_meshes)}'
         is_valid = False
@@ -77,4 +62,5 @@ morph_target_checker = BaseValidator(
     description,
     check_morph_target,
     fix_morph_target,
+    reads=('meshes',),
 )
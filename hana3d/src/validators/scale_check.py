@@ -1,18 +1,18 @@
 """Scale Validator."""
 
 import logging
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import bpy
 from mathutils import Vector
 
 from . import BaseValidator, Category
-from ..asset.asset_type import AssetType
+from .scene_index import SceneIndex
 
 CORRECT_SCALE = Vector([1, 1, 1])
 
 
-def _get_wrongly_scaled_objects(models: List[str]) -> List[str]:
+def _get_wrongly_scaled_objects(models: Iterable[str]) -> List[str]:
     wrong_objects = []
     for model in models:
         blend_object = bpy.data.objects[model]
@@ -21,22 +21,11 @@ def _get_wrongly_scaled_objects(models: List[str]) -> List[str]:
     return wrong_objects
 
 
-def _get_object_list(asset_type: AssetType, export_data: dict):
-    if asset_type == AssetType.model:
-        return export_data.get('models', [])
-    if asset_type == AssetType.scene:
-        scene_name = export_data.get('scene')
-        scene = bpy.data.scenes[scene_name]
-        return scene.objects.keys()
-    return []
-
-
-def check_scale(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def check_scale(index: SceneIndex) -> Tuple[bool, str]:
     """Check if objects have (1,1,1) scale.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: if check passed and a report message
@@ -45,8 +34,7 @@ def check_scale(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
     is_valid = True
     message = 'All objects have (1,1,1) scale.'
 
-    object_list = _get_object_list(asset_type, export_data)
-    incorrect_objects = _get_wrongly_scaled_objects(object_list)
+    incorrect_objects = _get_wrongly_scaled_objects(index.objects)
 
     if incorrect_objects:
         message = f'Objects with wrong scale: {", ".join(incorrect_objects)}'
@@ -56,17 +44,15 @@ def check_scale(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
     return is_valid, message
 
 
-def fix_scale(asset_type: AssetType, export_data: dict):
+def fix_scale(index: SceneIndex):
     """Set all objects scale to (1,1,1).
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
     """
     logging.info('Fixing scale...')
 
-    object_list = _get_object_list(asset_type, export_data)
-    incorrect_objects = _get_wrongly_scaled_objects(object_list)
+    incorrect_objects = _get_wrongly_scaled_objects(index.objects)
 
     view_layer = bpy.context.view_layer
     previous_selection = view_layer.objects.active
@@ -79,4 +65,11 @@ def fix_scale(asset_type: AssetType, export_data: dict):
 
 name = 'Scale check'
 description = 'Checks if objects have (1,1,1) scale'
-scale_check = BaseValidator(name, Category.warning, description, check_scale, fix_scale)
+scale_check = BaseValidator(
+    name,
+    Category.warning,
+    description,
+    check_scale,
+    fix_scale,
+    reads=('objects',),
+)
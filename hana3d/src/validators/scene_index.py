@@ -0,0 +1,94 @@
+"""Index of the datablocks in an export set, shared by all validators of a run."""
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import bpy
+
+from ..asset.asset_type import AssetType
+
+
+@dataclass(frozen=True)
+class SceneIndex:
+    """Names of the datablocks that will be uploaded, collected in a single walk.
+
+    Attributes:
+        asset_type: type of asset that will be uploaded
+        export_data: dict containing objects to be uploaded info
+        objects: names of all exported objects
+        meshes: names of the exported objects of type MESH
+        armatures: names of the exported objects of type ARMATURE
+        object_materials: names of the materials in the object slots
+        materials: names of all exported materials, including the material asset
+        images: names of the images used by image texture nodes of the materials
+    """
+
+    asset_type: str
+    export_data: dict
+    objects: Tuple[str, ...] = ()
+    meshes: Tuple[str, ...] = ()
+    armatures: Tuple[str, ...] = ()
+    object_materials: Tuple[str, ...] = ()
+    materials: Tuple[str, ...] = ()
+    images: Tuple[str, ...] = ()
+
+
+def _get_object_names(asset_type: str, export_data: dict) -> List[str]:
+    if asset_type == AssetType.model:
+        return list(export_data.get('models', []))
+    if asset_type == AssetType.scene:
+        scene = bpy.data.scenes[export_data.get('scene')]
+        return scene.objects.keys()
+    return []
+
+
+def _add_images(material: bpy.types.Material, images: Dict[str, None]):
+    if material.node_tree is None:
+        return
+    for node in material.node_tree.nodes:
+        if node.type == 'TEX_IMAGE' and node.image is not None:
+            images.setdefault(node.image.name)
+
+
+def build_scene_index(asset_type: str, export_data: dict) -> SceneIndex:
+    """Walk objects, material slots and node trees of the export set once.
+
+    Parameters:
+        asset_type: type of asset that will be uploaded
+        export_data: dict containing objects to be uploaded info
+
+    Returns:
+        SceneIndex: datablocks of the export set
+    """
+    objects = _get_object_names(asset_type, export_data)
+    meshes = []
+    armatures = []
+    # dicts keep the first-seen order, which is the order reported to the user
+    object_materials: Dict[str, None] = {}
+    for object_name in objects:
+        blend_object = bpy.data.objects[object_name]
+        if blend_object.type == 'MESH':
+            meshes.append(object_name)
+        elif blend_object.type == 'ARMATURE':
+            armatures.append(object_name)
+        for mat_slot in blend_object.material_slots:
+            if mat_slot.material is not None:
+                object_materials.setdefault(mat_slot.material.name)
+
+    materials = dict(object_materials)
+    if asset_type == AssetType.material:
+        materials.setdefault(export_data['material'])
+
+    images: Dict[str, None] = {}
+    for material_name in materials:
+        _add_images(bpy.data.materials[material_name], images)
+
+    return SceneIndex(
+        asset_type=asset_type,
+        export_data=export_data,
+        objects=tuple(objects),
+        meshes=tuple(meshes),
+        armatures=tuple(armatures),
+        object_materials=tuple(object_materials),
+        materials=tuple(materials),
+        images=tuple(images),
+    )
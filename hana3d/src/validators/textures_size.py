@@ -1,13 +1,14 @@
 """Texture size Validator."""
+import asyncio
 import logging
-import math
-from contextlib import suppress
-from typing import List, Set, Tuple
+from typing import List, Optional, Tuple
 
 import bpy
 
 from . import BaseValidator, Category
-from ..asset.asset_type import AssetType
+from .scene_index import SceneIndex
+from ..textures.image_metadata import get_image_size
+from ..textures.resize import resize_images
 
 MAX_TEXTURE_SIZE = 2048
 
@@ -17,64 +18,40 @@ def _check_potency_of_two(number: int):
 
 
 def _check_wrong_texture_size(image: bpy.types.Image):
-    size = image.size[0]
+    size, _ = get_image_size(image)
     if size > MAX_TEXTURE_SIZE or not _check_potency_of_two(size):
         return True
     return False
 
 
-def _get_large_textures_in_objects(models: List[str]) -> Set[str]:
-    textures: Set[str] = set()
-    with suppress(AttributeError):
-        for model in models:
-            for mat_slot in bpy.data.objects[model].material_slots:
-                textures = textures.union(_get_large_textures_in_material(mat_slot.material))
-    return textures
+def _get_incorrect_texture_names(index: SceneIndex) -> List[str]:
+    return [
+        image for image in index.images
+        if _check_wrong_texture_size(bpy.data.images[image])
+    ]
 
 
-def _get_large_textures_in_material(material: bpy.types.Material) -> Set[str]:
-    textures: Set[str] = set()
-    for node in material.node_tree.nodes:
-        if node.type == 'TEX_IMAGE' and _check_wrong_texture_size(node.image):
-            textures.add(node.image.name)    # noqa: WPS220
-    return textures
-
-
-def _get_incorrect_texture_names(asset_type: AssetType, export_data: dict):
-    if asset_type == AssetType.model:
-        return _get_large_textures_in_objects(export_data.get('models', []))
-    if asset_type == AssetType.scene:
-        scene_name = export_data.get('scene')
-        scene = bpy.data.scenes[scene_name]
-        return _get_large_textures_in_objects(scene.objects.keys())
-    if asset_type == AssetType.material:
-        material = bpy.data.materials[export_data.get('material')]
-        return _get_large_textures_in_material(material)
-
-
-def fix_textures_size(asset_type: AssetType, export_data: dict):
-    """Resize textures to a potency of 2 below or equal to 2048.
+def fix_textures_size(index: SceneIndex) -> Optional[asyncio.Future]:
+    """Resize textures to a potency of 2 below or equal to 2048 in background workers.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
+    Returns:
+        Optional[asyncio.Future]: task that finishes when the resized files are relinked
     """
-    large_textures = _get_incorrect_texture_names(asset_type, export_data)
-    for texture_name in large_textures:
-        texture = bpy.data.images[texture_name]
-        if texture.size[0] != texture.size[1]:
-            continue
-        new_size = min(2**int(math.log(texture.size[0], 2)), MAX_TEXTURE_SIZE)
-        texture.scale(new_size, new_size)
+    large_textures = _get_incorrect_texture_names(index)
+    return resize_images(
+        [bpy.data.images[texture_name] for texture_name in large_textures],
+        MAX_TEXTURE_SIZE,
+    )
 
 
-def check_textures_size(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def check_textures_size(index: SceneIndex) -> Tuple[bool, str]:
     """Check if textures sizes are potency of 2 and below or equal to 2048.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: if check passed and a report message
@@ -83,7 +60,7 @@ def check_textures_size(asset_type: AssetType, export_data: dict) -> Tuple[bool,
     is_valid = True
     message = 'All textures sizes are potency of 2 and below or equal to 2048!'
 
-    large_textures = _get_incorrect_texture_names(asset_type, export_data)
+    large_textures = _get_incorrect_texture_names(index)
     if large_textures:
         message = f'Textures with wrong size: {", ".join(large_textures)}'
         is_valid = False
@@ -100,4 +77,5 @@ textures_size = BaseValidator(
     description,
     check_textures_size,
     fix_textures_size,
+    reads=('images',),
 )
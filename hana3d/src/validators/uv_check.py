@@ -1,45 +1,29 @@
 """UV Check Validator."""
 
 import logging
-from typing import List, Tuple
+from typing import Iterable, List, Tuple
 
 import bpy
 
 from . import BaseValidator, Category
-from ..asset.asset_type import AssetType
+from .scene_index import SceneIndex
 
 
-def _get_multiple_uv_models(models: List[str]) -> List[str]:
+def _get_multiple_uv_models(meshes: Iterable[str]) -> List[str]:
     return [
-        model for model in models
-        if (
-            bpy.data.objects[model].data is not None
-            and hasattr(bpy.data.objects[model].data, 'uv_layers')  # noqa: WPS421
-            and len(bpy.data.objects[model].data.uv_layers) > 1  # noqa: WPS219
-        )
+        mesh for mesh in meshes
+        if len(bpy.data.objects[mesh].data.uv_layers) > 1
     ]
 
 
-def _get_object_list(asset_type: AssetType, export_data: dict):
-    if asset_type == AssetType.model:
-        return export_data.get('models', [])
-    if asset_type == AssetType.scene:
-        scene_name = export_data.get('scene')
-        scene = bpy.data.scenes[scene_name]
-        return scene.objects.keys()
-    return []
-
-
-def fix_uv_layers(asset_type: AssetType, export_data: dict):
+def fix_uv_layers(index: SceneIndex):
     """Remove all inactive UV layers from export data.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     """
-    models = _get_object_list(asset_type, export_data)
-    multiple_uv_models = _get_multiple_uv_models(models)
+    multiple_uv_models = _get_multiple_uv_models(index.meshes)
     for model in multiple_uv_models:
         model_data = bpy.data.objects[model]
         uv_layers = model_data.data.uv_layers
@@ -50,12 +34,11 @@ def fix_uv_layers(asset_type: AssetType, export_data: dict):
             uv_layers.remove(unwanted_uvs.pop())
 
 
-def check_uv_layers(asset_type: AssetType, export_data: dict) -> Tuple[bool, str]:
+def check_uv_layers(index: SceneIndex) -> Tuple[bool, str]:
     """Check for duplicated UV layers in all meshes on export data.
 
     Parameters:
-        asset_type: type of asset that will be uploaded
-        export_data: dict containing objects to be uploaded info
+        index: datablocks of the asset that will be uploaded
 
     Returns:
         is_valid, message: if check passed and a report message
@@ -64,8 +47,7 @@ def check_uv_layers(asset_type: AssetType, export_data: dict) -> Tuple[bool, str
     is_valid = True
     message = 'No duplicated UVs detected!'
 
-    models = _get_object_list(asset_type, export_data)
-    multiple_uv_models = _get_multiple_uv_models(models)
+    multiple_uv_models = _get_multiple_uv_models(index.meshes)
     if multiple_uv_models:
         message = f'Meshes with more than 1 UV Map: {", ".join(multiple_uv_models)}'
         is_valid = False
@@ -76,4 +58,11 @@ def check_uv_layers(asset_type: AssetType, export_data: dict) -> Tuple[bool, str
 
 name = 'UV Check'
 description = 'Checks for multiple UVs in a mesh'
-uv_checker = BaseValidator(name, Category.error, description, check_uv_layers, fix_uv_layers)
+uv_checker = BaseValidator(
+    name,
+    Category.error,
+    description,
+    check_uv_layers,
+    fix_uv_layers,
+    reads=('meshes',),
+)
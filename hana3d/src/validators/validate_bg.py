@@ -0,0 +1,129 @@
+"""Blender script that runs the upload validators over a list of .blend files."""
+import json
+import logging
+import os
+import sys
+import time
+import traceback
+from dataclasses import asdict
+from importlib import import_module
+from typing import List
+
+import bpy
+
+ADDON_PATH, HANA3D_NAME, JOBS_FILE, RESULTS_FILE = sys.argv[-4:]  # noqa: WPS414
+
+sys.path.insert(0, ADDON_PATH)
+validators_module = import_module(f'{HANA3D_NAME}.src.validators')
+default_validators = import_module(f'{HANA3D_NAME}.src.validators.default_validators')
+background = import_module(f'{HANA3D_NAME}.src.validators.background')
+bg_blender = import_module(f'{HANA3D_NAME}.bg_blender')
+
+
+def _get_export_data(job: dict) -> dict:
+    asset_type = job.get('type', 'scene').upper()
+    export_data = {'type': asset_type}
+    if asset_type == 'MODEL':
+        models = job.get('models')
+        if models is None:
+            models = [ob.name for ob in bpy.context.scene.objects]
+        _link_to_scene(models)
+        export_data['models'] = models
+    elif asset_type == 'SCENE':
+        export_data['scene'] = job.get('scene', bpy.context.scene.name)
+    elif asset_type == 'MATERIAL':
+        material = job.get('material')
+        if material is None:
+            material = bpy.data.materials[0].name
+        export_data['material'] = material
+    return export_data
+
+
+def _link_to_scene(object_names: List[str]):
+    # Objects of a snapshot library are not linked to any scene
+    collection = bpy.context.scene.collection
+    for object_name in object_names:
+        blend_object = bpy.data.objects[object_name]
+        if not blend_object.users_scene:
+            collection.objects.link(blend_object)
+
+
+def _open_file(blend_file: str):
+    if bpy.data.filepath and os.path.realpath(bpy.data.filepath) == os.path.realpath(blend_file):
+        return
+    bpy.ops.wm.open_mainfile(filepath=blend_file, load_ui=False)
+
+
+def _get_validators(job: dict) -> list:
+    names = job.get('validators')
+    return [
+        validator
+        for validator in default_validators.validators
+        if names is None or validator.name in names
+    ]
+
+
+def _run_validator(validator, index) -> dict:
+    bg_blender.progress(f'{background.VALIDATING}{validator.name}')
+    start = time.perf_counter()
+    # Metrics of the previous file must not be reported if this run crashes
+    validator.metrics = None
+    try:
+        validator.run_validation(index=index)
+        valid, message = validator.get_validation_result()
+    except Exception as error:
+        valid, message = False, f'Validator crashed: {error!r}'
+        traceback.print_exc()
+    validator_result = {
+        'name': validator.name,
+        'category': validator.category.value,
+        'valid': valid,
+        'message': message,
+        'time': time.perf_counter() - start,
+    }
+    if validator.metrics is not None:
+        validator_result['metrics'] = asdict(validator.metrics)
+    bg_blender.progress(f'{background.VALIDATED}{json.dumps(validator_result)}')
+    return validator_result
+
+
+def validate_file(job: dict) -> dict:
+    """Open a file and run the default validators on it.
+
+    Parameters:
+        job: path of the file, the export data to validate and optionally the names
+            of the validators to run
+
+    Returns:
+        dict: results of the validators with their timings
+    """
+    file_result = {'path': job['path'], 'validators': []}
+    start = time.perf_counter()
+    try:  # noqa: WPS229
+        _open_file(job['path'])
+        file_result['load_time'] = time.perf_counter() - start
+        export_data = _get_export_data(job)
+        file_result['export_data'] = export_data
+        index_start = time.perf_counter()
+        index = validators_module.get_scene_index(export_data)
+        file_result['index_time'] = time.perf_counter() - index_start
+        for validator in _get_validators(job):
+            file_result['validators'].append(_run_validator(validator, index))
+    except Exception as error:
+        file_result['error'] = repr(error)
+        traceback.print_exc()
+    file_result['time'] = time.perf_counter() - start
+    return file_result
+
+
+if __name__ == '__main__':
+    with open(JOBS_FILE, 'r') as jobs_file:
+        jobs = json.load(jobs_file)
+    # Tells the caller the addon was imported, so a crash is blamed on the file being validated
+    open(RESULTS_FILE, 'a').close()  # noqa: WPS515
+    for job in jobs:
+        logging.info(f'Validating {job["path"]}')
+        file_result = validate_file(job)
+        # One line per file, so results survive if Blender crashes on a later file
+        with open(RESULTS_FILE, 'a') as results_file:
+            results_file.write(f'{json.dumps(file_result)}\n')
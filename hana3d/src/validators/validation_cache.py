@@ -0,0 +1,248 @@
+"""Cache of validation results, invalidated by depsgraph updates.
+
+Image files edited outside of Blender do not update the depsgraph, so the size and
+modification time of the files of the images read are part of the cached fields.
+"""
+import logging
+import os
+from typing import Dict, FrozenSet, Iterable, NamedTuple, Optional, Set, Tuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+from .scene_index import SceneIndex
+from ..evaluated.object_cache import ObjectCache
+from ..metaclasses.singleton import Singleton
+
+Datablock = Tuple[str, str]
+
+OBJECT_FIELDS = frozenset(('objects', 'meshes', 'armatures'))
+MATERIAL_FIELDS = frozenset(('object_materials', 'materials'))
+IMAGE_FIELDS = frozenset(('images',))
+
+
+class _Entry(NamedTuple):
+    fields: tuple
+    datablocks: FrozenSet[Datablock]
+    types: FrozenSet[str]
+    result: Tuple[bool, str]
+
+
+def _get_key(datablock: bpy.types.ID) -> Datablock:
+    return type(datablock).__name__, datablock.name
+
+
+def _get_file_version(image_name: str) -> Optional[Tuple[int, int]]:
+    image = bpy.data.images[image_name]
+    if image.source != 'FILE' or image.packed_file:
+        return None
+    try:
+        stat = os.stat(image.filepath_from_user())
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_field(index: SceneIndex, field: str) -> tuple:
+    names = getattr(index, field)
+    if field in IMAGE_FIELDS:
+        return tuple((name, _get_file_version(name)) for name in names)
+    return names
+
+
+def _get_fields(index: SceneIndex, reads: Iterable[str]) -> tuple:
+    return (index.asset_type,) + tuple(_get_field(index, field) for field in reads)
+
+
+def get_datablocks(index: SceneIndex, reads: Iterable[str]) -> Set[Datablock]:
+    """Get the datablocks behind some fields of the index.
+
+    Parameters:
+        index: datablocks of the asset that will be uploaded
+        reads: fields of the index
+
+    Returns:
+        Set[Datablock]: (type, name) of objects, their data, materials and images
+    """
+    datablocks: Set[Datablock] = set()
+    for field in reads:
+        names = getattr(index, field)
+        if field in OBJECT_FIELDS:
+            for object_name in names:
+                blend_object = bpy.data.objects[object_name]
+                datablocks.add(_get_key(blend_object))
+                if blend_object.data is not None:
+                    datablocks.add(_get_key(blend_object.data))
+        elif field in MATERIAL_FIELDS:
+            datablocks.update(('Material', material) for material in names)
+        elif field in IMAGE_FIELDS:
+            datablocks.update(('Image', image) for image in names)
+    return datablocks
+
+
+class ValidationCache(object, metaclass=Singleton):
+    """Validation results with the datablocks each validator read to get them."""
+
+    def __init__(self):
+        """Create a ValidationCache object."""
+        self._entries: Dict[str, _Entry] = {}
+        self.generation = 0
+        self._changed: Dict[Datablock, int] = {}
+        self._changed_types: Dict[str, int] = {}
+        self._cleared = 0
+
+    def get(
+        self,
+        validator_name: str,
+        index: SceneIndex,
+        reads: Iterable[str],
+    ) -> Optional[Tuple[bool, str]]:
+        """Get the result of a validator, if nothing it read has changed.
+
+        Parameters:
+            validator_name: name of the validator
+            index: datablocks of the asset that will be uploaded
+            reads: fields of the index the validator reads
+
+        Returns:
+            Optional[Tuple[bool, str]]: cached result, None if it must run again
+        """
+        entry = self._entries.get(validator_name)
+        if entry is None or entry.fields != _get_fields(index, reads):
+            return None
+        return entry.result
+
+    def store(
+        self,
+        validator_name: str,
+        index: SceneIndex,
+        reads: Iterable[str],
+        validation_result: Tuple[bool, str],
+        since: Optional[int] = None,
+    ):
+        """Keep the result of a validator until a datablock it read changes.
+
+        Parameters:
+            validator_name: name of the validator
+            index: datablocks of the asset that will be uploaded
+            reads: fields of the index the validator reads
+            validation_result: result of the validator
+            since: generation when the validator started reading the index, the result
+                is not kept if a datablock it read changed after that, None if it just ran
+        """
+        datablocks = frozenset(get_datablocks(index, reads))
+        if since is not None and self._changed_since(datablocks, since):
+            logging.debug(f'Validation of {validator_name} is outdated, not caching it')
+            return
+        self._entries[validator_name] = _Entry(
+            fields=_get_fields(index, reads),
+            datablocks=datablocks,
+            types=frozenset(datablock_type for datablock_type, _ in datablocks),
+            result=validation_result,
+        )
+
+    def invalidate(self, datablocks: Iterable[Datablock], types: Iterable[str] = ()):
+        """Drop results that depend on changed datablocks.
+
+        Parameters:
+            datablocks: (type, name) of the changed datablocks
+            types: types of datablocks that may have changed, without knowing which ones
+        """
+        datablocks = frozenset(datablocks)
+        types = frozenset(types)
+        self.generation += 1
+        self._changed.update(dict.fromkeys(datablocks, self.generation))
+        self._changed_types.update(dict.fromkeys(types, self.generation))
+        dirty = [
+            validator_name
+            for validator_name, entry in self._entries.items()
+            if entry.datablocks & datablocks or entry.types & types
+        ]
+        for validator_name in dirty:
+            logging.debug(f'Validation of {validator_name} is outdated')
+            del self._entries[validator_name]  # noqa: WPS420
+
+    def clear(self):
+        """Drop all results, so every validator runs again."""
+        self._entries.clear()
+        self.generation += 1
+        self._cleared = self.generation
+
+    def __bool__(self) -> bool:
+        """Check if there are cached results.
+
+        Returns:
+            bool: True if any result is cached
+        """
+        return bool(self._entries)
+
+    def _changed_since(self, datablocks: FrozenSet[Datablock], generation: int) -> bool:
+        if self._cleared > generation:
+            return True
+        types = {datablock_type for datablock_type, _ in datablocks}
+        return any(
+            self._changed.get(datablock, 0) > generation for datablock in datablocks
+        ) or any(
+            self._changed_types.get(datablock_type, 0) > generation for datablock_type in types
+        )
+
+
+@persistent
+def depsgraph_update_post(scene: bpy.types.Scene, depsgraph: bpy.types.Depsgraph):
+    """Invalidate results that depend on updated datablocks.
+
+    Parameters:
+        scene: updated scene
+        depsgraph: depsgraph with the updated datablocks
+    """
+    if ObjectCache().ignore_updates:
+        # Temporary changes made to compute evaluated values, already reverted
+        return
+    # Changes are recorded even without cached results, for results still being
+    # computed in the background
+    cache = ValidationCache()
+    datablocks = set()
+    types = set()
+    for update in depsgraph.updates:
+        datablock = update.id.original
+        if isinstance(datablock, bpy.types.NodeTree):
+            # Embedded node trees do not tell which material they belong to
+            types.add('Material')
+        else:
+            datablocks.add(_get_key(datablock))
+    cache.invalidate(datablocks, types)
+
+
+@persistent
+def clear_cache(*args):
+    """Drop all results when datablocks are replaced or animated.
+
+    Runs on file load, undo and frame change, which evaluates animated objects again
+    without a depsgraph update.
+
+    Parameters:
+        args: handler arguments, unused
+    """
+    ValidationCache().clear()
+
+
+HANDLERS = (
+    (bpy.app.handlers.depsgraph_update_post, depsgraph_update_post),
+    (bpy.app.handlers.load_post, clear_cache),
+    (bpy.app.handlers.undo_post, clear_cache),
+    (bpy.app.handlers.redo_post, clear_cache),
+    (bpy.app.handlers.frame_change_post, clear_cache),
+)
+
+
+def register():
+    """Register validation cache handlers."""
+    for handlers, handler in HANDLERS:
+        handlers.append(handler)
+
+
+def unregister():
+    """Unregister validation cache handlers."""
+    for handlers, handler in HANDLERS:
+        if handler in handlers:
+            handlers.remove(handler)
@@ -0,0 +1 @@
+"""Pool of persistent background Blender workers."""
@@ -0,0 +1,62 @@
+"""Blender script that keeps running background jobs received through stdin."""
+import json
+import runpy
+import sys
+import traceback
+from importlib import import_module
+
+import bpy
+
+HANA3D_NAME = sys.argv[-1]
+
+metrics = import_module(f'{HANA3D_NAME}.src.validators.metrics')
+worker_pool = import_module(f'{HANA3D_NAME}.src.worker_pool.worker_pool')
+
+
+def _send(marker: str, message: dict):
+    sys.stdout.write(f'{marker}{json.dumps(message)}\n')
+    sys.stdout.flush()
+
+
+def _run_job(job: dict) -> int:
+    # Opening the job file discards all data left by the previous job
+    bpy.ops.wm.open_mainfile(filepath=job['blend_file'], load_ui=False)
+    if job.get('threads') is not None:
+        for scene in bpy.data.scenes:
+            scene.render.threads_mode = 'FIXED'
+            scene.render.threads = job['threads']
+    sys.argv = [
+        bpy.app.binary_path,
+        '--background',
+        job['blend_file'],
+        '--python',
+        job['script'],
+        '--',
+        *job['args'],
+    ]
+    try:
+        runpy.run_path(job['script'], run_name='__main__')
+    except SystemExit as exit_error:
+        if exit_error.code is None:
+            return 0
+        return exit_error.code if isinstance(exit_error.code, int) else 1
+    except Exception:
+        traceback.print_exc()
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    _send(worker_pool.READY_MARKER, {'memory': metrics.get_peak_memory()})
+    while True:
+        line = sys.stdin.readline()
+        if not line:
+            break
+        job = json.loads(line)
+        returncode = _run_job(job)
+        job_result = {
+            'id': job['id'],
+            'returncode': returncode,
+            'memory': metrics.get_peak_memory(),
+        }
+        _send(worker_pool.RESULT_MARKER, job_result)
@@ -0,0 +1,324 @@
+"""Pool of persistent background Blender workers."""
+import asyncio
+import json
+import logging
+import os
+import subprocess  # noqa: S404
+import uuid
+from typing import Callable, List, Optional, Tuple
+
+import bpy
+
+from ..metaclasses.singleton import Singleton
+from ..preferences.preferences import Preferences
+from ..subprocess_async.subprocess_async import Subprocess, parse_progress  # noqa: S404
+from ...config import HANA3D_NAME
+
+WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'worker_bg.py')
+READY_MARKER = 'hana3d_worker_ready'
+RESULT_MARKER = 'hana3d_worker_result'
+
+MAX_JOBS_PER_WORKER = 10
+MAX_MEMORY_GROWTH = 1024 * 1024 * 1024
+
+
+class WorkerError(Exception):
+    """Blender worker process died or answered with an unexpected message."""
+
+
+class BlenderWorker(object):
+    """Long-lived background Blender process that runs one job at a time."""
+
+    def __init__(self):
+        """Create a BlenderWorker object, the process is started by `start`."""
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.jobs_done = 0
+        self.initial_memory = 0
+        self.memory = 0
+        self.stopped = False
+
+    async def start(self):
+        """Start Blender and wait until it is ready to receive jobs."""
+        cmd = [
+            bpy.app.binary_path,
+            '--background',
+            '-noaudio',
+            '--python',
+            WORKER_SCRIPT,
+            '--',
+            HANA3D_NAME,
+        ]
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+        )
+        ready, _ = await self._read_message(READY_MARKER)
+        self.initial_memory = ready['memory']
+        self.memory = ready['memory']
+
+    async def run(
+        self,
+        blend_file: str,
+        script: str,
+        args: List[str],
+        progress_callback: Optional[Callable[[str], None]] = None,
+        threads: Optional[int] = None,
+    ) -> Tuple[int, bytes]:
+        """Open blend_file and run script as if Blender was started with it.
+
+        Parameters:
+            blend_file: file opened before running the script
+            script: path of the python script
+            args: arguments passed to the script after '--'
+            progress_callback: called with the message of each progress marker in the output
+            threads: render threads of the opened scenes, None to use the file settings
+
+        Returns:
+            returncode, output: exit code of the script and everything it printed
+        """
+        job = {
+            'id': str(uuid.uuid4()),
+            'blend_file': blend_file,
+            'script': script,
+            'args': args,
+            'threads': threads,
+        }
+        stdin = self._get_process().stdin
+        if stdin is None:
+            raise WorkerError('Worker has no input pipe')
+        try:
+            stdin.write(f'{json.dumps(job)}\n'.encode())
+            await stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as error:
+            raise WorkerError(f'Could not send job to worker: {error}')
+
+        job_result, output = await self._read_message(RESULT_MARKER, progress_callback)
+        if job_result.get('id') != job['id']:
+            raise WorkerError(f'Unexpected result {job_result}')
+        self.jobs_done += 1
+        self.memory = job_result['memory']
+        return job_result['returncode'], output
+
+    def should_recycle(self) -> bool:
+        """Check if worker has done too many jobs or grew too much.
+
+        Returns:
+            bool: True if worker should be stopped instead of reused
+        """
+        if self.stopped or self.process is None or self.process.returncode is not None:
+            return True
+        if self.jobs_done >= MAX_JOBS_PER_WORKER:
+            return True
+        return self.memory - self.initial_memory > MAX_MEMORY_GROWTH
+
+    def stop(self):
+        """Kill worker process."""
+        self.stopped = True
+        if self.process is not None and self.process.returncode is None:
+            self.process.kill()
+
+    def _get_process(self) -> asyncio.subprocess.Process:
+        if self.process is None:
+            raise WorkerError('Worker was not started')
+        return self.process
+
+    async def _read_message(
+        self,
+        marker: str,
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> Tuple[dict, bytes]:
+        stdout = self._get_process().stdout
+        if stdout is None:
+            raise WorkerError('Worker has no output pipe')
+        output: List[bytes] = []
+        while True:
+            try:
+                line = await stdout.readline()
+            except (ValueError, asyncio.LimitOverrunError) as error:
+                raise WorkerError(f'Worker output line too long: {error}')
+            if not line:
+                output_text = b''.join(output).decode(errors='replace')
+                raise WorkerError(f'Worker exited with output:\n{output_text}')
+            decoded = line.decode(errors='replace')
+            if decoded.startswith(marker):
+                return json.loads(decoded[len(marker):]), b''.join(output)
+            output.append(line)
+            progress = parse_progress(decoded)
+            if progress is not None and progress_callback is not None:
+                progress_callback(progress)
+
+
+class WorkerPool(object, metaclass=Singleton):
+    """Keeps background Blender workers warm between uploads and thumbnails."""
+
+    def __init__(self):
+        """Create a WorkerPool object."""
+        self._idle: List[BlenderWorker] = []
+        self._busy: List[BlenderWorker] = []
+        self._available: Optional[asyncio.Condition] = None
+
+    def size(self) -> int:
+        """Maximum number of workers, from user preferences.
+
+        Returns:
+            int: maximum number of workers, 0 if the pool is disabled
+        """
+        return Preferences().get().blender_workers
+
+    async def run(  # noqa: WPS211
+        self,
+        blend_file: str,
+        script: str,
+        args: List[str],
+        timeout: Optional[float] = None,
+        progress_callback: Optional[Callable[[str], None]] = None,
+        threads: Optional[int] = None,
+    ) -> Tuple[int, bytes]:
+        """Run a job in an idle worker, starting one if needed.
+
+        The worker is killed when the timeout expires or the awaiting task is cancelled.
+
+        Parameters:
+            blend_file: file opened before running the script
+            script: path of the python script
+            args: arguments passed to the script after '--'
+            timeout: seconds to wait for the job, None to wait forever
+            progress_callback: called with the message of each progress marker in the output
+            threads: render threads of the opened scenes, None to use the file settings
+
+        Returns:
+            returncode, output: exit code of the script and everything it printed
+
+        Raises:
+            WorkerError: worker process failed
+            TimeoutError: job did not finish in time
+        """
+        worker = await self._acquire()
+        try:
+            return await asyncio.wait_for(
+                worker.run(blend_file, script, args, progress_callback, threads),
+                timeout,
+            )
+        except asyncio.TimeoutError:
+            worker.stop()
+            raise TimeoutError(f'Blender worker did not finish {script} in {timeout}s')
+        except (Exception, asyncio.CancelledError):
+            worker.stop()
+            raise
+        finally:
+            await self._release(worker)
+
+    def shutdown(self):
+        """Stop all workers."""
+        for worker in self._idle + self._busy:
+            worker.stop()
+        self._idle.clear()
+        self._busy.clear()
+
+    def _get_available(self) -> asyncio.Condition:
+        # Created on first use, so it belongs to the loop running the jobs
+        if self._available is None:
+            self._available = asyncio.Condition()
+        return self._available
+
+    async def _acquire(self) -> BlenderWorker:
+        available = self._get_available()
+        async with available:
+            await available.wait_for(
+                lambda: self._idle or len(self._busy) < max(self.size(), 1),
+            )
+            if self._idle:
+                worker = self._idle.pop()
+                self._busy.append(worker)
+                return worker
+            worker = BlenderWorker()
+            self._busy.append(worker)
+
+        try:
+            await worker.start()
+        except Exception as error:
+            worker.stop()
+            await self._release(worker)
+            raise WorkerError(f'Could not start Blender worker: {error}')
+        return worker
+
+    async def _release(self, worker: BlenderWorker):
+        available = self._get_available()
+        async with available:
+            if worker in self._busy:
+                self._busy.remove(worker)
+            if worker.should_recycle() or len(self._idle) >= self.size():
+                logging.debug(f'Recycling Blender worker after {worker.jobs_done} jobs')
+                worker.stop()
+            else:
+                self._idle.append(worker)
+            available.notify()
+
+
+async def run_blender_script(  # noqa: WPS211
+    blend_file: str,
+    script: str,
+    args: List[str],
+    timeout: Optional[float] = None,
+    progress_callback: Optional[Callable[[str], None]] = None,
+    threads: Optional[int] = None,
+) -> subprocess.CompletedProcess:
+    """Run a script in background Blender, in a warm worker when the pool is enabled.
+
+    Falls back to a new Blender process when the pool is disabled or the worker fails.
+    Cancelling the awaiting task kills the Blender process.
+
+    Parameters:
+        blend_file: file opened before running the script
+        script: path of the python script
+        args: arguments passed to the script after '--'
+        timeout: seconds to wait for the script, None to wait forever
+        progress_callback: called with the message of each progress marker in the output
+        threads: number of render threads, None to let Blender use all cores
+
+    Returns:
+        subprocess.CompletedProcess: the return value representing a process that has finished.
+
+    Raises:
+        Exception: Script exited in error
+        TimeoutError: Script did not finish in time
+    """
+    threads_args = [] if threads is None else ['--threads', str(threads)]
+    cmd = [
+        bpy.app.binary_path,
+        '--background',
+        '-noaudio',
+        *threads_args,
+        blend_file,
+        '--python',
+        script,
+        '--',
+        *args,
+    ]
+    pool = WorkerPool()
+    if pool.size() > 0:
+        try:
+            returncode, output = await pool.run(
+                blend_file, script, args, timeout, progress_callback, threads,
+            )
+        except WorkerError as error:
+            logging.warning(f'Blender worker failed ({error}), starting a new process')
+        else:
+            output_text = output.decode(errors='replace')
+            if returncode != 0:
+                raise Exception(f'Subprocess raised error:\n{output_text}')
+            logging.debug(f'Worker job {cmd}: {output_text}')
+            return subprocess.CompletedProcess(cmd, returncode, stdout=output, stderr=b'')
+
+    return await Subprocess().subprocess(cmd, timeout, progress_callback)
+
+
+def register():
+    """Worker pool register."""
+
+
+def unregister():
+    """Worker pool unregister."""
+    WorkerPool().shutdown()
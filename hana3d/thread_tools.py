@@ -16,34 +16,212 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 import logging
-import queue
+import operator
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import count
+from typing import Any, Callable, Hashable, Tuple
 
 import bpy
 
 from .config import HANA3D_NAME
 
-state_update_queue = queue.Queue()
+UPDATE_INTERVAL = 0.02
+UPDATE_TIME_BUDGET = 0.005
+
+_PATH_TOKEN = re.compile(r"(\w+)|\[\s*'([^']*)'\s*\]|\[\s*\"([^\"]*)\"\s*\]|\[\s*(\d+)\s*\]")
+
+_operations = {
+    '=': lambda old_value, new_value: new_value,
+    '+=': operator.iadd,
+}
+
+
+@dataclass
+class StateUpdate:
+    """Property update to be applied on the main thread.
+
+    Attributes:
+        asset_type: type of the datablock that owns the property (model|scene|material)
+        asset_name: name of the datablock
+        property_path: path relative to the addon props, e.g. `render_state` or
+            `render_data['jobs']`
+        value: value that will be assigned
+        operation: '=' to assign or '+=' to extend the current value
+    """
+
+    asset_type: str
+    asset_name: str
+    property_path: str
+    value: Any
+    operation: str = '='
+
+    def key(self) -> Tuple[str, str, str]:
+        """Identify the property being written so repeated updates can be coalesced.
+
+        Returns:
+            tuple: (asset_type, asset_name, property_path)
+        """
+        return self.asset_type.upper(), self.asset_name, self.property_path
+
+    def apply(self):
+        """Write value to the datablock property."""
+        datablock = get_datablock(self.asset_type, self.asset_name)
+        tokens = _parse_property_path(self.property_path)
+        owner = getattr(datablock, HANA3D_NAME)
+        for token in tokens[:-1]:
+            owner = _get_item(owner, token)
+        last_token = tokens[-1]
+        new_value = self.value
+        if self.operation != '=':
+            new_value = _operations[self.operation](_get_item(owner, last_token), self.value)
+        _set_item(owner, last_token, new_value)
+
+
+@dataclass
+class CallbackUpdate:
+    """Function call to be executed on the main thread.
+
+    Attributes:
+        function: callable that will be executed
+        args: positional arguments of the call, also used to coalesce repeated calls
+    """
+
+    function: Callable
+    args: Tuple = ()
+
+    def key(self) -> Tuple[Callable, Tuple]:
+        """Identify the call so repeated calls can be coalesced.
+
+        Returns:
+            tuple: (function, args)
+        """
+        return self.function, self.args
+
+    def apply(self):
+        """Execute callback."""
+        self.function(*self.args)
+
+
+class StateUpdateQueue(object):
+    """Thread-safe queue that keeps only the latest pending value of each property."""
+
+    def __init__(self):
+        """Create an empty queue."""
+        self._lock = threading.Lock()
+        self._pending: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._counter = count()
+
+    def put(self, update):
+        """Add an update, replacing a pending assignment to the same property.
+
+        Parameters:
+            update: StateUpdate or CallbackUpdate
+        """
+        if getattr(update, 'operation', '=') == '=':
+            key = update.key()
+        else:
+            # incremental updates depend on the previous value and can't be coalesced
+            key = (update.key(), next(self._counter))
+        with self._lock:
+            self._pending.pop(key, None)
+            self._pending[key] = update
+
+    def get(self):
+        """Pop oldest pending update.
+
+        Returns:
+            oldest update or None if the queue is empty
+        """
+        with self._lock:
+            if not self._pending:
+                return None
+            _, update = self._pending.popitem(last=False)
+            return update
+
+    def empty(self) -> bool:
+        """Check if there are pending updates.
+
+        Returns:
+            bool: True if there are no pending updates
+        """
+        with self._lock:
+            return not self._pending
+
+    def __len__(self):
+        """Number of pending updates.
+
+        Returns:
+            int: number of pending updates
+        """
+        with self._lock:
+            return len(self._pending)
+
+
+state_update_queue = StateUpdateQueue()
+
+
+def _parse_property_path(property_path: str) -> list:
+    tokens = []
+    for match in _PATH_TOKEN.finditer(property_path):
+        attribute, single_quoted, double_quoted, index = match.groups()
+        if attribute is not None:
+            tokens.append(('attr', attribute))
+        elif index is not None:
+            tokens.append(('item', int(index)))
+        else:
+            tokens.append(('item', single_quoted if single_quoted is not None else double_quoted))
+    if not tokens:
+        raise ValueError(f'Invalid property path {property_path!r}')
+    return tokens
+
+
+def _get_item(owner, token):
+    kind, name = token
+    if kind == 'attr':
+        return getattr(owner, name)
+    return owner[name]
+
+
+def _set_item(owner, token, value):
+    kind, name = token
+    if kind == 'attr':
+        setattr(owner, name, value)
+    else:
+        owner[name] = value
 
 
 def threads_state_update():
-    """Updates properties in main thread"""
-    while not state_update_queue.empty():
-        cmd = state_update_queue.get()
+    """Updates properties in main thread.
+
+    Pending updates are applied until UPDATE_TIME_BUDGET is spent, the rest is
+    left for the next timer call so the UI does not freeze under heavy load.
+
+    Returns:
+        float: time until next execution
+    """
+    deadline = time.perf_counter() + UPDATE_TIME_BUDGET
+    while time.perf_counter() < deadline:
+        update = state_update_queue.get()
+        if update is None:
+            return UPDATE_INTERVAL
         try:
-            exec(cmd)
-            state_update_queue.task_done()
+            update.apply()
         except Exception as e:
-            logging.error(f'Failed to execute command {cmd!r} ({e})')
-    return 0.02
+            logging.error(f'Failed to apply update {update!r} ({e})')
+    return 0
 
 
-def get_global_name(asset_type, asset_name):
+def get_datablock(asset_type: str, asset_name: str):
     if asset_type.upper() == 'MODEL':
-        return f'bpy.data.objects["{asset_name}"]'
+        return bpy.data.objects[asset_name]
     if asset_type.upper() == 'MATERIAL':
-        return f'bpy.data.materials["{asset_name}"]'
+        return bpy.data.materials[asset_name]
     if asset_type.upper() == 'SCENE':
-        return f'bpy.data.scenes["{asset_name}"]'
+        return bpy.data.scenes[asset_name]
     raise ValueError(f'Unexpected asset type {asset_type}')
 
 
@@ -54,9 +232,27 @@ def update_in_foreground(
         value,
         operation: str = '='):
     """Update blender objects in foreground to avoid threading errors"""
-    global_object_name = get_global_name(asset_type, asset_name)
-    cmd = f'{global_object_name}.{HANA3D_NAME}.{property_name} {operation} {value!r}'
-    state_update_queue.put(cmd)
+    if operation not in _operations:
+        raise ValueError(f'Unexpected operation {operation}')
+    update = StateUpdate(asset_type, asset_name, property_name, value, operation)
+    state_update_queue.put(update)
+
+
+def call_in_foreground(function: Callable, *args):
+    """Call function in foreground, repeated calls with same args run only once.
+
+    Parameters:
+        function: function to be called
+        args: positional arguments
+    """
+    state_update_queue.put(CallbackUpdate(function, args))
+
+
+def _update_renders(asset_type: str, view_id: str):
+    from . import render_tools
+    from .src.upload import upload
+    props = upload.get_upload_props_by_view_id(asset_type, view_id)
+    render_tools.update_render_list(props, set_jobs=False)
 
 
 def update_renders_in_foreground(asset_type: str, view_id: str):
@@ -66,11 +262,7 @@ def update_renders_in_foreground(asset_type: str, view_id: str):
         asset_type: str (model|scene|material)
         view_id: str
     """
-    imports = 'from . import render_tools; from .src.upload import upload'
-    props = f'props = upload.get_upload_props_by_view_id("{asset_type}", "{view_id}")'
-    update = 'render_tools.update_render_list(props, set_jobs=False)'
-    cmd = f'{imports}; {props}; {update}'
-    state_update_queue.put(cmd)
+    call_in_foreground(_update_renders, asset_type, view_id)
 
 
 def update_state(
@@ -79,20 +271,11 @@ def update_state(
         property_name: str,
         value,
         operation: str = '='):
-    global_name = get_global_name(asset_type, asset_name)
-    update_in_foreground(global_name, property_name, value, operation)
+    update_in_foreground(asset_type, asset_name, property_name, value, operation)
 
 
 def get_state(asset_type: str, asset_name: str, property_name: str):
-    if asset_type.upper() == 'MODEL':
-        asset = bpy.data.objects[asset_name]
-    elif asset_type.upper() == 'MATERIAL':
-        asset = bpy.data.materials[asset_name]
-    elif asset_type.upper() == 'SCENE':
-        asset = bpy.data.scenes[asset_name]
-    else:
-        raise ValueError(f'Unexpected asset type {asset_type}')
-    asset_props = getattr(asset, HANA3D_NAME)
+    asset_props = getattr(get_datablock(asset_type, asset_name), HANA3D_NAME)
     return getattr(asset_props, property_name)
 
 
@@ -34,6 +34,7 @@ from .src.ui.operators import (
     DefaultNamesOperator,
     FixOperator,
     IgnoreOperator,
+    RevalidateOperator,
     RunAssetBarWithContext,
     TransferHana3DData,
     UndoWithContext,
@@ -193,6 +194,7 @@ classes = (
     ValidationPanel,
     FixOperator,
     IgnoreOperator,
+    RevalidateOperator,
 )
 
 handler2d = None
@@ -30,6 +30,7 @@ from idprop.types import IDPropertyGroup
 from . import paths
 from .config import HANA3D_MATERIALS, HANA3D_NAME, HANA3D_PROFILE, HANA3D_UI
 from .src.asset.asset_type import AssetType
+from .src.evaluated import bounds, face_count
 from .src.ui import colors
 from .src.ui.main import UI
 
@@ -259,52 +260,14 @@ def delete_hierarchy(ob):
 
 
 def get_bounds_snappable(obs, use_modifiers=False):
-    # progress('getting bounds of object(s)')
     parent = obs[0]
     while parent.parent is not None:
         parent = parent.parent
-    maxx = maxy = maxz = -10000000
-    minx = miny = minz = 10000000
 
-    obcount = 0  # calculates the mesh obs. Good for non-mesh objects
-    matrix_parent = parent.matrix_world
-    for ob in obs:
-        # bb=ob.bound_box
-        mw = ob.matrix_world
-        # while parent.parent is not None:
-        #     mw =
-
-        if ob.type == 'MESH' or ob.type == 'CURVE':
-            # If to_mesh() works we can use it on curves and any other ob type almost.
-            # disabled to_mesh for 2.8 by now, not wanting to use dependency graph yet.
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-
-            object_eval = ob.evaluated_get(depsgraph)
-            if ob.type == 'CURVE':
-                mesh = object_eval.to_mesh()
-            else:
-                mesh = object_eval.data
-
-            # to_mesh(context.depsgraph, apply_modifiers=self.applyModifiers, calc_undeformed=False)
-            obcount += 1
-            if mesh is not None:
-                for c in mesh.vertices:
-                    coord = c.co
-                    parent_coord = (
-                        matrix_parent.inverted() @ mw @ Vector((coord[0], coord[1], coord[2]))
-                    )  # copy this when it works below.
-                    minx = min(minx, parent_coord.x)
-                    miny = min(miny, parent_coord.y)
-                    minz = min(minz, parent_coord.z)
-                    maxx = max(maxx, parent_coord.x)
-                    maxy = max(maxy, parent_coord.y)
-                    maxz = max(maxz, parent_coord.z)
-                # bpy.data.meshes.remove(mesh)
-            if ob.type == 'CURVE':
-                object_eval.to_mesh_clear()
-
-    if obcount == 0:
-        minx, miny, minz, maxx, maxy, maxz = 0, 0, 0, 0, 0, 0
+    object_bounds = bounds.get_bounds(obs, parent.matrix_world.inverted())
+    if object_bounds is None:
+        return 0, 0, 0, 0, 0, 0
+    minx, miny, minz, maxx, maxy, maxz = object_bounds
 
     minx *= parent.scale.x
     maxx *= parent.scale.x
@@ -317,33 +280,10 @@ def get_bounds_snappable(obs, use_modifiers=False):
 
 
 def get_bounds_worldspace(obs, use_modifiers=False):
-    # progress('getting bounds of object(s)')
-    maxx = maxy = maxz = -10000000
-    minx = miny = minz = 10000000
-    obcount = 0  # calculates the mesh obs. Good for non-mesh objects
-    for ob in obs:
-        # bb=ob.bound_box
-        mw = ob.matrix_world
-        if ob.type == 'MESH' or ob.type == 'CURVE':
-            depsgraph = bpy.context.evaluated_depsgraph_get()
-            ob_eval = ob.evaluated_get(depsgraph)
-            mesh = ob_eval.to_mesh()
-            obcount += 1
-            if mesh is not None:
-                for c in mesh.vertices:
-                    coord = c.co
-                    world_coord = mw @ Vector((coord[0], coord[1], coord[2]))
-                    minx = min(minx, world_coord.x)
-                    miny = min(miny, world_coord.y)
-                    minz = min(minz, world_coord.z)
-                    maxx = max(maxx, world_coord.x)
-                    maxy = max(maxy, world_coord.y)
-                    maxz = max(maxz, world_coord.z)
-            ob_eval.to_mesh_clear()
-
-    if obcount == 0:
-        minx, miny, minz, maxx, maxy, maxz = 0, 0, 0, 0, 0, 0
-    return minx, miny, minz, maxx, maxy, maxz
+    object_bounds = bounds.get_bounds(obs)
+    if object_bounds is None:
+        return 0, 0, 0, 0, 0, 0
+    return object_bounds
 
 
 def is_linked_asset(ob):
@@ -604,40 +544,7 @@ def centralize(objects):
 
 def check_meshprops(props, obs) -> Tuple[int, int]:
     '''Return face count and render face count '''
-    fc = 0
-    fcr = 0
-
-    for ob in obs:
-        if ob.type == 'MESH' or ob.type == 'CURVE':
-            ob_eval = None
-            if ob.type == 'CURVE':
-                # depsgraph = bpy.context.evaluated_depsgraph_get()
-                # object_eval = ob.evaluated_get(depsgraph)
-                mesh = ob.to_mesh()
-            else:
-                mesh = ob.data
-            fco = len(mesh.polygons)
-            fc += fco
-            fcor = fco
-
-            for m in ob.modifiers:
-                if m.type == 'SUBSURF' or m.type == 'MULTIRES':
-                    fcor *= 4 ** m.render_levels
-                # this is rough estimate, not to waste time with evaluating all nonmanifold edges
-                if m.type == 'SOLIDIFY':
-                    fcor *= 2
-                if m.type == 'ARRAY':
-                    fcor *= m.count
-                if m.type == 'MIRROR':
-                    fcor *= 2
-                if m.type == 'DECIMATE':
-                    fcor *= m.ratio
-            fcr += fcor
-
-            if ob_eval:
-                ob_eval.to_mesh_clear()
-
-    return fc, fcr
+    return face_count.get_face_counts(obs)
 
 
 def fill_object_metadata(obj: bpy.types.Object):
@@ -13,19 +13,27 @@ sys.path.insert(0, addon_dir)
 from validation import (  # noqa: E402 isort:skip
     animated_meshes_check,
     animation_count,
+    batch_validate,
     double_sided_check,
+    image_metadata,
     joint_count,
     material_count,
     missing_references,
     morph_target_check,
     object_count,
+    resample,
     scale_check,
+    scene_index,
     texture_size_check,
     texture_square_check,
     triangle_count_check,
+    triangle_counts,
     uv_check,
+    validation_cache,
     vertex_color_check,
 )
+from upload import multipart_upload, upload_manifest  # noqa: E402 isort:skip
+from evaluated import bounds, face_count  # noqa: E402 isort:skip
 
 if __name__ == '__main__':
     loader = unittest.TestLoader()
@@ -34,18 +42,28 @@ if __name__ == '__main__':
     # add tests to the test suite
     suite.addTests(loader.loadTestsFromModule(animated_meshes_check))
     suite.addTests(loader.loadTestsFromModule(animation_count))
+    suite.addTests(loader.loadTestsFromModule(batch_validate))
     suite.addTests(loader.loadTestsFromModule(double_sided_check))
+    suite.addTests(loader.loadTestsFromModule(image_metadata))
     suite.addTests(loader.loadTestsFromModule(joint_count))
     suite.addTests(loader.loadTestsFromModule(material_count))
     suite.addTests(loader.loadTestsFromModule(missing_references))
     suite.addTests(loader.loadTestsFromModule(morph_target_check))
     suite.addTests(loader.loadTestsFromModule(object_count))
+    suite.addTests(loader.loadTestsFromModule(resample))
     suite.addTests(loader.loadTestsFromModule(scale_check))
+    suite.addTests(loader.loadTestsFromModule(scene_index))
     suite.addTests(loader.loadTestsFromModule(texture_size_check))
     suite.addTests(loader.loadTestsFromModule(texture_square_check))
     suite.addTests(loader.loadTestsFromModule(triangle_count_check))
+    suite.addTests(loader.loadTestsFromModule(triangle_counts))
     suite.addTests(loader.loadTestsFromModule(uv_check))
+    suite.addTests(loader.loadTestsFromModule(validation_cache))
     suite.addTests(loader.loadTestsFromModule(vertex_color_check))
+    suite.addTests(loader.loadTestsFromModule(multipart_upload))
+    suite.addTests(loader.loadTestsFromModule(upload_manifest))
+    suite.addTests(loader.loadTestsFromModule(bounds))
+    suite.addTests(loader.loadTestsFromModule(face_count))
 
     # run suite
     runner = unittest.TextTestRunner(verbosity=0)
@@ -0,0 +1,61 @@
+"""Evaluated bounds tests."""
+import unittest
+from os.path import dirname, join
+
+import bpy
+from mathutils import Matrix
+
+from hana3d_dev.src.evaluated.bounds import BOUNDS_KEY, get_bounds
+from hana3d_dev.src.evaluated.object_cache import HANDLERS, ObjectCache, clear_cache
+
+
+class TestGetBounds(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Load test scene and start from an empty cache."""
+        bpy.ops.wm.open_mainfile(filepath=join(dirname(__file__), '../scenes/01_cube.blend'))
+        self.cube = bpy.data.objects['Cube']
+        self.cache = ObjectCache()
+        self.cache.clear()
+
+    def _get_expected_bounds(self, matrix: Matrix) -> tuple:
+        points = [matrix @ vertex.co for vertex in self.cube.data.vertices]
+        return (
+            *(min(point[axis] for point in points) for axis in range(3)),
+            *(max(point[axis] for point in points) for axis in range(3)),
+        )
+
+    def test_world_space(self):
+        """Test bounds in world space."""
+        self.cube.location = (1, 2, 3)
+        bpy.context.view_layer.update()
+        bounds = get_bounds([self.cube])
+        for coordinate, expected in zip(bounds, self._get_expected_bounds(self.cube.matrix_world)):
+            self.assertAlmostEqual(coordinate, expected, places=5)
+
+    def test_space(self):
+        """Test bounds in the space of another matrix."""
+        space = Matrix.Scale(2, 4)
+        bounds = get_bounds([self.cube], space)
+        expected_bounds = self._get_expected_bounds(space @ self.cube.matrix_world)
+        for coordinate, expected in zip(bounds, expected_bounds):
+            self.assertAlmostEqual(coordinate, expected, places=5)
+
+    def test_no_vertices(self):
+        """Test that objects without vertices have no bounds."""
+        empty = bpy.data.objects.new('Empty', None)
+        self.assertIsNone(get_bounds([empty]))
+
+    def test_cache(self):
+        """Test that bounds are cached until the object updates or the frame changes."""
+        matrix = self.cube.matrix_world
+        key = (BOUNDS_KEY, tuple(value for row in matrix for value in row))
+        get_bounds([self.cube])
+        self.assertIsNotNone(self.cache.get(self.cube, key))
+
+        self.cache.invalidate({'Cube'}, set())
+        self.assertIsNone(self.cache.get(self.cube, key))
+
+        get_bounds([self.cube])
+        self.assertIn((bpy.app.handlers.frame_change_post, clear_cache), HANDLERS)
+        clear_cache(bpy.context.scene)
+        self.assertFalse(self.cache)
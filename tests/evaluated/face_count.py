@@ -0,0 +1,65 @@
+"""Render face count tests."""
+import unittest
+from os.path import dirname, join
+
+import bpy
+
+from hana3d_dev.src.evaluated.face_count import RENDER_FACE_COUNT_KEY, get_face_counts
+from hana3d_dev.src.evaluated.object_cache import ObjectCache, clear_cache
+from hana3d_dev.src.validators import validation_cache
+from hana3d_dev.src.validators.scene_index import build_scene_index
+
+
+class TestGetFaceCounts(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Load test scene and start from an empty cache."""
+        bpy.ops.wm.open_mainfile(filepath=join(dirname(__file__), '../scenes/01_cube.blend'))
+        self.cube = bpy.data.objects['Cube']
+        self.cache = ObjectCache()
+        self.cache.clear()
+
+    def test_no_modifiers(self):
+        """Test that both counts are the faces of the mesh without modifiers."""
+        self.assertEqual(get_face_counts([self.cube]), (6, 6))
+
+    def test_render_levels(self):
+        """Test that subdivision is counted at its render levels and restored after."""
+        modifier = self.cube.modifiers.new('Subdivision', 'SUBSURF')
+        modifier.levels = 0
+        modifier.render_levels = 2
+        self.assertEqual(get_face_counts([self.cube]), (6, 96))
+        self.assertEqual(modifier.levels, 0)
+
+    def test_hidden_at_render(self):
+        """Test that modifiers disabled at render are not counted."""
+        modifier = self.cube.modifiers.new('Subdivision', 'SUBSURF')
+        modifier.levels = 1
+        modifier.render_levels = 1
+        modifier.show_render = False
+        self.assertEqual(get_face_counts([self.cube]), (6, 6))
+        self.assertTrue(modifier.show_viewport)
+
+    def test_cache(self):
+        """Test that render counts are cached until the frame changes."""
+        get_face_counts([self.cube])
+        self.assertEqual(self.cache.get(self.cube, RENDER_FACE_COUNT_KEY), 6)
+        clear_cache(bpy.context.scene)
+        self.assertIsNone(self.cache.get(self.cube, RENDER_FACE_COUNT_KEY))
+
+    def test_switch_keeps_cached_results(self):
+        """Test that switching modifiers to render settings does not drop cached results."""
+        modifier = self.cube.modifiers.new('Subdivision', 'SUBSURF')
+        modifier.levels = 0
+        modifier.render_levels = 2
+        bpy.context.evaluated_depsgraph_get()
+        index = build_scene_index('model', {'models': ['Cube'], 'type': 'MODEL'})
+        cache = validation_cache.ValidationCache()
+        cache.clear()
+        cache.store('Check', index, ('meshes',), (True, 'All ok!'))
+        validation_cache.register()
+        try:
+            self.assertEqual(get_face_counts([self.cube]), (6, 96))
+        finally:
+            validation_cache.unregister()
+        self.assertEqual(cache.get('Check', index, ('meshes',)), (True, 'All ok!'))
+        self.assertEqual(self.cache.get(self.cube, RENDER_FACE_COUNT_KEY), 96)
@@ -0,0 +1,138 @@
+"""Multipart upload tests, against a local stand-in for the storage."""
+import asyncio
+import hashlib
+import os
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from hana3d_dev.src.upload.multipart import (  # isort:skip
+    MultipartUpload,
+    get_resumable_upload_id,
+)
+
+PART_SIZE = 1024
+PART_COUNT = 4
+UPLOAD_ID = 'upload-1'
+
+
+class _Storage(object):
+    def __init__(self):
+        self.parts = {}
+        self.requests = []
+        self.failing_parts = set()
+        self.lock = threading.Lock()
+
+
+class _PartHandler(BaseHTTPRequestHandler):
+    storage: _Storage
+
+    def do_PUT(self):  # noqa: N802
+        part_number = int(self.path.rsplit('/', 1)[-1])
+        part_data = self.rfile.read(int(self.headers['Content-Length']))
+        with self.storage.lock:
+            self.storage.requests.append(part_number)
+            failing = part_number in self.storage.failing_parts
+            if not failing:
+                self.storage.parts[part_number] = part_data
+        if failing:
+            self.send_response(500)  # noqa: WPS432
+            self.end_headers()
+            return
+        self.send_response(200)  # noqa: WPS432
+        self.send_header('ETag', f'"{hashlib.md5(part_data).hexdigest()}"')  # noqa: S303
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass  # noqa: WPS420
+
+
+async def _send_once(function):
+    return await function()
+
+
+class MultipartUploadTest(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Start the storage and write the file to upload."""
+        self.storage = _Storage()
+        handler = type('Handler', (_PartHandler,), {'storage': self.storage})
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.state_dir = self.tmp_dir.name
+        self.file_path = os.path.join(self.tmp_dir.name, 'asset.blend')
+        self.file_data = os.urandom(PART_SIZE * (PART_COUNT - 1) + PART_SIZE // 2)
+        with open(self.file_path, 'wb') as asset_file:
+            asset_file.write(self.file_data)
+
+    def tearDown(self):
+        """Stop the storage and remove the files."""
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmp_dir.cleanup()
+
+    def test_upload(self):
+        """Test that every part is sent once and its ETag is returned."""
+        parts = self._upload(self._create_upload())
+        self.assertEqual(sorted(self.storage.requests), list(range(1, PART_COUNT + 1)))
+        uploaded = b''.join(self.storage.parts[number] for number in range(1, PART_COUNT + 1))
+        self.assertEqual(uploaded, self.file_data)
+        self.assertEqual(
+            [part['ETag'] for part in parts],
+            [hashlib.md5(self.storage.parts[part['PartNumber']]).hexdigest() for part in parts],  # noqa: S303,E501
+        )
+        self.assertIsNone(get_resumable_upload_id(self.file_path, self.state_dir))
+
+    def test_resume(self):
+        """Test that a failed upload keeps its state and resumes only the missing parts."""
+        self.storage.failing_parts.add(PART_COUNT)
+        with self.assertRaises(Exception):
+            self._upload(self._create_upload())
+        self.assertNotIn(PART_COUNT, self.storage.parts)
+        self.assertEqual(get_resumable_upload_id(self.file_path, self.state_dir), UPLOAD_ID)
+
+        self.storage.failing_parts.clear()
+        self.storage.requests.clear()
+        multipart_upload = self._create_upload()
+        missing = [part.part_number for part in multipart_upload.parts if part.etag is None]
+        self.assertIn(PART_COUNT, missing)
+        self._upload(multipart_upload)
+        self.assertEqual(sorted(self.storage.requests), missing)
+
+    def test_expired_upload(self):
+        """Test that the state of another multipart upload of the same file is not reused."""
+        self.storage.failing_parts.add(PART_COUNT)
+        with self.assertRaises(Exception):
+            self._upload(self._create_upload())
+        self.storage.failing_parts.clear()
+        self.storage.requests.clear()
+        multipart_upload = self._create_upload('upload-2')
+        self.assertEqual(multipart_upload.uploaded_bytes, 0)
+        self._upload(multipart_upload)
+        self.assertEqual(sorted(self.storage.requests), list(range(1, PART_COUNT + 1)))
+
+    def _create_upload(self, upload_id: str = UPLOAD_ID) -> MultipartUpload:
+        host, port = self.server.server_address
+        return MultipartUpload(
+            self.file_path,
+            upload_id,
+            [f'http://{host}:{port}/{upload_id}/{number}' for number in range(1, PART_COUNT + 1)],
+            self.state_dir,
+            part_size=PART_SIZE,
+        )
+
+    def _upload(self, multipart_upload: MultipartUpload) -> list:
+        # Parts cancelled after a failure may still be in flight, wait for them to end
+        executor = ThreadPoolExecutor()
+        loop = asyncio.new_event_loop()
+        loop.set_default_executor(executor)
+        try:
+            with mock.patch(f'{MultipartUpload.__module__}.retry_with_backoff', _send_once):
+                return loop.run_until_complete(multipart_upload.upload())
+        finally:
+            executor.shutdown(wait=True)
+            loop.close()
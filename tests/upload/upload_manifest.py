@@ -0,0 +1,43 @@
+"""Upload manifest tests."""
+import unittest
+import uuid
+from os.path import dirname, join
+
+import bpy
+
+from hana3d_dev.config import HANA3D_NAME  # isort:skip
+from hana3d_dev.src.upload.manifest import hash_asset_content  # isort:skip
+
+
+class HashAssetContent(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Load test scene."""
+        bpy.ops.wm.open_mainfile(filepath=join(dirname(__file__), '../scenes/01_cube.blend'))
+        self.export_data = {
+            'models': ['Cube'],
+            'type': 'MODEL',
+        }
+
+    def test_unchanged_asset(self):
+        """Test that hashing the same asset twice gives the same hash."""
+        self.assertEqual(
+            hash_asset_content(self.export_data),
+            hash_asset_content(self.export_data),
+        )
+
+    def test_metadata_edit(self):
+        """Test that editing tags, name and view_id does not change the hash."""
+        expected_hash = hash_asset_content(self.export_data)
+        props = getattr(bpy.data.objects['Cube'], HANA3D_NAME)
+        tag = props.tags_list.add()
+        tag.name = 'new_tag'
+        tag.selected = True
+        props.name = 'Renamed cube'
+        props.view_id = str(uuid.uuid4())
+        self.assertEqual(hash_asset_content(self.export_data), expected_hash)
+
+    def test_content_edit(self):
+        """Test that moving a vertex changes the hash."""
+        expected_hash = hash_asset_content(self.export_data)
+        bpy.data.objects['Cube'].data.vertices[0].co.x += 1
+        self.assertNotEqual(hash_asset_content(self.export_data), expected_hash)
@@ -0,0 +1,73 @@
+"""Batch validation command line tests."""
+import json
+import os
+import tempfile
+import unittest
+from os.path import dirname, join
+
+import bpy
+
+import hana3d_dev  # isort:skip
+from hana3d_dev.src.validators import batch_validate  # isort:skip
+
+ADDON_DIR = dirname(hana3d_dev.__file__)
+
+
+class BatchValidate(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Write a manifest with the test scenes."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.manifest_path = join(self.tmp_dir.name, 'manifest.json')
+        self.report_path = join(self.tmp_dir.name, 'report.json')
+        scenes_dir = join(dirname(__file__), '../scenes')
+        manifest = [
+            {'path': join(scenes_dir, '01_cube.blend'), 'type': 'model', 'models': ['Cube']},
+            {'path': join(scenes_dir, 'material_count.blend'), 'type': 'scene'},
+        ]
+        with open(self.manifest_path, 'w') as manifest_file:
+            json.dump(manifest, manifest_file)
+
+    def tearDown(self):
+        """Remove the manifest and reports."""
+        self.tmp_dir.cleanup()
+
+    def test_validate_files(self):
+        """Test that every file of the manifest is validated."""
+        batch_validate.main(self._get_args(ADDON_DIR))
+        report = self._read_report()
+        self.assertEqual(report['summary']['files'], 2)
+        self.assertEqual(report['summary']['crashed'], 0)
+        for file_result in report['files']:
+            self.assertTrue(file_result['validators'])
+
+    def test_addon_not_built(self):
+        """Test that an addon directory without a stage is refused."""
+        exit_code = batch_validate.main(self._get_args(join(self.tmp_dir.name, 'hana3d')))
+        self.assertEqual(exit_code, 1)
+        self.assertFalse(os.path.exists(self.report_path))
+
+    def test_worker_not_started(self):
+        """Test that all files fail at once when the addon can not be imported."""
+        exit_code = batch_validate.main(self._get_args(join(self.tmp_dir.name, 'hana3d_missing')))
+        report = self._read_report()
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(report['summary']['crashed'], 2)
+        for file_result in report['files']:
+            self.assertTrue(file_result['error'].startswith('Blender worker did not start'))
+
+    def _get_args(self, addon_dir: str) -> list:
+        return [
+            '--blender',
+            bpy.app.binary_path,
+            '--addon',
+            addon_dir,
+            '--workers',
+            '1',
+            '--json',
+            self.report_path,
+            self.manifest_path,
+        ]
+
+    def _read_report(self) -> dict:
+        with open(self.report_path, 'r') as report_file:
+            return json.load(report_file)
@@ -0,0 +1,122 @@
+"""Image header parser tests."""
+import io
+import os
+import struct
+import tempfile
+import unittest
+
+from hana3d_dev.src.textures.image_metadata import (
+    ImageMetadata,
+    get_file_metadata,
+    read_metadata,
+)
+
+PNG_RGBA = 6
+TIFF_SHORT = 3
+TIFF_LONG = 4
+
+
+def _png(width: int, height: int, color_type: int) -> bytes:
+    ihdr = struct.pack('>IIBBBBB', width, height, 8, color_type, 0, 0, 0)
+    return b'\x89PNG\r\n\x1a\n' + struct.pack('>I4s', len(ihdr), b'IHDR') + ihdr
+
+
+def _jpeg(width: int, height: int, channels: int) -> bytes:
+    app0 = b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+    sof = struct.pack('>BHHB', 8, height, width, channels)
+    return (
+        b'\xff\xd8'
+        + b'\xff\xe0' + struct.pack('>H', len(app0) + 2) + app0
+        + b'\xff\xff\xc0' + struct.pack('>H', len(sof) + 2) + sof
+    )
+
+
+def _exr_attribute(name: bytes, attribute_type: bytes, attribute_value: bytes) -> bytes:
+    return (
+        name + b'\x00' + attribute_type + b'\x00'
+        + struct.pack('<i', len(attribute_value)) + attribute_value
+    )
+
+
+def _exr(width: int, height: int, channel_names: str) -> bytes:
+    channel_list = b''.join(
+        channel_name.encode() + b'\x00' + struct.pack('<iB3xii', 1, 0, 1, 1)
+        for channel_name in channel_names
+    ) + b'\x00'
+    return (
+        b'\x76\x2f\x31\x01' + struct.pack('<I', 2)
+        + _exr_attribute(b'compression', b'compression', b'\x00')
+        + _exr_attribute(b'channels', b'chlist', channel_list)
+        + _exr_attribute(b'dataWindow', b'box2i', struct.pack('<iiii', 0, 0, width - 1, height - 1))
+        + b'\x00'
+    )
+
+
+def _tiff(width: int, height: int, channels: int, byte_order: str) -> bytes:
+    signature = b'II*\x00' if byte_order == '<' else b'MM\x00*'
+    entries = (
+        (256, TIFF_LONG, struct.pack(f'{byte_order}I', width)),
+        (257, TIFF_SHORT, struct.pack(f'{byte_order}H2x', height)),
+        (277, TIFF_SHORT, struct.pack(f'{byte_order}H2x', channels)),
+    )
+    ifd = struct.pack(f'{byte_order}H', len(entries)) + b''.join(
+        struct.pack(f'{byte_order}HHI', tag, field_type, 1) + tag_value
+        for tag, field_type, tag_value in entries
+    )
+    return signature + struct.pack(f'{byte_order}I', 8) + ifd + b'\x00' * 4
+
+
+def _tga(width: int, height: int, image_type: int, pixel_depth: int) -> bytes:
+    return struct.pack('<BBB5xHHHHBB', 0, 0, image_type, 0, 0, width, height, pixel_depth, 0)
+
+
+class TestImageMetadata(unittest.TestCase):  # noqa: D101
+    def test_png(self):
+        """Test PNG dimensions and channels from the IHDR chunk."""
+        metadata = read_metadata(io.BytesIO(_png(512, 256, PNG_RGBA)))
+        self.assertEqual(metadata, ImageMetadata(512, 256, 4, 'PNG'))
+
+    def test_jpeg(self):
+        """Test JPEG dimensions after an APP0 segment and a fill byte."""
+        metadata = read_metadata(io.BytesIO(_jpeg(1024, 768, 3)))
+        self.assertEqual(metadata, ImageMetadata(1024, 768, 3, 'JPEG'))
+
+    def test_exr(self):
+        """Test EXR dimensions from the dataWindow and channels from the channel list."""
+        metadata = read_metadata(io.BytesIO(_exr(2048, 1024, 'ABGR')))
+        self.assertEqual(metadata, ImageMetadata(2048, 1024, 4, 'OPEN_EXR'))
+
+    def test_tiff(self):
+        """Test TIFF dimensions in both byte orders."""
+        for byte_order in '<>':
+            with self.subTest(byte_order=byte_order):
+                metadata = read_metadata(io.BytesIO(_tiff(300, 200, 3, byte_order)))
+                self.assertEqual(metadata, ImageMetadata(300, 200, 3, 'TIFF'))
+
+    def test_tga(self):
+        """Test TGA, which is only recognized by its extension."""
+        header = _tga(64, 32, 2, 32)
+        self.assertIsNone(read_metadata(io.BytesIO(header)))
+        metadata = read_metadata(io.BytesIO(header), '.tga')
+        self.assertEqual(metadata, ImageMetadata(64, 32, 4, 'TARGA'))
+        metadata = read_metadata(io.BytesIO(_tga(64, 32, 3, 8)), '.tga')
+        self.assertEqual(metadata, ImageMetadata(64, 32, 1, 'TARGA'))
+
+    def test_truncated_header(self):
+        """Test that truncated headers are not supported instead of raising."""
+        for header in (_png(8, 8, PNG_RGBA), _jpeg(8, 8, 3), _exr(8, 8, 'RGB')):
+            with self.subTest(header=header[:4]):
+                self.assertIsNone(read_metadata(io.BytesIO(header[:len(header) // 2])))
+
+    def test_file_cache(self):
+        """Test that cached metadata is read again when the file changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, 'texture.png')
+            with open(filepath, 'wb') as image_file:
+                image_file.write(_png(16, 16, PNG_RGBA))
+            self.assertEqual(get_file_metadata(filepath), ImageMetadata(16, 16, 4, 'PNG'))
+            with open(filepath, 'wb') as image_file:
+                image_file.write(_png(32, 16, PNG_RGBA) + b'\x00')
+            self.assertEqual(get_file_metadata(filepath), ImageMetadata(32, 16, 4, 'PNG'))
+            os.remove(filepath)
+            self.assertIsNone(get_file_metadata(filepath))
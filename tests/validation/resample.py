@@ -0,0 +1,62 @@
+"""Texture resampler tests."""
+import unittest
+
+import numpy
+
+from hana3d_dev.src.textures.resample import get_target_size, resample
+
+# sRGB encoding of a linear 0.5
+SRGB_HALF = 0.735357
+
+
+def _pixels(rows: list) -> numpy.ndarray:
+    return numpy.array(rows, dtype=numpy.float32)
+
+
+class TestGetTargetSize(unittest.TestCase):  # noqa: D101
+    def test_power_of_two(self):
+        """Test that each axis is reduced to a power of two on its own."""
+        self.assertEqual(get_target_size(100, 60, 2048), (64, 32))
+        self.assertEqual(get_target_size(1024, 512, 2048), (1024, 512))
+
+    def test_max_size(self):
+        """Test that non-square images stay non-square under max_size."""
+        self.assertEqual(get_target_size(4096, 1024, 2048), (2048, 1024))
+        self.assertEqual(get_target_size(3000, 1500, 2048), (2048, 1024))
+
+
+class TestResample(unittest.TestCase):  # noqa: D101
+    def test_non_square(self):
+        """Test integer ratios that differ between axes."""
+        pixels = numpy.arange(32, dtype=numpy.float32).reshape(4, 8, 1)
+        resized = resample(pixels, 4, 1, srgb=False)
+        self.assertEqual(resized.shape, (1, 4, 1))
+        numpy.testing.assert_allclose(resized[0, :, 0], [12.5, 14.5, 16.5, 18.5])
+
+    def test_non_integer_ratio(self):
+        """Test that pixels cut by an output border are weighted by the covered fraction."""
+        resized = resample(_pixels([[[0], [1], [2]]]), 2, 1, srgb=False)
+        numpy.testing.assert_allclose(resized[0, :, 0], [1 / 3, 5 / 3], rtol=1e-6)
+
+        constant = numpy.full((5, 7, 3), 0.25, dtype=numpy.float32)
+        numpy.testing.assert_allclose(resample(constant, 4, 2, srgb=False), 0.25, rtol=1e-6)
+
+    def test_srgb(self):
+        """Test that sRGB colors round-trip and are averaged in linear space."""
+        constant = numpy.full((4, 4, 3), 0.5, dtype=numpy.float32)
+        numpy.testing.assert_allclose(resample(constant, 2, 2, srgb=True), 0.5, rtol=1e-5)
+
+        black_white = _pixels([[[0, 0, 0], [1, 1, 1]]])
+        resized = resample(black_white, 1, 1, srgb=True)
+        numpy.testing.assert_allclose(resized[0, 0], SRGB_HALF, rtol=1e-4)
+
+    def test_premultiplied_alpha(self):
+        """Test that transparent pixels do not bleed their color."""
+        pixels = _pixels([[[1, 0, 0, 1], [0, 1, 0, 0]]])
+        resized = resample(pixels, 1, 1, srgb=False)
+        numpy.testing.assert_allclose(resized[0, 0], [1, 0, 0, 0.5], atol=1e-6)
+
+        transparent = numpy.zeros((2, 2, 4), dtype=numpy.float32)
+        resized = resample(transparent, 1, 1, srgb=True)
+        self.assertFalse(numpy.isnan(resized).any())
+        numpy.testing.assert_allclose(resized, 0)
@@ -0,0 +1,48 @@
+"""Scene index tests."""
+import unittest
+from os.path import dirname, join
+
+import bpy
+
+from hana3d_dev.src.validators.scene_index import build_scene_index
+
+
+class TestBuildSceneIndex(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Load test scene with a textured material on the cube."""
+        bpy.ops.wm.open_mainfile(filepath=join(dirname(__file__), '../scenes/01_cube.blend'))
+        self.material = bpy.data.materials.new('Textured')
+        self.material.use_nodes = True
+        texture_node = self.material.node_tree.nodes.new('ShaderNodeTexImage')
+        texture_node.image = bpy.data.images.new('Texture', 8, 8)
+        cube = bpy.data.objects['Cube']
+        cube.data.materials.clear()
+        cube.data.materials.append(self.material)
+
+    def test_model(self):
+        """Test objects, materials and images of a model."""
+        index = build_scene_index('model', {'models': ['Cube'], 'type': 'MODEL'})
+        self.assertEqual(index.objects, ('Cube',))
+        self.assertEqual(index.meshes, ('Cube',))
+        self.assertEqual(index.armatures, ())
+        self.assertEqual(index.object_materials, ('Textured',))
+        self.assertEqual(index.materials, ('Textured',))
+        self.assertEqual(index.images, ('Texture',))
+
+    def test_material(self):
+        """Test that a material asset indexes its material and images, without objects."""
+        material = bpy.data.materials.new('Plain')
+        index = build_scene_index('material', {'material': 'Plain', 'type': 'MATERIAL'})
+        self.assertEqual(index.objects, ())
+        self.assertEqual(index.object_materials, ())
+        self.assertEqual(index.materials, (material.name,))
+        self.assertEqual(index.images, ())
+
+        index = build_scene_index('material', {'material': 'Textured', 'type': 'MATERIAL'})
+        self.assertEqual(index.materials, ('Textured',))
+        self.assertEqual(index.images, ('Texture',))
+
+    def test_material_without_name(self):
+        """Test that a material export without a material name is refused."""
+        with self.assertRaises(KeyError):
+            build_scene_index('material', {'type': 'MATERIAL'})
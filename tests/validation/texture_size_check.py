@@ -1,9 +1,12 @@
 """Texture size tests."""
+import asyncio
+import os
 import unittest
 from os.path import dirname, join
 
 import bpy
 
+from hana3d_dev.src.validators import FIX_RUNNING_MESSAGE
 from hana3d_dev.src.validators.textures_size import textures_size
 
 
@@ -68,8 +71,15 @@ class TestTextureSize(unittest.TestCase):  # noqa: D101
         test_result = textures_size.get_validation_result()
         self.assertTrue(test_result == expected_result)
 
-        # Run fix
+        # Run fix, file textures are resized in background workers
         expected_result = (True, 'All textures sizes are potency of 2 and below or equal to 2048!')
-        textures_size.run_fix(export_data)
+        fix_task = textures_size.run_fix(export_data)
+        self.assertEqual(textures_size.get_validation_result(), (False, FIX_RUNNING_MESSAGE))
+        asyncio.get_event_loop().run_until_complete(fix_task)
         test_result = textures_size.get_validation_result()
         self.assertTrue(test_result == expected_result)
+
+        # Remove the resized file written next to the original texture
+        resized_path = bpy.data.images['grass06  diffuse 4k.jpg'].filepath_from_user()
+        self.assertIn('_2048x', os.path.basename(resized_path))
+        os.remove(resized_path)
@@ -0,0 +1,32 @@
+"""Evaluated triangle count tests."""
+import unittest
+from os.path import dirname, join
+
+import bpy
+
+from hana3d_dev.src.validators.triangle_count import get_triangle_counts
+
+
+class TestGetTriangleCounts(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Load test scene."""
+        bpy.ops.wm.open_mainfile(filepath=join(dirname(__file__), '../scenes/01_cube.blend'))
+        self.cube = bpy.data.objects['Cube']
+
+    def test_names_iterable(self):
+        """Test counting from a list, a tuple and a generator of names."""
+        for object_names in (['Cube'], ('Cube',), (name for name in ['Cube'])):
+            with self.subTest(object_names=object_names):
+                self.assertEqual(get_triangle_counts(object_names), {'Cube': 12})
+
+    def test_modifiers(self):
+        """Test that triangles are counted with modifiers applied."""
+        modifier = self.cube.modifiers.new('Subdivision', 'SUBSURF')
+        modifier.levels = 1
+        self.assertEqual(get_triangle_counts(['Cube']), {'Cube': 48})
+
+    def test_shared_mesh(self):
+        """Test that objects sharing mesh data are counted once."""
+        linked = bpy.data.objects.new('Linked', self.cube.data)
+        bpy.context.scene.collection.objects.link(linked)
+        self.assertEqual(get_triangle_counts(['Cube', 'Linked']), {'Cube': 12})
@@ -0,0 +1,92 @@
+"""Validation cache tests."""
+import os
+import tempfile
+import unittest
+from os.path import dirname, join
+
+import bpy
+
+from hana3d_dev.src.validators.scene_index import SceneIndex, build_scene_index
+from hana3d_dev.src.validators.validation_cache import (
+    HANDLERS,
+    ValidationCache,
+    clear_cache,
+)
+
+RESULT = (True, 'All ok!')
+OBJECT_READS = ('meshes',)
+MATERIAL_READS = ('materials',)
+IMAGE_READS = ('images',)
+
+
+class TestValidationCache(unittest.TestCase):  # noqa: D101
+    def setUp(self):
+        """Load test scene and start from an empty cache."""
+        bpy.ops.wm.open_mainfile(filepath=join(dirname(__file__), '../scenes/01_cube.blend'))
+        self.cache = ValidationCache()
+        self.cache.clear()
+        self.index = build_scene_index('model', {'models': ['Cube'], 'type': 'MODEL'})
+
+    def test_hit(self):
+        """Test that a result is reused for the same datablocks."""
+        self.cache.store('Check', self.index, OBJECT_READS, RESULT)
+        index = build_scene_index('model', {'models': ['Cube'], 'type': 'MODEL'})
+        self.assertEqual(self.cache.get('Check', index, OBJECT_READS), RESULT)
+
+    def test_other_datablocks(self):
+        """Test that a result is not reused when the export set changes."""
+        self.cache.store('Check', self.index, OBJECT_READS, RESULT)
+        index = build_scene_index('model', {'models': [], 'type': 'MODEL'})
+        self.assertIsNone(self.cache.get('Check', index, OBJECT_READS))
+
+    def test_invalidate(self):
+        """Test that changes drop only the results that read the changed datablocks."""
+        self.cache.store('Check', self.index, OBJECT_READS, RESULT)
+        self.cache.store('Materials', self.index, MATERIAL_READS, RESULT)
+        self.cache.invalidate({('Mesh', bpy.data.objects['Cube'].data.name)})
+        self.assertIsNone(self.cache.get('Check', self.index, OBJECT_READS))
+        self.assertEqual(self.cache.get('Materials', self.index, MATERIAL_READS), RESULT)
+
+        self.cache.invalidate(set(), {'Material'})
+        self.assertIsNone(self.cache.get('Materials', self.index, MATERIAL_READS))
+
+    def test_frame_change(self):
+        """Test that a frame change drops all results."""
+        self.assertIn((bpy.app.handlers.frame_change_post, clear_cache), HANDLERS)
+        self.cache.store('Check', self.index, OBJECT_READS, RESULT)
+        clear_cache(bpy.context.scene)
+        self.assertIsNone(self.cache.get('Check', self.index, OBJECT_READS))
+
+    def test_outdated_result(self):
+        """Test that a result is not kept if its datablocks changed while it was computed."""
+        generation = self.cache.generation
+        self.cache.invalidate({('Object', 'Cube')})
+        self.cache.store('Check', self.index, OBJECT_READS, RESULT, since=generation)
+        self.assertIsNone(self.cache.get('Check', self.index, OBJECT_READS))
+
+        generation = self.cache.generation
+        self.cache.invalidate({('Material', 'Other')})
+        self.cache.store('Check', self.index, OBJECT_READS, RESULT, since=generation)
+        self.assertEqual(self.cache.get('Check', self.index, OBJECT_READS), RESULT)
+
+        generation = self.cache.generation
+        self.cache.clear()
+        self.cache.store('Check', self.index, OBJECT_READS, RESULT, since=generation)
+        self.assertIsNone(self.cache.get('Check', self.index, OBJECT_READS))
+
+    def test_image_file_edit(self):
+        """Test that a result is not reused after its image file is edited outside Blender."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            filepath = os.path.join(temp_dir, 'texture.png')
+            image = bpy.data.images.new('Texture', 4, 4)
+            image.filepath_raw = filepath
+            image.file_format = 'PNG'
+            image.save()
+            image.source = 'FILE'
+            index = SceneIndex(asset_type='model', export_data={}, images=(image.name,))
+            self.cache.store('Textures', index, IMAGE_READS, RESULT)
+            self.assertEqual(self.cache.get('Textures', index, IMAGE_READS), RESULT)
+
+            with open(filepath, 'ab') as image_file:
+                image_file.write(b'\x00')
+            self.assertIsNone(self.cache.get('Textures', index, IMAGE_READS))